@@ -0,0 +1,194 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Batch engine for replaying many recorded Ludo games. play_many spreads independent games across a
+# process pool. Games are shipped to the workers and back as packed bytes: one byte per turn on the way in and the
+# GameState seat bytes on the way out, instead of pickled lists of tuples.
+
+import os
+import struct
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from LudoGame import LudoGame, GameState, POSITIONS, SEAT_WIDTH, seat_letters
+
+# A packed turn is one byte: the rolling letter's index in POSITIONS (A = 0, whatever order the seats are in) in bits
+# 3-4 and the roll, 1 - 6, in bits 0-2
+ROLL_BITS = 3
+ROLL_MASK = (1 << ROLL_BITS) - 1
+_GAME_HEADER = struct.Struct('<BI')
+
+
+def pack_turn(player_letter, roll):
+    """Packs a ('A', 6) style turn into one byte, raises ValueError for a letter outside A-D or a roll outside 1-6"""
+    if player_letter not in POSITIONS or roll not in (1, 2, 3, 4, 5, 6):
+        raise ValueError("turn " + repr((player_letter, roll)) + " can't be packed into a byte")
+    return POSITIONS.index(player_letter) << ROLL_BITS | roll
+
+
+def unpack_turn(code):
+    """Unpacks a one byte turn into a (letter, roll) tuple"""
+    return POSITIONS[code >> ROLL_BITS], code & ROLL_MASK
+
+
+def pack_turns(turns_list):
+    """Packs a list of turn tuples into bytes, one byte per turn"""
+    return bytes(pack_turn(turn[0], turn[1]) for turn in turns_list)
+
+
+def unpack_turns(raw):
+    """Yields the (letter, roll) tuples packed into raw"""
+    for code in raw:
+        yield POSITIONS[code >> ROLL_BITS], code & ROLL_MASK
+
+
+def pack_game(players, turns_list):
+    """Packs one game: the seat count and turn count, the seat letters, then the packed turns"""
+    letters = seat_letters(players)
+    turns = pack_turns(turns_list)
+    return _GAME_HEADER.pack(len(letters), len(turns)) + letters.encode('ascii') + turns
+
+
+def iter_packed_games(blob):
+    """Yields (letters, packed turns) for each game in a blob of concatenated pack_game outputs"""
+    view = memoryview(blob)
+    offset = 0
+    while offset < len(view):
+        seat_count, turn_count = _GAME_HEADER.unpack_from(view, offset)
+        offset += _GAME_HEADER.size
+        letters = bytes(view[offset:offset + seat_count]).decode('ascii')
+        offset += seat_count
+        yield letters, view[offset:offset + turn_count]
+        offset += turn_count
+
+
+def play_packed(letters, turns):
+    """Plays one packed game and returns its final GameState"""
+    game = LudoGame()
+    game.set_players(letters)
+    for code in turns:
+        game.apply_turn(POSITIONS[code >> ROLL_BITS], code & ROLL_MASK)
+# Naming the final spaces can raise for a token pushed past the finishing square, the same as play_game
+    game.get_token_spaces()
+    return game.get_state()
+
+
+def _play_chunk(blob):
+    """
+    Worker entry point: plays every game packed into blob. Returns the seat bytes of every finished game concatenated
+    in order, plus a dict of game index -> exception for games that raised
+    """
+    out = bytearray()
+    errors = {}
+    for idx, (letters, turns) in enumerate(iter_packed_games(blob)):
+        try:
+            state = play_packed(letters, turns)
+        except Exception as error:
+            errors[idx] = error
+            out.extend(bytes(SEAT_WIDTH * len(letters)))
+            continue
+        out.extend(state.to_bytes()[len(letters):])
+    return bytes(out), errors
+
+
+def _play_unpacked(players, turns_list):
+    """Plays a game that can't be packed with play_game, returns its result or the exception it raised"""
+    try:
+        return LudoGame().play_game(players, turns_list)
+    except Exception as error:
+        return error
+
+
+def _chunks(games, chunksize):
+    """
+    Packs games into (seat letter strings, blob, local results) chunks of up to chunksize games. A game with a turn that
+    doesn't fit in a byte is played here instead, its result kept in local results by its index in the chunk and an
+    empty game packed in its place so the rest of the chunk keeps its order
+    """
+    letters_list = []
+    blob = bytearray()
+    local = {}
+    for players, turns_list in games:
+        try:
+            packed = pack_game(players, turns_list)
+        except ValueError:
+            local[len(letters_list)] = _play_unpacked(players, turns_list)
+            packed = pack_game(players, [])
+        letters_list.append(seat_letters(players))
+        blob.extend(packed)
+        if len(letters_list) == chunksize:
+            yield letters_list, bytes(blob), local
+            letters_list = []
+            blob = bytearray()
+            local = {}
+    if len(letters_list) != 0:
+        yield letters_list, bytes(blob), local
+
+
+def _decode_chunk(letters_list, out, errors, local, return_exceptions):
+    """Turns a worker's output and the chunk's local results back into one play_game style result per game"""
+    offset = 0
+    for idx, letters in enumerate(letters_list):
+        size = SEAT_WIDTH * len(letters)
+        if idx in local:
+            if isinstance(local[idx], Exception) and not return_exceptions:
+                raise local[idx]
+            yield local[idx]
+        elif idx in errors:
+            if not return_exceptions:
+                raise errors[idx]
+            yield errors[idx]
+        else:
+            yield GameState(letters, out[offset:offset + size]).get_token_spaces()
+        offset += size
+
+
+def play_many(games, workers=None, chunksize=256, ordered=True, return_exceptions=False):
+    """
+    Replays many independent games and yields (index, result) pairs, where result is what
+    LudoGame().play_game(players, turns_list) returns for that game
+    :param games: iterable of (players, turns_list) pairs, read lazily so it can be a generator over a large corpus
+    :param workers: number of worker processes, None for one per core and 0 to play in this process
+    :param chunksize: number of games packed into each task sent to a worker
+    :param ordered: if True results come back in input order, otherwise as each chunk finishes
+    :param return_exceptions: if True a game that raises yields its exception as the result instead of raising
+    """
+    chunks = _chunks(games, chunksize)
+    if workers == 0:
+        base = 0
+        for letters_list, blob, local in chunks:
+            out, errors = _play_chunk(blob)
+            for idx, result in enumerate(_decode_chunk(letters_list, out, errors, local, return_exceptions)):
+                yield base + idx, result
+            base += len(letters_list)
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+# Keeps a bounded window of chunks in flight so a huge input is never packed all at once
+        window = 2 * workers
+        pending = deque()
+        base = 0
+        for letters_list, blob, local in chunks:
+            pending.append((base, letters_list, local, pool.submit(_play_chunk, blob)))
+            base += len(letters_list)
+            if len(pending) >= window:
+                yield from _drain(pending, ordered, return_exceptions)
+        while len(pending) != 0:
+            yield from _drain(pending, ordered, return_exceptions)
+
+
+def _drain(pending, ordered, return_exceptions):
+    """Waits for one chunk (the oldest if ordered, else the first to finish) and yields its results"""
+    if ordered:
+        entry = pending.popleft()
+    else:
+        done, _ = wait([candidate[3] for candidate in pending], return_when=FIRST_COMPLETED)
+        entry = next(candidate for candidate in pending if candidate[3] in done)
+        pending.remove(entry)
+
+    base, letters_list, local, future = entry
+    out, errors = future.result()
+    for idx, result in enumerate(_decode_chunk(letters_list, out, errors, local, return_exceptions)):
+        yield base + idx, result
@@ -0,0 +1,307 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Benchmark suite for LudoGame. The ten TEST CASES from the bottom of LudoGame.py are checked as
+# regression fixtures first, then a set of synthetic workloads (2, 3 and 4 seats, short and very long games, kick
+# heavy and bounce heavy turn lists) is timed. The results (turns/sec, games/sec, p50/p99 per-turn latency and peak
+# memory per game) are saved as JSON so two runs can be compared, e.g.
+#     python LudoBenchmark.py --out after.json --compare before.json
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from LudoGame import BoardTopology, LudoGame, TurnHook
+
+# The TEST CASES block from LudoGame.py: (name, players, turns, expected play_game result, player checks). A player
+# check is (position, Player method, arguments, expected value) asked of the game after play_game, and the value must
+# match in type too, since the cases check get_completed with is
+FIXTURES = (
+    ('case_0', ['A', 'B'], [('A', 6), ('A', 4), ('A', 5), ('A', 4), ('B', 6), ('B', 4), ('B', 1), ('B', 2), ('A', 6),
+                            ('A', 4), ('A', 6), ('A', 3), ('A', 5), ('A', 1), ('A', 5), ('A', 4)],
+     ['28', '28', '21', 'H'],
+     (('A', 'get_completed', (), False), ('A', 'get_token_p_step_count', (), 28), ('B', 'get_space_name', (55,), 'B5'))),
+    ('case_1', ['A', 'B', 'C', 'D'], [('A', 6), ('A', 1), ('B', 6), ('B', 2), ('C', 6), ('C', 3), ('D', 6), ('D', 4)],
+     ['1', 'H', '16', 'H', '31', 'H', '46', 'H'], ()),
+    ('case_2', ['A', 'B'], [('B', 6), ('B', 4), ('B', 5), ('B', 4), ('B', 4), ('B', 3), ('B', 4), ('B', 5), ('B', 4),
+                            ('B', 4), ('B', 5), ('B', 4), ('B', 1), ('B', 4), ('B', 5), ('B', 5), ('B', 5)],
+     ['H', 'H', 'B6', 'H'], ()),
+    ('case_3', ['A', 'B'], [('A', 6), ('A', 3), ('A', 6), ('A', 3), ('A', 6), ('A', 5), ('A', 4), ('A', 6), ('A', 4)],
+     ['28', '28', 'H', 'H'], ()),
+    ('case_4', ['A', 'C'], [('A', 6), ('A', 4), ('A', 4), ('A', 4), ('A', 5), ('A', 6), ('A', 4), ('A', 6), ('A', 4),
+                            ('A', 6), ('A', 6), ('A', 6), ('A', 4), ('A', 6), ('A', 6), ('C', 6), ('C', 4)],
+     ['33', 'H', '32', 'H'], ()),
+    ('case_5', ['A', 'B'], [('A', 6), ('A', 4), ('A', 4), ('A', 4), ('A', 5), ('A', 6), ('A', 4), ('A', 6), ('A', 4),
+                            ('A', 6), ('A', 6), ('A', 4), ('A', 6), ('A', 4), ('A', 6), ('A', 6), ('A', 4), ('A', 6),
+                            ('A', 6), ('A', 4), ('A', 6), ('A', 6), ('A', 4), ('A', 6), ('A', 3), ('A', 6), ('B', 6),
+                            ('A', 6)],
+     ['E', 'E', 'R', 'H'],
+     (('A', 'get_completed', (), True),)),
+    ('case_6', ['A', 'B'], [('A', 6), ('A', 2), ('A', 2), ('A', 6), ('A', 4), ('A', 5), ('A', 4), ('A', 4), ('B', 6),
+                            ('B', 3), ('A', 6), ('A', 3)],
+     ['3', 'H', '17', 'H'], ()),
+    ('case_7', ['A', 'B'], [('A', 6), ('A', 4), ('A', 5), ('A', 4), ('A', 4), ('A', 4), ('A', 5), ('A', 4), ('A', 5),
+                            ('A', 5), ('A', 3), ('A', 5), ('A', 3), ('A', 6)],
+     ['A1', 'R', 'H', 'H'], ()),
+    ('case_8', ['A', 'B'], [('A', 6), ('A', 4), ('A', 5), ('A', 4), ('A', 4), ('A', 4), ('A', 5), ('A', 4), ('A', 5),
+                            ('A', 5), ('A', 3), ('A', 5), ('A', 5), ('A', 6), ('A', 5), ('A', 5), ('A', 3), ('B', 6),
+                            ('B', 3), ('A', 4)],
+     ['E', '13', '17', 'H'], ()),
+    ('case_9', ['A', 'B'], [('A', 6), ('A', 4), ('A', 4), ('A', 4), ('A', 6), ('A', 5), ('A', 3), ('B', 6), ('B', 2),
+                            ('A', 2), ('A', 4)],
+     ['16', '10', 'H', 'H'], ()),
+)
+
+# name -> (seat letters, number of games, turns per game, style). A style other than 'random' prefers the roll that
+# kicks an opponent home or bounces a token back off the finishing square whenever one does
+WORKLOADS = {
+    'seats2_short': ('AB', 2000, 20, 'random'),
+    'seats3_short': ('ABC', 2000, 20, 'random'),
+    'seats4_short': ('ABCD', 2000, 20, 'random'),
+    'seats2_long': ('AB', 20, 2000, 'random'),
+    'seats4_long': ('ABCD', 20, 2000, 'random'),
+    'kick_heavy': ('ABCD', 300, 200, 'kick'),
+    'bounce_heavy': ('AC', 300, 200, 'bounce'),
+}
+
+# Metrics where a higher value is better, every other metric is better lower
+HIGHER_IS_BETTER = ('turns_per_sec', 'games_per_sec')
+
+
+def check_fixtures():
+    """
+    Plays every fixture and returns a list of (name, expected, result) for the ones that don't match, a failed player
+    check named after the fixture and the method it calls
+    """
+    failures = []
+    for name, players, turns, expected, checks in FIXTURES:
+        game = LudoGame()
+        try:
+            result = game.play_game(players, turns)
+        except Exception as error:
+            result = repr(error)
+        if result != expected:
+            failures.append((name, expected, result))
+            continue
+        for letter, method, args, value in checks:
+            got = getattr(game.get_player_by_position(letter), method)(*args)
+            if type(got) != type(value) or got != value:
+                failures.append(('%s %s.%s' % (name, letter, method), value, got))
+    return failures
+
+
+class _PathRecorder(TurnHook):
+    """Keeps the MOVE_PATHS path of every token move reported since it was last cleared"""
+    def __init__(self):
+        self.paths = []
+
+    def on_move(self, game, player, token_name, before, after, path, kick, kick_token):
+        """Records the move's path, see TurnHook"""
+        self.paths.append(path)
+
+
+def generate_turns(letters, count, style='random', seed=0):
+    """
+    Returns a list of count turns for the seats in letters. Seats roll in order and a 6 earns one bonus roll. Rolls that
+    would make play_game raise are never chosen, so every workload plays to the end
+    :param style: 'random', 'kick' to prefer rolls that kick an opponent home, or 'bounce' to prefer rolls that bounce
+    a token back off the finishing square
+    """
+    rng = random.Random(seed)
+    game = LudoGame()
+    game.set_players(letters)
+    recorder = _PathRecorder()
+    game.set_hook(recorder)
+    state = game.get_state()
+    undo = []
+    turns = []
+    seat = 0
+    bonus = False
+    skipped = 0
+    while len(turns) < count and skipped < len(letters):
+        letter = letters[seat]
+        rolls = list(range(1, 7))
+        rng.shuffle(rolls)
+        chosen = None
+        for roll in rolls:
+            before = [state.get_steps(idx, token) for idx in range(len(letters)) for token in 'pq']
+            recorder.paths.clear()
+            try:
+                game.apply_turn(letter, roll, undo)
+            except Exception:
+                game.unmake(undo)
+                continue
+            after = [state.get_steps(idx, token) for idx in range(len(letters)) for token in 'pq']
+            game.unmake(undo)
+# A token pushed past the finishing square makes play_game raise when it names the final spaces
+            if max(after) > BoardTopology.finish_step:
+                continue
+            if chosen is None:
+                chosen = roll
+            if style == 'random':
+                break
+            if style == 'kick' and any(new == -1 < old for old, new in zip(before, after)):
+                chosen = roll
+                break
+            if style == 'bounce' and 'bounce' in recorder.paths:
+                chosen = roll
+                break
+
+        if chosen is None:
+            skipped += 1
+        else:
+            skipped = 0
+            game.apply_turn(letter, chosen)
+            turns.append((letter, chosen))
+        if chosen == 6 and not bonus:
+            bonus = True
+        else:
+            bonus = False
+            seat = (seat + 1) % len(letters)
+    return turns
+
+
+def _percentile(ordered, share):
+    """Returns the value at the given share (0 - 1) of a sorted list"""
+    if len(ordered) == 0:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+def run_workload(letters, games, repeat=3):
+    """
+    Times one workload and returns its metrics
+    :param letters: seat letters every game is played with
+    :param games: list of turn lists, one per game
+    :param repeat: number of timed passes, the fastest is reported
+    """
+    turn_count = sum(len(turns) for turns in games)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for turns in games:
+            LudoGame().play_game(letters, turns)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    latencies = []
+    clock = time.perf_counter_ns
+    for turns in games:
+        game = LudoGame()
+        game.set_players(letters)
+        for letter, roll in turns:
+            start = clock()
+            game.apply_turn(letter, roll)
+            latencies.append(clock() - start)
+    latencies.sort()
+
+    peak = 0
+    tracemalloc.start()
+    for turns in games[:50]:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        LudoGame().play_game(letters, turns)
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+
+    return {
+        'games': len(games),
+        'turns': turn_count,
+        'seconds': best,
+        'turns_per_sec': turn_count / best,
+        'games_per_sec': len(games) / best,
+        'p50_turn_us': _percentile(latencies, 0.5) / 1000,
+        'p99_turn_us': _percentile(latencies, 0.99) / 1000,
+        'peak_bytes_per_game': peak,
+    }
+
+
+def run_benchmarks(workloads=None, repeat=3, seed=0):
+    """
+    Checks the fixtures and runs the workloads, returns the results as a JSON ready dict
+    :param workloads: dict in the form of WORKLOADS, None for all of them
+    """
+    if workloads is None:
+        workloads = WORKLOADS
+    results = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'fixture_failures': [list(failure) for failure in check_fixtures()],
+        'workloads': {},
+    }
+    for name, (letters, game_count, turn_count, style) in workloads.items():
+        games = [generate_turns(letters, turn_count, style, seed + idx) for idx in range(game_count)]
+        results['workloads'][name] = run_workload(letters, games, repeat)
+    return results
+
+
+def save_results(results, path):
+    """Writes benchmark results to a JSON file"""
+    with open(path, 'w') as out:
+        json.dump(results, out, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    """Reads benchmark results written by save_results"""
+    with open(path) as raw:
+        return json.load(raw)
+
+
+def compare_results(baseline, current, tolerance=0.1):
+    """
+    Returns a list of (workload, metric, baseline value, current value) for every metric that got worse by more than
+    tolerance (a share, 0.1 is 10%). Workloads missing from either run are skipped
+    """
+    regressions = []
+    for name, metrics in current['workloads'].items():
+        old_metrics = baseline['workloads'].get(name)
+        if old_metrics is None:
+            continue
+        for metric in ('turns_per_sec', 'games_per_sec', 'p50_turn_us', 'p99_turn_us', 'peak_bytes_per_game'):
+            old = old_metrics[metric]
+            new = metrics[metric]
+            if metric in HIGHER_IS_BETTER:
+                worse = new < old * (1 - tolerance)
+            else:
+                worse = new > old * (1 + tolerance)
+            if worse:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def main(argv=None):
+    """Command line entry point, returns 1 if a fixture fails or a metric regresses against --compare"""
+    parser = argparse.ArgumentParser(description='Benchmark LudoGame.play_game')
+    parser.add_argument('--out', help='file to save the results to as JSON')
+    parser.add_argument('--compare', help='earlier results file to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='allowed slowdown as a share, default 0.1')
+    parser.add_argument('--repeat', type=int, default=3, help='timed passes per workload, the fastest is kept')
+    parser.add_argument('--only', nargs='*', help='names of the workloads to run, default all')
+    args = parser.parse_args(argv)
+
+    workloads = WORKLOADS if not args.only else {name: WORKLOADS[name] for name in args.only}
+    results = run_benchmarks(workloads, args.repeat)
+    for name, expected, result in results['fixture_failures']:
+        print("FAILED " + name + ": expected " + str(expected) + ", got " + str(result))
+    for name, metrics in results['workloads'].items():
+        print('%-14s %10.0f turns/s %9.0f games/s  p50 %6.1f us  p99 %6.1f us  peak %8d B/game' % (
+            name, metrics['turns_per_sec'], metrics['games_per_sec'], metrics['p50_turn_us'],
+            metrics['p99_turn_us'], metrics['peak_bytes_per_game']))
+    if args.out:
+        save_results(results, args.out)
+
+    status = 1 if results['fixture_failures'] else 0
+    if args.compare:
+        for name, metric, old, new in compare_results(load_results(args.compare), results, args.tolerance):
+            print('REGRESSION %s %s: %.6g -> %.6g' % (name, metric, old, new))
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Turn prefix cache for replaying many turn lists that share their openings. PrefixCache keeps a trie per
+# seat setup whose edges are chunks of packed turns and whose nodes hold the GameState reached after that prefix. A call
+# resumes from the deepest cached prefix and only plays the turns after it. The cache stays within a byte budget by
+# dropping the least recently used states.
+
+from collections import OrderedDict
+
+from LudoBatch import pack_turns
+from LudoGame import LudoGame, GameState, seat_letters
+
+# Rough size of a trie node without its state and edge bytes, used for the byte budget
+NODE_BYTES = 200
+
+
+class _Node:
+    """A trie node: the children keyed by their edge's packed turns and the seat bytes after the prefix, if cached"""
+    __slots__ = ('children', 'state', 'parent', 'edge')
+
+    def __init__(self, parent, edge):
+        self.children = {}
+        self.state = None
+        self.parent = parent
+        self.edge = edge
+
+
+class PrefixCache:
+    """
+    Replays turn lists like LudoGame.play_game, reusing the states reached by earlier calls with the same seats. Edges
+    are chunk turns long, so a state is cached every chunk turns along each turn list plus at its end
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024, chunk=16, policy='readme'):
+        """
+        :param max_bytes: byte budget for the trie, the least recently used states are dropped to stay within it
+        :param chunk: number of turns between cached states
+        :param policy: name of the registered TurnPolicy the games are played with
+        """
+        self._max_bytes = max_bytes
+        self._chunk = chunk
+        self._policy = policy
+        self._roots = {}
+        self._lru = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._calls = 0
+        self._turns_reused = 0
+        self._turns_played = 0
+
+    def get_size_bytes(self):
+        """Returns the estimated size of the trie in bytes"""
+        return self._bytes
+
+    def get_hits(self):
+        """Returns the number of calls that resumed from a cached prefix"""
+        return self._hits
+
+    def get_calls(self):
+        """Returns the number of calls made"""
+        return self._calls
+
+    def get_turns_reused(self):
+        """Returns the number of turns skipped by resuming from cached prefixes"""
+        return self._turns_reused
+
+    def get_turns_played(self):
+        """Returns the number of turns actually played"""
+        return self._turns_played
+
+    def clear(self):
+        """Drops every cached state"""
+        self._roots = {}
+        self._lru.clear()
+        self._bytes = 0
+
+    def play_game(self, players, turns_list):
+        """Returns what LudoGame().play_game(players, turns_list) returns, raising the same errors"""
+        return self.get_state(players, turns_list).get_token_spaces()
+
+    def get_state(self, players, turns_list):
+        """Returns the GameState reached by playing turns_list with the seats in players"""
+        self._calls += 1
+        turns_list = list(turns_list)
+        letters = seat_letters(players)
+        try:
+            packed = pack_turns(turns_list)
+        except ValueError:
+# A letter or roll that doesn't fit in a packed turn can't be cached, play it as is
+            game = LudoGame(policy=self._policy)
+            game.set_players(players)
+            for turn in turns_list:
+                game.apply_turn(turn[0], turn[1])
+            return game.get_state()
+
+        node, done = self._lookup(letters, packed)
+        if node.state is None:
+            game = LudoGame(policy=self._policy)
+            game.set_players(letters)
+        else:
+            game = LudoGame.from_state(GameState(letters, node.state), self._policy)
+        if done != 0:
+            self._hits += 1
+            self._turns_reused += done
+
+        chunk = self._chunk
+        for idx in range(done, len(turns_list)):
+            turn = turns_list[idx]
+            game.apply_turn(turn[0], turn[1])
+            self._turns_played += 1
+            if (idx + 1) % chunk == 0:
+                node = self._store(node, packed[idx + 1 - chunk:idx + 1], game.get_state())
+        tail = len(packed) % chunk
+        if tail != 0 and done < len(packed):
+            self._store(node, packed[len(packed) - tail:], game.get_state())
+        return game.get_state()
+
+    def _lookup(self, letters, packed):
+        """
+        Walks the trie for letters as far as packed allows, returns (node, turns) for the deepest node with a cached
+        state, or the root and 0 if none has one
+        """
+        root = self._roots.get(letters)
+        if root is None:
+            root = self._roots[letters] = _Node(None, letters)
+            self._bytes += NODE_BYTES
+        best = root
+        best_turns = 0
+        node = root
+        pos = 0
+        chunk = self._chunk
+        while pos < len(packed):
+            edge = packed[pos:pos + chunk]
+            child = node.children.get(edge)
+            if child is None:
+                break
+            node = child
+            pos += len(edge)
+            if node.state is not None:
+                best = node
+                best_turns = pos
+                self._lru.move_to_end(node)
+            if len(edge) < chunk:
+                break
+        return best, best_turns
+
+    def _store(self, node, edge, state):
+        """Caches state at the child of node along edge, creating it if needed, and returns the child"""
+        child = node.children.get(edge)
+        if child is None:
+            child = node.children[edge] = _Node(node, edge)
+            self._bytes += NODE_BYTES + len(edge)
+        if child.state is None:
+            child.state = state.to_bytes()[state.get_seat_count():]
+            self._bytes += len(child.state)
+        self._lru[child] = None
+        self._lru.move_to_end(child)
+
+        while self._bytes > self._max_bytes and len(self._lru) > 1:
+            victim = next(iter(self._lru))
+            if victim is child:
+                self._lru.move_to_end(victim)
+                victim = next(iter(self._lru))
+            self._evict(victim)
+        return child
+
+    def _evict(self, node):
+        """Drops a node's cached state, and the node itself and any ancestors left with nothing below them"""
+        del self._lru[node]
+        self._bytes -= len(node.state)
+        node.state = None
+        while node.parent is not None and len(node.children) == 0 and node.state is None:
+            del node.parent.children[node.edge]
+            self._bytes -= NODE_BYTES + len(node.edge)
+            node = node.parent
@@ -0,0 +1,185 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Seeded dice for Ludo simulations and a Monte Carlo win probability estimator. DiceStream generates
+# rolls in bulk and turns them into turns following the README: seats roll in order and a 6 earns one bonus roll (a 6
+# on the bonus roll earns nothing more). estimate_win_probabilities plays random continuations of a LudoGame on the
+# VectorLudo engine.
+
+from statistics import NormalDist
+
+import numpy as np
+
+from LudoVector import VectorLudo
+
+
+class DiceStream:
+    """Seeded source of die rolls, the same seed always gives the same rolls and turns"""
+    def __init__(self, seed=None):
+        """seed is anything numpy.random.default_rng accepts, None for a fresh random seed"""
+        self._rng = np.random.default_rng(seed)
+
+    def rolls(self, count):
+        """Returns an int8 array of count rolls, 1 - 6"""
+        return self._rng.integers(1, 7, size=count, dtype=np.int8)
+
+    def turns(self, letters, count, first=0):
+        """
+        Returns a list of count ('A', 6) style turns for the seats in letters, starting with seat index first. A seat
+        that rolls a 6 rolls once more before the next seat
+        """
+        out = []
+        seat = first
+        bonus = False
+        while len(out) < count:
+            for roll in self.rolls(count - len(out)).tolist():
+                out.append((letters[seat], roll))
+                if roll == 6 and not bonus:
+                    bonus = True
+                else:
+                    bonus = False
+                    seat = (seat + 1) % len(letters)
+        return out
+
+    def next_turns(self, seats, bonus, seat_count):
+        """
+        Rolls once for each of many games. seats and bonus are arrays of the seat due to roll in each game and whether
+        that roll is a bonus roll. Returns (seats, rolls, next seats, next bonus flags)
+        """
+        rolls = self.rolls(len(seats))
+        next_bonus = (rolls == 6) & ~bonus
+        next_seats = np.where(next_bonus, seats, (seats + 1) % seat_count)
+        return seats, rolls, next_seats, next_bonus
+
+    def turn_arrays(self, n_games, n_steps, seat_count, first=0):
+        """Returns (N, steps) arrays of seats and rolls for n_games independent games, ready for VectorLudo.play"""
+        seats = np.full(n_games, first, dtype=np.int8)
+        bonus = np.zeros(n_games, dtype=bool)
+        all_seats = np.empty((n_games, n_steps), dtype=np.int8)
+        all_rolls = np.empty((n_games, n_steps), dtype=np.int8)
+        for col in range(n_steps):
+            all_seats[:, col], all_rolls[:, col], seats, bonus = self.next_turns(seats, bonus, seat_count)
+        return all_seats, all_rolls
+
+
+class WinEstimate:
+    """Win probabilities with confidence intervals from a run of estimate_win_probabilities"""
+    def __init__(self, letters, wins, errors, unfinished, games, confidence):
+        """
+        wins is a list of win counts in seat order, errors counts continuations with a turn that raised and was rolled
+        back, unfinished those that ran out of turns
+        """
+        self._letters = letters
+        self._wins = wins
+        self._errors = errors
+        self._unfinished = unfinished
+        self._games = games
+        self._confidence = confidence
+
+    def get_games(self):
+        """Returns the number of continuations played"""
+        return self._games
+
+    def get_probability(self, letter):
+        """Returns the estimated probability that the player at letter finishes first"""
+        if self._games == 0:
+            return 0.0
+        return self._wins[self._letters.index(letter)] / self._games
+
+    def get_interval(self, letter):
+        """Returns the (low, high) Wilson score interval for the player at letter"""
+        return wilson_interval(self._wins[self._letters.index(letter)], self._games, self._confidence)
+
+    def get_error_rate(self):
+        """Returns the share of continuations with a turn that hit a case where apply_turn raises and was rolled back"""
+        return self._errors / max(self._games, 1)
+
+    def get_unfinished_rate(self):
+        """Returns the share of continuations with no winner within the turn limit"""
+        return self._unfinished / max(self._games, 1)
+
+    def get_max_half_width(self):
+        """Returns the widest confidence interval half width over the seats"""
+        widths = [wilson_interval(wins, self._games, self._confidence) for wins in self._wins]
+        return max((high - low) / 2 for low, high in widths)
+
+    def as_dict(self):
+        """Returns {letter: (probability, low, high)} for every seat"""
+        return {letter: (self.get_probability(letter),) + self.get_interval(letter) for letter in self._letters}
+
+
+def wilson_interval(successes, trials, confidence=0.95):
+    """Returns the (low, high) Wilson score interval for a binomial proportion"""
+    if trials == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    share = successes / trials
+    denom = 1 + z * z / trials
+    center = (share + z * z / (2 * trials)) / denom
+    half = z * ((share * (1 - share) + z * z / (4 * trials)) / trials) ** 0.5 / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def estimate_win_probabilities(game, next_letter=None, max_games=100000, batch=5000, max_turns=2000,
+                               confidence=0.95, tolerance=0.005, seed=None):
+    """
+    Plays random continuations of a game and estimates each seat's probability of being the next player to finish.
+    Seats take turns in seat order starting from next_letter (default the first seat), with the README bonus roll.
+    Continuations run in batches of batch games and stop early once every interval half width is within tolerance
+    :param game: LudoGame whose current state the continuations start from
+    :param next_letter: position of the player who rolls next
+    :param max_games: most continuations to play
+    :param max_turns: turns after which a continuation with no winner counts as unfinished
+    :param seed: seed for the DiceStream, the same seed gives the same estimate
+    """
+    state = game.get_state()
+    letters = state.get_letters()
+    first = 0 if next_letter is None else letters.index(next_letter)
+    dice = DiceStream(seed)
+    wins = [0] * len(letters)
+    errors = 0
+    unfinished = 0
+    played = 0
+    estimate = WinEstimate(letters, wins, errors, unfinished, played, confidence)
+
+    while played < max_games:
+        size = min(batch, max_games - played)
+        batch_wins, batch_errors, batch_unfinished = _play_continuations(state, first, size, max_turns, dice)
+        wins = [total + new for total, new in zip(wins, batch_wins)]
+        errors += batch_errors
+        unfinished += batch_unfinished
+        played += size
+        estimate = WinEstimate(letters, wins, errors, unfinished, played, confidence)
+        if estimate.get_max_half_width() <= tolerance:
+            break
+    return estimate
+
+
+def _play_continuations(state, first, size, max_turns, dice):
+    """
+    Plays size continuations of state, returns (wins per seat, errors, unfinished). A turn that raises is rolled back
+    and the continuation goes on, the same as a table in LudoServer, errors counts the continuations that had one
+    """
+    seat_count = state.get_seat_count()
+    vector = VectorLudo.from_state(state, size)
+    done_at_start = vector.get_done().copy()
+    winner = np.full(size, -1, dtype=np.intp)
+    seats = np.full(size, first, dtype=np.int8)
+    bonus = np.zeros(size, dtype=bool)
+    raised = np.zeros(size, dtype=bool)
+    rows = np.arange(size)
+
+    for _ in range(max_turns):
+        playing = winner < 0
+        if not np.any(playing):
+            break
+        rolling, rolls, seats, bonus = dice.next_turns(seats, bonus, seat_count)
+        raised |= vector.step(np.where(playing, rolling, -1), rolls, rollback=True)
+# Only the rolling seat can finish on a turn
+        finished = playing & vector.get_done()[rows, rolling] & ~done_at_start[rows, rolling]
+        winner[finished] = rolling[finished]
+
+    wins = np.bincount(winner[winner >= 0], minlength=seat_count).tolist()
+    errors = int(np.count_nonzero(raised))
+    unfinished = size - sum(wins)
+    return wins, errors, unfinished
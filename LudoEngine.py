@@ -0,0 +1,246 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Ludo engine for any number of tokens per player and any board size. BoardConfig derives the track
+# geometry (seat starts, the last main track step, the home squares and the finishing step) from a few numbers, and
+# LudoEngine keeps every token's steps in one flat array, so the rules loop over a player's tokens instead of repeating
+# code per token. LudoGame itself is not generalized: its GameState, Player, move_token and policy ACTIONS are still
+# written for exactly two tokens, p and q. The CLASSIC preset hands its turns to an unchanged LudoGame, so its results
+# are identical to play_game, and the per-token code here never plays the classic rules with their quirks.
+
+from LudoGame import LudoGame, BoardTopology
+
+SEAT_LETTERS = 'ABCDEFGH'
+TOKEN_LETTERS = 'pqrstuvwxy'
+
+
+class BoardConfig:
+    """
+    Geometry and token count of a Ludo variant. The seats' start squares are spread evenly around a track of
+    track_length squares, a token turns into its home_squares after board_steps steps on the main track and the
+    finishing square is the step after the home squares
+    """
+    def __init__(self, tokens=2, seats=4, track_length=56, board_steps=50, home_squares=6, legacy=False):
+        """
+        :param tokens: tokens per player, 1 - 10
+        :param seats: number of positions on the board, 2 - 8, lettered from A
+        :param legacy: True to play with LudoGame and the README priority rules exactly as play_game does, only for
+        the standard two token board
+        """
+        if not 1 <= tokens <= len(TOKEN_LETTERS):
+            raise ValueError("tokens must be 1 - " + str(len(TOKEN_LETTERS)))
+        if not 2 <= seats <= len(SEAT_LETTERS):
+            raise ValueError("seats must be 2 - " + str(len(SEAT_LETTERS)))
+        if not 1 <= board_steps <= track_length or home_squares < 0:
+            raise ValueError("board_steps must be 1 - track_length and home_squares can't be negative")
+        if board_steps + home_squares + 2 > 255:
+            raise ValueError("a token's steps must fit in a byte")
+        if legacy and (tokens, seats, track_length, board_steps, home_squares) != (2, 4, 56, 50, 6):
+            raise ValueError("the legacy rules only play the standard two token board")
+
+        self._tokens = tokens
+        self._track_length = track_length
+        self._board_steps = board_steps
+        self._finish = board_steps + home_squares + 1
+        self._legacy = legacy
+        self._topologies = {}
+        for idx, letter in enumerate(SEAT_LETTERS[:seats]):
+            start = 1 + idx * track_length // seats
+            end = (start + board_steps - 2) % track_length + 1
+            self._topologies[letter] = BoardTopology(letter, start, end, track_length, board_steps, self._finish)
+
+    def get_token_count(self):
+        """Returns the number of tokens per player"""
+        return self._tokens
+
+    def get_token_names(self):
+        """Returns the token names in order, 'p', 'q', ..."""
+        return TOKEN_LETTERS[:self._tokens]
+
+    def get_positions(self):
+        """Returns the seat letters of the board in order"""
+        return tuple(self._topologies)
+
+    def get_track_length(self):
+        """Returns the number of squares on the main track"""
+        return self._track_length
+
+    def get_last_board_step(self):
+        """Returns the last step a token takes on the main track"""
+        return self._board_steps
+
+    def get_finish_step(self):
+        """Returns the step of the finishing square"""
+        return self._finish
+
+    def get_topology(self, letter):
+        """Returns the BoardTopology for a seat letter"""
+        return self._topologies[letter]
+
+    def is_legacy(self):
+        """Returns True if games are played by LudoGame with the README priority rules"""
+        return self._legacy
+
+
+# The two token game from the README, played exactly as LudoGame.play_game plays it
+CLASSIC = BoardConfig(legacy=True)
+# Four tokens per player on the standard board
+STANDARD = BoardConfig(tokens=4)
+
+
+class LudoEngine:
+    """
+    Plays a game on any BoardConfig. Each turn follows the README priorities, applied over all of the player's tokens:
+    leave the home yard on a 6, finish if a token can land exactly on the finishing square, kick an opponent, otherwise
+    move the token furthest from finishing. Tokens sharing a space past the ready to go position move together, a token
+    overshooting the finishing square bounces back, and a player is done when every token has finished
+    """
+    def __init__(self, config=CLASSIC):
+        self._config = config
+        self._letters = ''
+        self._steps = bytearray()
+        self._done = bytearray()
+        self._game = LudoGame() if config.is_legacy() else None
+
+    def get_config(self):
+        """Returns the BoardConfig the game is played on"""
+        return self._config
+
+    def get_letters(self):
+        """Returns the seat letters, in seat order"""
+        if self._game is not None:
+            return self._game.get_state().get_letters()
+        return self._letters
+
+    def set_players(self, players):
+        """Sets up a seat for each position in players, in order, stopping at the first one the board doesn't have"""
+        if self._game is not None:
+            self._game.set_players(players)
+            return
+        if self._letters != '':
+            return
+        for letter in players:
+            if letter not in self._config.get_positions():
+                break
+            self._letters += letter
+        count = self._config.get_token_count()
+        self._steps = bytearray(len(self._letters) * count)
+        self._done = bytearray(len(self._letters))
+
+    def get_steps(self, letter, token):
+        """Returns the steps of a token, given by name ('p', 'q', ...) or index, for the first seat at letter"""
+        names = self._config.get_token_names()
+        idx = names.index(token) if type(token) == str else token
+        seat = self.get_letters().index(letter)
+        if self._game is not None:
+            return self._game.get_state().get_steps(seat, names[idx])
+        return self._steps[seat * len(names) + idx] - 1
+
+    def set_steps(self, letter, token, steps):
+        """
+        Puts a token, given by name or index, at the given steps for the first seat at letter, e.g. to set up a
+        position. Raises ValueError for a legacy game, whose tokens also carry LudoGame's position markers
+        """
+        if self._game is not None:
+            raise ValueError("legacy games can only be set up with LudoGame.from_state")
+        names = self._config.get_token_names()
+        idx = names.index(token) if type(token) == str else token
+        seat = self._letters.index(letter)
+        self._steps[seat * len(names) + idx] = steps + 1
+
+    def is_done(self, letter):
+        """Returns True if the player at letter has finished the game"""
+        seat = self.get_letters().index(letter)
+        if self._game is not None:
+            return self._game.get_state().is_done(seat)
+        return self._done[seat] == 1
+
+    def get_token_spaces(self):
+        """Returns the space names of every player's tokens, in seat order"""
+        if self._game is not None:
+            return self._game.get_token_spaces()
+        count = self._config.get_token_count()
+        spaces = []
+        for seat, letter in enumerate(self._letters):
+            topology = self._config.get_topology(letter)
+            for idx in range(seat * count, (seat + 1) * count):
+                spaces.append(topology.space_name(self._steps[idx] - 1))
+        return spaces
+
+    def apply_turn(self, player_letter, roll):
+        """Plays one roll for the player at player_letter"""
+        if self._game is not None:
+            self._game.apply_turn(player_letter, roll)
+            return
+        seat = self._letters.index(player_letter)
+        if self._done[seat]:
+            return
+        config = self._config
+        count = config.get_token_count()
+        finish = config.get_finish_step()
+        last_board = config.get_last_board_step()
+        topology = config.get_topology(player_letter)
+        steps = self._steps
+        base = seat * count
+
+# Works out each token's move once: (token index, steps after the move), yard tokens need a 6
+        moves = []
+        for idx in range(base, base + count):
+            cur = steps[idx] - 1
+            if cur == -1:
+                if roll == 6:
+                    moves.append((idx, 0))
+            elif cur < finish:
+                new = cur + roll
+                moves.append((idx, 2 * finish - new if new > finish else new))
+        if len(moves) == 0:
+            return
+
+        # Priority 1: move token out of home yard
+        chosen = next((move for move in moves if move[1] == 0), None)
+        # Priority 2: move token to end space if possible
+        if chosen is None:
+            chosen = next((move for move in moves if move[1] == finish), None)
+        # Priority 3: If an opponent's token can be kicked back to their home base, do it
+        if chosen is None:
+            for move in moves:
+                if 0 < move[1] <= last_board and len(self._opponents_at(seat, topology.square(move[1]))) != 0:
+                    chosen = move
+                    break
+        # Priority 4: Move the token furthest from the finishing square
+        if chosen is None:
+            chosen = min(moves, key=lambda move: steps[move[0]])
+
+        idx, new = chosen
+        cur = steps[idx] - 1
+# Tokens stacked on the moving token's space move with it
+        group = [idx] if cur <= 0 else [other for other in range(base, base + count) if steps[other] == cur + 1]
+        for token in group:
+            steps[token] = new + 1
+        if 0 < new <= last_board:
+            for opp in self._opponents_at(seat, topology.square(new)):
+                steps[opp] = 0
+        if all(steps[token] == finish + 1 for token in range(base, base + count)):
+            self._done[seat] = 1
+
+    def _opponents_at(self, seat, square):
+        """Returns the array indexes of the other seats' tokens on a main track square"""
+        count = self._config.get_token_count()
+        found = []
+        for opp, letter in enumerate(self._letters):
+            if opp == seat:
+                continue
+            topology = self._config.get_topology(letter)
+            for idx in range(opp * count, (opp + 1) * count):
+                if topology.square(self._steps[idx] - 1) == square:
+                    found.append(idx)
+        return found
+
+    def play_game(self, players, turns_list):
+        """Sets up the seats, plays every turn and returns the space names of all tokens, like LudoGame.play_game"""
+        if self._game is not None:
+            return self._game.play_game(players, turns_list)
+        self.set_players(players)
+        for turn in turns_list:
+            self.apply_turn(turn[0], turn[1])
+        return self.get_token_spaces()
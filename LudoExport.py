@@ -0,0 +1,182 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Streaming export of per-turn training rows. Games are played one at a time and every turn becomes a
+# fixed-width row of ROW_DTYPE: the seats, the token steps before the turn, who rolled what, which token moved, how
+# many opponent tokens were kicked, whether a token bounced, and the game's outcome. Rows are packed with struct into
+# a buffer of chunk_rows rows and appended to a .npy file whose header is rewritten with the row count on close, so
+# memory stays at one chunk plus one game whatever the corpus size. np.load(path, mmap_mode='r') maps the result.
+
+import struct
+import sys
+
+import numpy as np
+
+from LudoGame import LudoGame, POSITIONS, TurnHook, seat_letters
+
+MAX_SEATS = len(POSITIONS)
+# token: -1 nothing moved, 0 p, 1 q, 2 both (a stacked pair), as reported by move_token, so a token that bounces back
+# onto the space it started from still counts as moved. seat is NO_SEAT for a turn whose letter has no seat. Empty seat
+# slots have position -1 and steps -2, winner is the position index (A = 0) of the first player to finish, -1 if nobody
+# finished
+ROW_DTYPE = np.dtype([
+    ('game', '<u8'),
+    ('turn', '<u4'),
+    ('positions', 'i1', (MAX_SEATS,)),
+    ('seat', 'u1'),
+    ('roll', 'u1'),
+    ('steps', 'i1', (MAX_SEATS, 2)),
+    ('token', 'i1'),
+    ('kicks', 'u1'),
+    ('bounce', '?'),
+    ('error', '?'),
+    ('winner', 'i1'),
+    ('mover_won', '?'),
+])
+_ROW = struct.Struct('<QI%dbBB%dbbB??b?' % (MAX_SEATS, 2 * MAX_SEATS))
+NO_SEAT_STEPS = -2
+NO_SEAT = 255
+TOKEN_NONE, TOKEN_P, TOKEN_Q, TOKEN_BOTH = -1, 0, 1, 2
+_MAGIC = b'\x93NUMPY\x01\x00'
+
+
+def _header_text(rows):
+    """Returns the .npy header dict for rows rows of ROW_DTYPE"""
+    return "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (np.lib.format.dtype_to_descr(ROW_DTYPE), rows)
+
+
+def _npy_header(rows, size=None):
+    """
+    Returns a version 1.0 .npy header for rows rows of ROW_DTYPE, padded with spaces to size bytes. With size None it
+    is padded to fit any row count, so the header can be rewritten in place once the count is known
+    """
+    if size is None:
+        size = (len(_MAGIC) + 2 + len(_header_text(2 ** 64 - 1)) + 1 + 63) // 64 * 64
+    text = _header_text(rows).ljust(size - len(_MAGIC) - 3) + '\n'
+    return _MAGIC + struct.pack('<H', len(text)) + text.encode('latin1')
+
+
+class _MoveRecorder(TurnHook):
+    """Keeps the token moves of a turn as move_token reports them: (token name, MOVE_PATHS path) pairs"""
+    def __init__(self):
+        self.moves = []
+
+    def on_move(self, game, player, token_name, before, after, path, kick, kick_token):
+        """Records a move, see TurnHook"""
+        self.moves.append((token_name, path))
+
+
+class TurnExporter:
+    """Writes turn rows to a .npy file chunk by chunk, use as a context manager or call close when done"""
+    def __init__(self, path, chunk_rows=65536):
+        """
+        :param path: .npy file to write
+        :param chunk_rows: rows buffered before each write
+        """
+        self._file = open(path, 'wb')
+        self._header_size = len(_npy_header(0))
+        self._file.write(_npy_header(0))
+        self._chunk_bytes = chunk_rows * _ROW.size
+        self._buffer = bytearray()
+        self._rows = 0
+        self._games = 0
+
+    def get_row_count(self):
+        """Returns the number of rows written so far"""
+        return self._rows
+
+    def get_game_count(self):
+        """Returns the number of games added so far"""
+        return self._games
+
+    def add_game(self, players, turns_list):
+        """
+        Plays a game like play_game and adds a row for each turn. A turn that raises gets a row with error set and ends
+        the game, the same as record_game. Returns the number of rows added
+        """
+        letters = seat_letters(players)
+        game = LudoGame()
+        game.set_players(players)
+        recorder = _MoveRecorder()
+        game.set_hook(recorder)
+        state = game.get_state()
+        seat_count = state.get_seat_count()
+        positions = [POSITIONS.index(letter) for letter in letters] + [-1] * (MAX_SEATS - seat_count)
+        padding = [NO_SEAT_STEPS] * (2 * (MAX_SEATS - seat_count))
+        undo = []
+        rows = []
+        winner = -1
+        before = [state.get_steps(seat, token) for seat in range(seat_count) for token in 'pq']
+        for idx, (letter, roll) in enumerate(turns_list):
+            seat = letters.find(letter)
+            recorder.moves.clear()
+            try:
+                game.apply_turn(letter, roll, undo)
+            except Exception:
+                game.unmake(undo)
+                rows.append((idx, seat, roll, before, TOKEN_NONE, 0, False, True))
+                break
+            undo.clear()
+            after = [state.get_steps(other, token) for other in range(seat_count) for token in 'pq']
+            moved = {token_name for token_name, _ in recorder.moves}
+            token = TOKEN_BOTH if len(moved) == 2 else TOKEN_P if 'p' in moved else \
+                TOKEN_Q if 'q' in moved else TOKEN_NONE
+            kicks = sum(1 for other, (old, new) in enumerate(zip(before, after))
+                        if other // 2 != seat and new == -1 < old)
+            bounce = any(path == 'bounce' for _, path in recorder.moves)
+            rows.append((idx, seat, roll, before, token, kicks, bounce, False))
+            if winner == -1 and state.is_done(seat):
+                winner = positions[seat]
+            before = after
+
+        game_id = self._games
+        for idx, seat, roll, steps, token, kicks, bounce, error in rows:
+            self._buffer += _ROW.pack(game_id, idx, *positions, NO_SEAT if seat < 0 else seat, roll, *steps, *padding,
+                                      token, kicks, bounce, error, winner, seat >= 0 and positions[seat] == winner)
+        self._games += 1
+        self._rows += len(rows)
+        if len(self._buffer) >= self._chunk_bytes:
+            self._flush()
+        return len(rows)
+
+    def _flush(self):
+        """Writes the buffered rows out"""
+        self._file.write(self._buffer)
+        self._buffer = bytearray()
+
+    def close(self):
+        """Writes the last rows and the final row count into the header, then closes the file"""
+        if self._file.closed:
+            return
+        self._flush()
+        self._file.seek(0)
+        self._file.write(_npy_header(self._rows, self._header_size))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def export_games(games, path, chunk_rows=65536):
+    """
+    Exports an iterable of (players, turns_list) games, e.g. read_replay from LudoReplay, to a .npy file of turn rows.
+    The games are read lazily. Returns the number of rows written
+    """
+    with TurnExporter(path, chunk_rows) as exporter:
+        for players, turns_list in games:
+            exporter.add_game(players, turns_list)
+        return exporter.get_row_count()
+
+
+def load_rows(path):
+    """Returns the rows of an exported file as a read-only memory-mapped ROW_DTYPE array"""
+    return np.load(path, mmap_mode='r')
+
+
+if __name__ == '__main__':
+# python LudoExport.py games.ludr rows.npy exports every game in a replay file
+    from LudoReplay import read_replay
+    print('%d rows' % export_games(read_replay(sys.argv[1]), sys.argv[2]))
@@ -0,0 +1,323 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Differential fuzzer for the Ludo engines. Random legal turn lists (seats roll in order, a 6 earns one
+# bonus roll) are played by the reference, the frozen original play_game in LudoReference one turn at a time, and by
+# every engine: LudoGame.apply_turn, VectorLudo, the cached PrefixCache, the recorded GameHistory and play_many. The
+# token steps and done flags are compared after every turn, along with the turn and exception type of any turn that
+# raises. A game where an engine disagrees is shrunk to a minimal turn list that still shows the difference. Batches
+# run in a process pool, each one seeded by its number so any batch can be rerun on its own.
+# Run python LudoFuzz.py --games 100000, add --engines vector cache to pick engines
+
+import argparse
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import LudoReference
+from LudoBatch import play_many
+from LudoCache import PrefixCache
+from LudoGame import BoardTopology, LudoGame, POSITIONS
+from LudoHistory import record_game
+from LudoVector import ERROR_TYPES, NO_ERROR, VectorLudo
+
+FINISH_STEP = BoardTopology.finish_step
+
+
+# A trace is (observations, error): the (token steps, done flags) tuple after each turn that was played, and None or
+# (turn index, exception type name) for the turn the game stopped on. A token pushed past the finishing square counts
+# as an IndexError on that turn, since play_game raises one when it names the final spaces
+def _observe(state):
+    """Returns the (token steps, done flags) observation of a GameState"""
+    seats = range(state.get_seat_count())
+    return (tuple(state.get_steps(seat, token) for seat in seats for token in 'pq'),
+            tuple(state.is_done(seat) for seat in seats))
+
+
+def _over_finish(observation):
+    """Returns True if a token in the observation is past the finishing square"""
+    return max(observation[0]) > FINISH_STEP
+
+
+def trace_reference(letters, turns):
+    """
+    Plays turns with the frozen original play_game, one call per turn, and returns the reference trace. Its play_game
+    names every token after each call, so a token past the finishing square raises IndexError on that turn by itself
+    """
+    game = LudoReference.LudoGame()
+    game.play_game(list(letters), [])
+    players = [game.get_player_by_position(letter) for letter in letters]
+    observations = []
+    for idx, turn in enumerate(turns):
+        try:
+            game.play_game([], [turn])
+        except Exception as error:
+            return observations, (idx, type(error).__name__)
+        observations.append((tuple(step for player in players for step in (player.get_token_p_step_count(),
+                                                                           player.get_token_q_step_count())),
+                             tuple(player.get_completed() for player in players)))
+    return observations, None
+
+
+def trace_ludogame(letters, turns):
+    """Trace of LudoGame.apply_turn, one turn at a time"""
+    game = LudoGame()
+    game.set_players(list(letters))
+    observations = []
+    for idx, turn in enumerate(turns):
+        try:
+            game.apply_turn(turn[0], turn[1])
+        except Exception as error:
+            return observations, (idx, type(error).__name__)
+        observation = _observe(game.get_state())
+        if _over_finish(observation):
+            return observations, (idx, 'IndexError')
+        observations.append(observation)
+    return observations, None
+
+
+def trace_history(letters, turns):
+    """Trace read back from a GameHistory with state_at after each turn"""
+    history = record_game(list(letters), turns, checkpoint=8)
+    observations = []
+    for idx in range(history.get_turn_count()):
+        observation = _observe(history.state_at(idx + 1))
+        if _over_finish(observation):
+            return observations, (idx, 'IndexError')
+        observations.append(observation)
+    error = history.get_error()
+    if error is not None:
+        return observations, (error[0], type(error[1]).__name__)
+    return observations, None
+
+
+def trace_cache(letters, turns, cache=None):
+    """Trace from PrefixCache.get_state on every prefix of turns, so each call resumes from the one before"""
+    cache = PrefixCache(chunk=4) if cache is None else cache
+    observations = []
+    for idx in range(len(turns)):
+        try:
+            state = cache.get_state(list(letters), turns[:idx + 1])
+        except Exception as error:
+            return observations, (idx, type(error).__name__)
+        observation = _observe(state)
+        if _over_finish(observation):
+            return observations, (idx, 'IndexError')
+        observations.append(observation)
+    return observations, None
+
+
+def trace_vector_many(letters, turns_lists):
+    """Traces of many games with the same seats, played in lockstep on one VectorLudo"""
+    vector = VectorLudo(letters, len(turns_lists))
+    length = max([len(turns) for turns in turns_lists] + [0])
+    traces = [([], None) for _ in turns_lists]
+    for col in range(length):
+        column = [turns[col] if col < len(turns) else None for turns in turns_lists]
+        seats = vector.seat_indexes([turn[0] if turn is not None else letters[0] for turn in column])
+        seats[[idx for idx, turn in enumerate(column) if turn is None]] = -1
+        vector.step(seats, [turn[1] if turn is not None else 1 for turn in column])
+        codes, error_turns = vector.get_errors()
+        steps = vector.get_steps()
+        done = vector.get_done()
+        for game, turn in enumerate(column):
+            observations, error = traces[game]
+            if turn is None or error is not None:
+                continue
+            if codes[game] != NO_ERROR:
+                traces[game] = (observations, (int(error_turns[game]), ERROR_TYPES[int(codes[game])].__name__))
+                continue
+            observation = (tuple(int(value) for value in steps[game].ravel()), tuple(bool(value) for value in done[game]))
+            if _over_finish(observation):
+                traces[game] = (observations, (col, 'IndexError'))
+                continue
+            observations.append(observation)
+    return traces
+
+
+def trace_vector(letters, turns):
+    """Trace of one game on VectorLudo"""
+    return trace_vector_many(letters, [turns])[0]
+
+
+def _outcome(result):
+    """Returns what play_game returned, or the type name of what it raised, so outcomes compare by value"""
+    return type(result).__name__ if isinstance(result, Exception) else result
+
+
+def outcome_reference(letters, turns):
+    """Returns the frozen original play_game outcome"""
+    try:
+        return LudoReference.LudoGame().play_game(list(letters), turns)
+    except Exception as error:
+        return type(error).__name__
+
+
+def outcome_batch(letters, turns):
+    """Returns the LudoBatch.play_many outcome, played in this process"""
+    for _, result in play_many([(list(letters), turns)], workers=0, return_exceptions=True):
+        return _outcome(result)
+
+
+# Engines compared turn by turn: name -> (trace function, trace function for many games with the same seats or None)
+TRACE_ENGINES = {
+    'ludogame': (trace_ludogame, None),
+    'vector': (trace_vector, trace_vector_many),
+    'cache': (trace_cache, None),
+    'history': (trace_history, None),
+}
+# Engines that only give play_game's final outcome: name -> outcome function
+OUTCOME_ENGINES = {
+    'batch': outcome_batch,
+}
+
+
+def register_engine(name, trace=None, trace_many=None, outcome=None):
+    """
+    Adds an engine to the fuzzer, either with a trace function (letters, turns) -> trace and optionally a batched
+    version, or with an outcome function (letters, turns) -> play_game result or exception type name
+    """
+    if trace is not None:
+        TRACE_ENGINES[name] = (trace, trace_many)
+    elif outcome is not None:
+        OUTCOME_ENGINES[name] = outcome
+    else:
+        raise ValueError("an engine needs a trace or an outcome function")
+
+
+def _differs(name, letters, turns):
+    """Returns True if the named engine disagrees with the reference on the game"""
+    if name in TRACE_ENGINES:
+        return TRACE_ENGINES[name][0](letters, turns) != trace_reference(letters, turns)
+    return OUTCOME_ENGINES[name](letters, turns) != outcome_reference(letters, turns)
+
+
+def random_letters(rng):
+    """Returns a random seat setup, 2 to 4 of the positions in a random seat order"""
+    return ''.join(rng.sample(POSITIONS, rng.randint(2, len(POSITIONS))))
+
+
+def random_turns(rng, letters, max_turns=200):
+    """Returns a random legal turn list of 1 to max_turns turns for the seats in letters"""
+    turns = []
+    seat = 0
+    bonus = False
+    for _ in range(rng.randint(1, max_turns)):
+        roll = rng.randint(1, 6)
+        turns.append((letters[seat], roll))
+        if roll == 6 and not bonus:
+            bonus = True
+        else:
+            bonus = False
+            seat = (seat + 1) % len(letters)
+    return turns
+
+
+def shrink(name, letters, turns):
+    """
+    Shrinks a game the named engine disagrees with the reference on to a small one it still disagrees on: the turns
+    after the first difference are cut, then chunks of turns are removed (halving the chunk size down to one turn),
+    then seats that no longer roll are dropped and rolls lowered. Returns (letters, turns)
+    """
+    turns = list(turns)
+    if name in TRACE_ENGINES:
+        ref = trace_reference(letters, turns)
+        got = TRACE_ENGINES[name][0](letters, turns)
+        first = next((idx for idx, pair in enumerate(zip(ref[0], got[0])) if pair[0] != pair[1]),
+                     min(len(ref[0]), len(got[0])))
+        if _differs(name, letters, turns[:first + 1]):
+            turns = turns[:first + 1]
+
+    size = max(len(turns) // 2, 1)
+    while True:
+        idx = 0
+        while idx < len(turns):
+            candidate = turns[:idx] + turns[idx + size:]
+            if len(candidate) != 0 and _differs(name, letters, candidate):
+                turns = candidate
+            else:
+                idx += size
+        if size == 1:
+            break
+        size //= 2
+
+    for letter in letters:
+        smaller = letters.replace(letter, '')
+        if len(smaller) >= 2 and all(turn[0] != letter for turn in turns) and _differs(name, smaller, turns):
+            letters = smaller
+    for idx in range(len(turns)):
+        for roll in range(1, turns[idx][1]):
+            candidate = turns[:idx] + [(turns[idx][0], roll)] + turns[idx + 1:]
+            if _differs(name, letters, candidate):
+                turns = candidate
+                break
+    return letters, turns
+
+
+def fuzz_batch(seed, batch, games, engines, max_turns=200):
+    """
+    Worker entry point: plays batch number batch of games random games against every named engine. Games in a batch
+    share one seat setup so VectorLudo can play them in lockstep. Returns a list of (engine name, letters, shrunk
+    turns) for every game an engine disagreed on, at most one per engine
+    """
+    rng = random.Random('%d:%d' % (seed, batch))
+    letters = random_letters(rng)
+    turns_lists = [random_turns(rng, letters, max_turns) for _ in range(games)]
+    references = [trace_reference(letters, turns) for turns in turns_lists]
+
+    found = []
+    for name in engines:
+        if name in OUTCOME_ENGINES:
+            bad = next((turns for turns in turns_lists if _differs(name, letters, turns)), None)
+        else:
+            trace, trace_many = TRACE_ENGINES[name]
+            traces = trace_many(letters, turns_lists) if trace_many is not None else \
+                [trace(letters, turns) for turns in turns_lists]
+            bad = next((turns for turns, got, ref in zip(turns_lists, traces, references) if got != ref), None)
+        if bad is not None:
+            small_letters, small_turns = shrink(name, letters, bad)
+            found.append((name, small_letters, small_turns))
+    return found
+
+
+def run_fuzz(games, engines=None, seed=0, batch_size=500, workers=None, max_turns=200):
+    """
+    Fuzzes games random games in batches across worker processes and returns the list of (engine name, letters,
+    shrunk turns) differences found
+    :param engines: names from TRACE_ENGINES and OUTCOME_ENGINES, None for all of them
+    :param workers: number of processes, None for one per CPU and 0 to run in this process
+    """
+    engines = list(TRACE_ENGINES) + list(OUTCOME_ENGINES) if engines is None else list(engines)
+    batches = [(seed, batch, min(batch_size, games - batch * batch_size), engines, max_turns)
+               for batch in range((games + batch_size - 1) // batch_size)]
+    found = []
+    if workers == 0:
+        for args in batches:
+            found.extend(fuzz_batch(*args))
+        return found
+    with ProcessPoolExecutor(workers) as pool:
+        for result in pool.map(fuzz_batch, *zip(*batches)):
+            found.extend(result)
+    return found
+
+
+def main(argv=None):
+    """Command line entry point, returns 1 if any engine disagreed with the reference"""
+    parser = argparse.ArgumentParser(description='Differential fuzzer for the Ludo engines')
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--engines', nargs='*', help='engines to compare with the reference, default all')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--workers', type=int, help='worker processes, default one per CPU, 0 for none')
+    parser.add_argument('--max-turns', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    found = run_fuzz(args.games, args.engines, args.seed, args.batch_size, args.workers, args.max_turns)
+    for name, letters, turns in found:
+        print('%s differs: play_game(%r, %r)' % (name, list(letters), turns))
+    print('%d games, %d differences' % (args.games, len(found)))
+    return 1 if found else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
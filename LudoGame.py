@@ -1,602 +1,1153 @@
-# Author: John Brown
-# GitHub username: brown_science
-# Date 8/2/2022
-# Description: Text-based implementation of the game Ludo. The user passes a list of at least 2 player positions:
-# A, B, C, or D. As well as a list of tuples which represent turns that a player at a given position takes. e.g.
-# ('A', 6) would move the player 6 spaces. See the README for the game rules
-
-
-class Player:
-    """
-    Contains information about the player, the position of their tokens, the state of the player (playing or done), and
-    information about the Ludo board. The LudoGame class will invoke this class when LudoGame.Play_game is called
-    """
-    def __init__(self, letter, info=None, p_step_count=-1, q_step_count=-1):
-        """
-        Players are defined by their position/letter, this tells us where the player starts on the board. The Player
-        objects also keep track of how many steps each of their tokens have taken, p_step_count and q_step_count.
-        Player objects additionally contain a dictionary of information about their tokens: token current positions and
-        the start and end position for the tokens, as well as the 'state' of a player: whether they are currently playing
-        or if they've completed the game
-        """
-        self._info = info
-        self._letter = letter
-        self._p_step_count = p_step_count
-        self._q_step_count = q_step_count
-
-        if letter == "A":
-            A_info = {'start': 1, 'end': 50, 'p_pos': -1, 'q_pos': -1, 'state': 'playing'}
-            self._info = {self._letter : A_info}
-
-        if letter == "B":
-            B_info = {'start': 15, 'end': 8, 'p_pos': -1, 'q_pos': -1, 'state': 'playing'}
-            self._info = {self._letter : B_info}
-
-        if letter == "C":
-            C_info = {'start': 29, 'end': 22, 'p_pos': -1, 'q_pos': -1, 'state': 'playing'}
-            self._info = {self._letter: C_info}
-
-        if letter == "D":
-            D_info = {'start': 43, 'end': 36, 'p_pos': -1, 'q_pos': -1, 'state': 'playing'}
-            self._info = {self._letter : D_info}
-
-    def get_player_letter(self):
-        """Returns a player's letter/position"""
-        return self._letter
-
-    def get_player_info(self):
-        """Returns the player info"""
-        return self._info
-
-    def get_start(self):
-        """Returns the start position given a players letter"""
-        player_info = self._info[self._letter]
-        return player_info.get('start')
-
-    def get_end(self):
-        """Returns the end position given a players letter"""
-        player_info = self._info[self._letter]
-        return player_info.get('end')
-
-    def get_completed(self):
-        """Returns True if the player has finished the game, otherwise False"""
-        state = self._info[self._letter].get('state')
-        return state == 'done'
-
-    def get_token_p_step_count(self):
-        """Returns the total steps token p has moved"""
-        return self._p_step_count
-
-    def get_token_q_step_count(self):
-        """Returns the total steps token q has moved"""
-        return self._q_step_count
-
-    def update_step_count(self, token, num):
-        """
-        Updates the step count for a player's token, used in the move_token method of the LudoGame class
-        token refers to either token p or q, num is the nuber of steps taken, method is used by LudoGame.move_token
-        """
-        token = str(token)
-        if token == 'p': self._p_step_count += num
-        if token == 'q': self._q_step_count += num
-
-    def set_step_count(self, token, num):
-        """
-        manually sets the step count, used for the bounce back mechanism in LudoGame.move_token
-        token refers to either token p or q, num is set to step count fo the token passed
-        """
-        if token == 'p': self._p_step_count = num
-        if token == 'q': self._q_step_count = num
-
-    def get_space_name(self, token_steps):
-        """
-        Takes the total steps taken by a token as a param, returns
-        the space that token is on 'H' refers to home yard pos, 'R'
-        refers to the ready to go pos
-        """
-
-        if token_steps == -1:
-            return 'H'
-        if token_steps == 0:
-            return 'R'
-
-        if self._letter == 'A':
-            if 0 < token_steps <= 50:
-                board = list(range(0, 51))
-                return str(board[token_steps])
-
-            if token_steps > 50:
-                row = ['', 'A1', 'A2', 'A3', 'A4', 'A5', 'A6', 'E']
-                token_steps -= 50
-                return str(row[token_steps])
-
-        if self._letter == 'B':
-            if 0 < token_steps <= 50:
-                board = list(range(15, 57))
-                board.extend([1, 2, 3, 4, 5, 6, 7, 8])
-                board.insert(0, 0)
-                return str(board[token_steps])
-
-            if token_steps > 50:
-                row = ['', 'B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'E']
-                token_steps -= 50
-                return str(row[token_steps])
-
-        if self._letter == 'C':
-            if 0 < token_steps <= 50:
-                board = list(range(29, 57))
-                board.extend(range(1,29))
-                board.insert(0, 0)
-                return str(board[token_steps])
-
-            if token_steps > 50:
-                row = ['', 'C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'E']
-                token_steps -= 50
-                return str(row[token_steps])
-
-        if self._letter == 'D':
-            if 0 < token_steps <= 50:
-                board = list(range(43, 57))
-                board.extend(range(1, 44))
-                board.insert(0, 0)
-                return str(board[token_steps])
-
-            if token_steps > 50:
-                row = ['', 'D1', 'D2', 'D3', 'D4', 'D5', 'D6', 'E']
-                token_steps -= 50
-                return str(row[token_steps])
-
-
-class LudoGame:
-    """
-    Creates an instance of a Ludo game, the game can be played when the LudoGame object's play_game method is
-    called and given a list of player positions and turns
-    """
-    def __init__(self, player_list=None):
-        """Creates and stores a list of players"""
-        self._player_list = player_list
-        if player_list is None: self._player_list = []
-
-    def get_player_by_position(self, player_letter):
-        """
-        Takes the player letter string as an argument, returns
-        the player object associated with that letter
-        """
-
-        letter_list = []
-        for player in self._player_list:
-            letter_list.append(player.get_player_letter())
-
-        for player in self._player_list:
-            if player_letter in letter_list and player.get_player_letter() == player_letter:
-                return player
-        return "Player not found!"
-
-    def move_token(self, player, token_name, steps, kick=None, kick_token=None):
-        """
-        Moves player tokens, this method handles kicking opponent player tokens as well
-        :param player: Player object
-        :param token_name: 'p' or 'q'
-        :param steps: number of steps the token should move, determined by the current turn tuple
-        :param kick: is not Not iff an opposing token can be kicked
-        :param kick_token: specifies which token should be kicked
-        """
-
-        player_letter = player.get_player_letter()
-        player_info = player.get_player_info()[player_letter]
-        if token_name == 'p': token_idx = 'p_pos'
-        if token_name == 'q': token_idx = 'q_pos'
-
-        if player_info[token_idx] == -1:
-            player.update_step_count(token_name, 1)
-
-#Kicks opponents
-        elif type(kick) == dict:
-            if kick.get('p', None) is not None:
-                opp_info = kick['p']
-                opp_token = kick_token
-            if kick.get('q', None) is not None:
-                opp_info = kick['q']
-                opp_token = kick_token
-            opp_letter = list(opp_info)[0]
-            opp = self.get_player_by_position(opp_letter)
-            kick_pos = opp_info[opp_letter]
-            if opp_token == 'p':
-                opp.get_player_info()[opp_letter]['p_pos'] = -1
-                opp.set_step_count('p', -1)
-            if opp_token == 'q':
-                opp.get_player_info()[opp_letter]['q_pos'] = -1
-                opp.set_step_count('q', -1)
-            player.update_step_count(token_name, steps)
-
-            for extra_opp in self._player_list:
-                if extra_opp == player:
-                    pass
-                else:
-                    extra_opp_letter = extra_opp.get_player_letter()
-                    e_opp_info = extra_opp.get_player_info()[extra_opp_letter]
-                    if e_opp_info['p_pos'] == kick_pos:
-                        e_opp_info['p_pos'] = -1
-                        extra_opp.set_step_count('p', -1)
-                    if e_opp_info['q_pos'] == kick_pos:
-                        e_opp_info['q_pos'] = -1
-                        extra_opp.set_step_count('q', -1)
-
-
-
-
-# 2 elif statements move token around board, not home row
-        elif player.get_token_p_step_count() < 51 and token_name == 'p':
-            player.update_step_count(token_name, steps)
-
-        elif player.get_token_q_step_count() < 51 and token_name == 'q':
-            player.update_step_count(token_name, steps)
-
-# Moves token through the home row
-        elif player.get_token_p_step_count() > 50 and token_name == 'p':
-            if player.get_token_p_step_count() + steps <= 57:
-                player.update_step_count(token_name, steps)
-
-            elif player.get_token_p_step_count() + steps > 57:
-                steps_over = (player.get_token_p_step_count() + steps) - 57
-                new_pos = 57 - steps_over
-                player.set_step_count(token_name, new_pos)
-
-        elif player.get_token_q_step_count() > 50 and token_name == 'q':
-            if player.get_token_q_step_count() + steps <= 57:
-                player.update_step_count(token_name, steps)
-
-        elif player.get_token_q_step_count() + steps > 57:
-            steps_over = (player.get_token_q_step_count() + steps) - 57
-            new_pos = 57 - steps_over
-            player.set_step_count(token_name, new_pos)
-
-    def play_game(self, players, turns_list, opp_pos=None):
-        """
-        Method used for playing the game, it contains a decision-making algorithm which prioritizes player moves
-        according to the priorities listed in the README
-        :param players: List of players min:2 max:4  A, B, C, or D
-        :param turns_list: list of tuples w/ player letter/position and number of steps to take. e.g. ('A', 6)
-        :param opp_pos: Turns into a list of opponent positions, updates every turn
-        """
-        if opp_pos is None: opp_pos = []
-# Generates player objects and self._player_list
-        list_len = len(players) - 1
-        itr = 0
-        for player in players:
-            if itr <= list_len and players[itr] == 'A':
-                player_A = Player('A')
-                self._player_list.append(player_A)
-                itr += 1
-
-            if itr <= list_len and players[itr] == 'B':
-                player_B = Player('B')
-                self._player_list.append(player_B)
-                itr += 1
-
-            if itr <= list_len and players[itr] == 'C':
-                player_C = Player('C')
-                self._player_list.append(player_C)
-                itr += 1
-
-            if itr <= list_len and players[itr] == 'D':
-                player_D = Player('D')
-                self._player_list.append(player_D)
-                itr += 1
-
-# Handles turns
-        for turn in turns_list:
-            player_letter = turn[0]
-            player = self.get_player_by_position(player_letter)
-            player_info = player.get_player_info().get(player_letter)
-
-# Initializes opponent positions, used for kicking opponents
-            p_opp_pos = {}
-            q_opp_pos = {}
-            p_temp = {}
-            q_temp = {}
-            p_overlap_opp = {}
-            q_overlap_opp = {}
-            for opp in self._player_list:
-                if opp.get_player_letter() == player_letter:
-                    pass
-                else:
-                    opp_letter = opp.get_player_letter()
-                    opp_info = opp.get_player_info().get(opp_letter)
-                    p_opp_pos[opp_letter] = opp_info.get('p_pos')
-                    q_opp_pos[opp_letter] = opp_info.get('q_pos')
-
-        # p_overlap_opp is not empty iff player can kick an opponents' p token
-            for pair in p_opp_pos:
-                if type(player_info['p_pos']) == int and player_info['p_pos'] > 0 and player_info['p_pos'] + turn[1] == p_opp_pos[pair]:
-                    p_temp[pair] = p_opp_pos[pair]
-                    p_overlap_opp['p'] = p_temp
-                if player_info['p_pos'] == 0 and (player_info['start'] -1) + turn[1] == p_opp_pos[pair]:
-                    p_temp[pair] = p_opp_pos[pair]
-                    p_overlap_opp['p'] = p_temp
-                if type(player_info['q_pos']) == int and player_info['q_pos'] > 0 and player_info['q_pos'] + turn[1] == p_opp_pos[pair]:
-                    p_temp[pair] = p_opp_pos[pair]
-                    p_overlap_opp['q'] = p_temp
-                if player_info['q_pos'] == 0 and (player_info['start'] -1) + turn[1] == p_opp_pos[pair]:
-                    p_temp[pair] = p_opp_pos[pair]
-                    p_overlap_opp['q'] = p_temp
-
-
-        # q_overlap_opp is not empty iff player can kick an opponents' q token
-            for pair in q_opp_pos:
-                if type(player_info['p_pos']) == int and player_info['p_pos'] + turn[1] == q_opp_pos[pair]:
-                    q_temp[pair] = q_opp_pos[pair]
-                    q_overlap_opp['p'] = q_temp
-                if player_info['p_pos'] == 0 and (player_info['start'] - 1) + turn[1] == q_opp_pos[pair]:
-                    q_temp[pair] = q_opp_pos[pair]
-                    q_overlap_opp['p'] = q_temp
-                if type(player_info['q_pos']) == int and player_info['q_pos'] + turn[1] == q_opp_pos[pair]:
-                    q_temp[pair] = q_opp_pos[pair]
-                    q_overlap_opp['q'] = q_temp
-                if player_info['q_pos'] == 0 and (player_info['start'] -1) + turn[1] == q_opp_pos[pair]:
-                    q_temp[pair] = q_opp_pos[pair]
-                    q_overlap_opp['q'] = q_temp
-
-# Simple decision-making algorithm for moving tokens
-        # Priority 1: move token out of home yard
-            if turn[1] == 6 and player_info.get('p_pos') == -1:
-                self.move_token(player, 'p', turn[1])
-                player_info['p_pos'] = 0
-                continue
-            if turn[1] == 6 and player_info.get('p_pos') != -1 and player_info.get('q_pos') == -1:
-                self.move_token(player, 'q', turn[1])
-                player_info['q_pos'] = 0
-                continue
-
-            if player_info['p_pos'] == 0 and len(p_overlap_opp) == 0:
-                if len(q_overlap_opp) == 0:
-                    self.move_token(player, 'p', turn[1])
-                    player_info['p_pos'] = int(player.get_space_name(turn[1]))
-                    continue
-
-            if player_info['q_pos'] == 0 and len(q_overlap_opp) == 0:
-                if len(p_overlap_opp) == 0:
-                    self.move_token(player, 'q', turn[1])
-                    player_info['q_pos'] = int(player.get_space_name(turn[1]))
-                    continue
-
-
-            if 0 <= player.get_token_p_step_count() < 57 or 0 <= player.get_token_q_step_count() < 57:
-
-# Priority 2: move token to end space if possible
-                if player.get_token_p_step_count() + turn[1] == 57:
-                    self.move_token(player, 'p', turn[1])
-                    player_info['p_pos'] = player.get_space_name(player.get_token_p_step_count())
-                    if player_info['p_pos'] == 'E' and player_info['q_pos'] == 'E':
-                        player_info['state'] = 'done'
-                    continue
-                if player.get_token_q_step_count() + turn[1] == 57:
-                    self.move_token(player, 'q', turn[1])
-                    player_info['q_pos'] = player.get_space_name(player.get_token_q_step_count())
-                    if player_info['p_pos'] == 'E' and player_info['q_pos'] == 'E':
-                        player_info['state'] = 'done'
-                    continue
-
-# Priority 3: If an opponent's token can be kicked back to their home base, do it
-            # If player can kick an opponents' p token
-                if len(p_overlap_opp) != 0:
-                    same_spot = False
-                    token = list(p_overlap_opp)[0]
-                    if token == 'p': other_token = 'q'
-                    if token == 'q': other_token = 'p'
-                    if player_info['p_pos'] == player_info['q_pos'] != -1 or 0 and player.get_token_p_step_count() < 51: same_spot = True
-                    kick = p_overlap_opp
-                    self.move_token(player, token, turn[1], kick, 'p')
-
-                    player_info['p_pos'] = int(player.get_space_name(player.get_token_p_step_count()))
-                    if same_spot is True:
-                        self.move_token(player, other_token, turn[1])
-                        player_info['q_pos'] = int(player.get_space_name(player.get_token_q_step_count()))
-                        same_spot = False
-                    continue
-
-
-            # If player can kick opponents' q token
-                if len(q_overlap_opp) != 0:
-                    same_spot = False
-                    token = list(q_overlap_opp)[0]
-                    if token == 'p': other_token = 'q'
-                    if token == 'q': other_token = 'p'
-                    if player_info['p_pos'] == player_info['q_pos'] != -1 or 0 and player.get_token_p_step_count() < 51: same_spot = True
-                    kick = q_overlap_opp
-                    self.move_token(player, token, turn[1], kick, 'q')
-                    player_info['q_pos'] = player.get_space_name(player.get_token_q_step_count())
-                    if same_spot is True:
-                        self.move_token(player, other_token, turn[1])
-                        player_info['p_pos'] = player.get_space_name(player.get_token_p_step_count())
-                        same_spot = False
-                    continue
-
-# Priority 4: Move the token furthest from the finishing square
-                if player.get_token_p_step_count() > player.get_token_q_step_count() and player_info.get('q_pos') != -1 and player.get_token_q_step_count() < 57:
-                    if player_info['q_pos'] != 'E': self.move_token(player, 'q', turn[1])
-                    if 0 < player.get_token_q_step_count() < 51:
-                        player_info['q_pos'] = int(player.get_space_name(player.get_token_q_step_count()))
-                    if player.get_token_q_step_count() > 50 or player.get_token_q_step_count() <= 0:
-                        player_info['q_pos'] = player.get_space_name(player.get_token_q_step_count())
-                    continue
-                if player.get_token_p_step_count() < player.get_token_q_step_count() and player.get_token_p_step_count() < 57:
-                    if player_info['p_pos'] != 'E': self.move_token(player, 'p', turn[1])
-                    if 0 < player.get_token_p_step_count() < 51:
-                        player_info['p_pos'] = int(player.get_space_name(player.get_token_p_step_count()))
-                    if player.get_token_p_step_count() > 50 or player.get_token_p_step_count() <= 0:
-                        player_info['p_pos'] = player.get_space_name(player.get_token_p_step_count())
-
-                    continue
-                if player_info.get('p_pos') == player_info.get('q_pos') and player_info.get('q_pos') > 0:
-                    if player_info['p_pos'] and player_info['q_pos'] != 'E':
-                        self.move_token(player, 'p', turn[1])
-                        self.move_token(player, 'q', turn[1])
-                        if 0 < player.get_token_p_step_count() < 51:
-                            player_info['p_pos'] = int(player.get_space_name(player.get_token_p_step_count()))
-                            player_info['q_pos'] = int(player.get_space_name(player.get_token_p_step_count()))
-                        if player.get_token_p_step_count() > 50 or player.get_token_p_step_count() <= 0:
-                            player_info['p_pos'] = player.get_space_name(player.get_token_p_step_count())
-                            player_info['q_pos'] = player.get_space_name(player.get_token_p_step_count())
-                else:
-                    if player.get_token_p_step_count() < 57 and player_info['p_pos'] != 'E':
-                        self.move_token(player, 'p', turn[1])
-                        if 0 < player.get_token_p_step_count() < 51:
-                            player_info['p_pos'] = int(player.get_space_name(player.get_token_p_step_count()))
-                        if player.get_token_p_step_count() > 50 or player.get_token_p_step_count() <= 0:
-                            player_info['p_pos'] = player.get_space_name(player.get_token_p_step_count())
-
-
-
-# This code runs if one piece is still in the home yard
-            else:
-                if player.get_token_p_step_count() < 57 and player_info['p_pos'] != 'E':
-                    self.move_token(player, 'p', turn[1])
-                    if 0 < player.get_token_p_step_count() < 51:
-                        player_info['p_pos'] = int(player.get_space_name(player.get_token_p_step_count()))
-                    if player.get_token_p_step_count() > 50 or player.get_token_p_step_count() <= 0:
-                        player_info['p_pos'] = player.get_space_name(player.get_token_p_step_count())
-
-# Returns the state of the board after all turns have passed
-        pos_list = []
-        for element in self._player_list:
-            pos_list.append(str(element.get_space_name(element.get_token_p_step_count())))
-            pos_list.append(str(element.get_space_name(element.get_token_q_step_count())))
-        return pos_list
-
-
-                                 ############################## TEST CASES ####################################
-
-
-# # Case 0
-# players = ['A', 'B']
-# turns = [('A', 6), ('A', 4), ('A', 5), ('A', 4), ('B', 6), ('B', 4), ('B', 1), ('B', 2), ('A', 6), ('A', 4), ('A', 6), ('A', 3), ('A', 5), ('A', 1), ('A', 5), ('A', 4)]
-# game = LudoGame()
-# current_tokens_space = game.play_game(players, turns)
-# player_A = game.get_player_by_position('A')
-# C0_T1 = player_A.get_completed()
-# C0_T2 = player_A.get_token_p_step_count()
-# C0_T3 =current_tokens_space
-# player_B = game.get_player_by_position('B')
-# C0_T4 = player_B.get_space_name(55)
-# C0_T3_list = ['28','28', '21', 'H']
-#
-# if C0_T1 is False and C0_T2 == 28 and C0_T3 == C0_T3_list and C0_T4 == 'B5':
-#     print("Case 0: PASS")
-# else: print("FAILED Case 0")
-#
-#
-#
-# # Case 1
-# players = ['A','B','C','D']
-# turns = [('A', 6),('A', 1),('B', 6),('B', 2),('C', 6),('C', 3),('D', 6),('D', 4)]
-# game = LudoGame()
-# current_tokens_space = game.play_game(players, turns)
-# C1 = current_tokens_space
-# C1_list = ['1', 'H', '16', 'H', '31', 'H', '46', 'H']
-#
-# if C1 == C1_list:
-#     print("Case 1: PASS")
-# else: print("FAILED Case 1")
-#
-# # Case 2:
-# players = ['A','B']
-# turns = [('B', 6),('B', 4),('B', 5),('B', 4),('B', 4),('B', 3),('B', 4),('B', 5),('B', 4),('B', 4),('B', 5),('B', 4),('B', 1),('B', 4),('B', 5),('B', 5),('B', 5)]
-# game = LudoGame()
-# current_tokens_space = game.play_game(players, turns)
-# C2 = current_tokens_space
-# C2_list = ['H', 'H', 'B6', 'H']
-#
-# if C2 == C2_list:
-#     print("Case 2: PASS")
-# else: print("FAILED Case 2")
-#
-# # Case 3:
-# players = ['A','B']
-# turns = [('A', 6),('A', 3),('A', 6),('A', 3),('A', 6),('A', 5),('A', 4),('A', 6),('A', 4)]
-# game = LudoGame()
-# current_tokens_space = game.play_game(players, turns)
-# C3 = current_tokens_space
-# C3_list = ['28', '28', 'H', 'H']
-#
-# if C3 == C3_list:
-#     print("Case 3: PASS")
-# else: print("FAILED Case 3")
-#
-# # Case 4:
-# players = ['A','C']
-# turns = [('A', 6),('A', 4),('A', 4),('A', 4),('A', 5),('A', 6),('A', 4),('A', 6),('A', 4),('A', 6),('A', 6),('A', 6),('A', 4),('A', 6),('A', 6),('C', 6),('C', 4)]
-# game = LudoGame()
-# current_tokens_space = game.play_game(players, turns)
-# C4 = current_tokens_space
-# C4_list = ['33', 'H', '32', 'H']
-#
-# if C4 == C4_list:
-#     print("Case 4: PASS")
-# else: print("FAILED Case 4")
-#
-# #Case 5:
-# players = ['A','B']
-# turns = [('A', 6),('A', 4),('A', 4),('A', 4),('A', 5),('A', 6),('A', 4),('A', 6),('A', 4),('A', 6),('A', 6),('A', 4),('A', 6),('A', 4),('A', 6),('A', 6),('A', 4),('A', 6),('A', 6),('A', 4),('A', 6),('A', 6),('A', 4),('A', 6),('A', 3),('A', 6),('B', 6),('A', 6)]
-# game = LudoGame()
-# current_tokens_space = game.play_game(players, turns)
-# player_A = game.get_player_by_position('A')
-# C5 = current_tokens_space
-# C5_T2 = player_A.get_completed()
-# C5_list = ['E', 'E', 'R', 'H']
-#
-# if C5 == C5_list and C5_T2 is True:
-#     print("Case 5: PASS")
-# else: print("FAILED Case 5")
-#
-# # Case 6:
-# players = ['A','B']
-# turns = [('A', 6),('A', 2),('A', 2),('A', 6),('A', 4),('A', 5),('A', 4),('A', 4),('B', 6),('B', 3),('A', 6),('A', 3)]
-# game = LudoGame()
-# current_tokens_space = game.play_game(players, turns)
-# C6 = current_tokens_space
-# C6_list = ['3', 'H', '17', 'H']
-#
-# if C6 == C6_list:
-#     print("Case 6: PASS")
-# else: print("FAILED Case 6")
-#
-# # Case 7:
-# players = ['A','B']
-# turns = [('A', 6),('A', 4),('A', 5),('A', 4),('A', 4),('A', 4),('A', 5),('A', 4),('A', 5),('A', 5),('A', 3),('A', 5),('A', 3),('A', 6)]
-# game = LudoGame()
-# current_tokens_space = game.play_game(players, turns)
-# C7 = current_tokens_space
-# C7_list = ['A1', 'R', 'H', 'H']
-#
-# if C7 == C7_list:
-#     print("Case 7: PASS")
-# else: print("FAILED Case 7")
-#
-# # Case 8:
-# players = ['A','B']
-# turns = [('A', 6),('A', 4),('A', 5),('A', 4),('A', 4),('A', 4),('A', 5),('A', 4),('A', 5),('A', 5),('A', 3),('A', 5),('A', 5),('A', 6),('A', 5),('A', 5),('A', 3),('B', 6),('B', 3),('A', 4)]
-# game = LudoGame()
-# current_tokens_space = game.play_game(players, turns)
-# C8 = current_tokens_space
-# C8_list = ['E', '13', '17', 'H']
-#
-# if C8 == C8_list:
-#     print("Case 8: PASS")
-# else: print("FAILED Case 8")
-#
-# # Case 9:
-# players = ['A','B']
-# turns = [('A', 6),('A', 4),('A', 4),('A', 4),('A', 6),('A', 5),('A', 3),('B', 6),('B', 2),('A', 2),('A', 4)]
-# game = LudoGame()
-# current_tokens_space = game.play_game(players, turns)
-# C9 = current_tokens_space
-# C9_list = ['16', '10', 'H', 'H']
-#
-# if C9 == C9_list:
-#     print("Case 9: PASS")
-# else: print("FAILED Case 9")
-
-
-
-
+# Author: John Brown
+# GitHub username: brown_science
+# Date 8/2/2022
+# Description: Text-based implementation of the game Ludo. The user passes a list of at least 2 player positions:
+# A, B, C, or D. As well as a list of tuples which represent turns that a player at a given position takes. e.g.
+# ('A', 6) would move the player 6 spaces. See the README for the game rules
+
+
+class BoardTopology:
+    """
+    Immutable lookup tables describing the board as seen from one position (A, B, C, or D). A token's progress is
+    measured in total steps: -1 for the home yard, 0 for the ready to go position, 1 - 50 on the main track, 51 - 56
+    for the home squares and 57 for the finishing square. The tables are built once per position and shared by every
+    Player at that position, so looking up a space is a single tuple index. The class attributes are the geometry of
+    the standard board, which every LudoGame seat, position marker and policy table uses. Other geometries are passed
+    to the constructor by LudoEngine for its own boards
+    """
+    __slots__ = ('_letter', '_start', '_end', '_space_names', '_squares', '_space_steps', '_track_length',
+                 '_last_board', '_finish')
+
+    track_length = 56
+    last_board_step = 50
+    finish_step = 57
+
+    def __init__(self, letter, start, end, track_length=None, last_board_step=None, finish_step=None):
+        """
+        Builds the step -> space name, step -> board square and space name -> step tables for a position. Tables
+        indexed by steps are offset by one so the home yard (-1) sits at index 0
+        :param track_length: squares on the main track, last_board_step the last step taken on it and finish_step the
+        step of the finishing square, each None for the standard board's value
+        """
+        track_length = self.track_length if track_length is None else track_length
+        last_board = self.last_board_step if last_board_step is None else last_board_step
+        finish = self.finish_step if finish_step is None else finish_step
+        space_names = ['H', 'R']
+        squares = [None, None]
+        for step in range(1, last_board + 1):
+            square = (start + step - 2) % track_length + 1
+            space_names.append(str(square))
+            squares.append(square)
+        for step in range(last_board + 1, finish):
+            space_names.append(letter + str(step - last_board))
+            squares.append(None)
+        space_names.append('E')
+        squares.append(None)
+
+        self._letter = letter
+        self._start = start
+        self._end = end
+        self._track_length = track_length
+        self._last_board = last_board
+        self._finish = finish
+        self._space_names = tuple(space_names)
+        self._squares = tuple(squares)
+        self._space_steps = {name: idx - 1 for idx, name in enumerate(self._space_names)}
+
+    def get_track_length(self):
+        """Returns the number of squares on the main track"""
+        return self._track_length
+
+    def get_last_board_step(self):
+        """Returns the last step a token takes on the main track before its home squares"""
+        return self._last_board
+
+    def get_finish_step(self):
+        """Returns the step of the finishing square"""
+        return self._finish
+
+    def get_letter(self):
+        """Returns the position these tables describe"""
+        return self._letter
+
+    def get_start(self):
+        """Returns the board square a token enters on after leaving the ready to go position"""
+        return self._start
+
+    def get_end(self):
+        """Returns the last board square before a token turns into its home squares"""
+        return self._end
+
+    def space_name(self, steps):
+        """Returns the name of the space a token that has taken the given steps is on, e.g. 'H', 'R', '15', 'B3', 'E'"""
+        if steps < -1:
+            return None
+        return self._space_names[steps + 1]
+
+    def square(self, steps):
+        """Returns the board square for the given steps, or None if the token is not on the main track"""
+        if steps < -1:
+            return None
+        return self._squares[steps + 1]
+
+    def board_square(self, steps):
+        """
+        Returns the board square for the given steps as an int. Raises ValueError when the token is off the main track,
+        the same way int(get_space_name(steps)) does
+        """
+        square = self._squares[steps + 1]
+        if square is None:
+            raise ValueError("a token with " + str(steps) + " steps is not on the main track")
+        return square
+
+    def step_of_space(self, space_name):
+        """Returns the steps a token from this position has taken when it is on the named space"""
+        return self._space_steps[space_name]
+
+
+BOARD_TOPOLOGY = {
+    'A': BoardTopology('A', 1, 50),
+    'B': BoardTopology('B', 15, 8),
+    'C': BoardTopology('C', 29, 22),
+    'D': BoardTopology('D', 43, 36),
+}
+POSITIONS = tuple(BOARD_TOPOLOGY)
+
+
+def seat_letters(players):
+    """Returns the string of seat letters set up for a players list: every position up to the first invalid entry"""
+    letters = ''
+    for letter in players:
+        if letter not in POSITIONS:
+            break
+        letters += letter
+    return letters
+
+
+# Seat registries by seat letters, shared by every game with the same seats and never changed once built
+_SEAT_REGISTRIES = {}
+
+
+def seat_registry(letters):
+    """
+    Returns (seat of each letter, kick rank of each seat) for a string of seat letters. A letter maps to the first seat
+    holding it. Built once per seat string and shared, so callers must not change it
+    """
+    registry = _SEAT_REGISTRIES.get(letters)
+    if registry is None:
+        seat_of = {}
+        for seat, letter in enumerate(letters):
+            seat_of.setdefault(letter, seat)
+# Opponents are looked up by letter, so when a letter is taken by more than one seat the last of them is the one seen
+# when searching for a kick, in the order that letter first appeared
+        kick_rank = tuple(seat_of[letter] if letter not in letters[idx + 1:] else None
+                          for idx, letter in enumerate(letters))
+        registry = _SEAT_REGISTRIES[letters] = (seat_of, kick_rank)
+    return registry
+
+
+# Each seat takes SEAT_WIDTH bytes of a GameState: the steps of tokens p and q (stored +1 so the home yard is 0), the
+# position markers of tokens p and q, and the done flag
+SEAT_WIDTH = 5
+TOKEN_OFFSET = {'p': 0, 'q': 1}
+MARK_OFFSET = 2
+DONE_OFFSET = 4
+
+# A position marker is what the priority rules in play_game compare against: either an int square/-1/0, stored as the
+# int + 1, or a space name string, stored as STR_MARK + steps + 1 for the steps that name belongs to. The two are kept
+# apart because the rules treat 28 and '28' differently, and the marker can lag behind the step count
+STR_MARK = 64
+
+
+def pos_to_mark(letter, pos):
+    """Encodes a token position (int or space name) of the player at the given letter as a one byte marker"""
+    if type(pos) == int:
+        return pos + 1
+    return STR_MARK + 1 + BOARD_TOPOLOGY[letter].step_of_space(pos)
+
+
+def mark_to_pos(letter, mark):
+    """Decodes a position marker back into the int or space name string it was made from"""
+    if mark < STR_MARK:
+        return mark - 1
+    return BOARD_TOPOLOGY[letter].space_name(mark - STR_MARK - 1)
+
+
+class GameState:
+    """
+    Compact state of a whole game, SEAT_WIDTH bytes per seat in one bytearray plus the string of seat letters. Player
+    and LudoGame objects are views over a GameState, so copying or archiving a game only needs this object
+    """
+    __slots__ = ('_letters', '_data')
+
+    def __init__(self, letters='', data=None):
+        """letters is a string (or list) of seat letters, data the raw seat bytes, all tokens start in the home yard"""
+        self._letters = ''.join(letters)
+        if data is None:
+            data = bytes(SEAT_WIDTH * len(self._letters))
+        self._data = bytearray(data)
+
+    @classmethod
+    def from_bytes(cls, raw):
+        """Rebuilds a GameState from the output of to_bytes"""
+        seat_count = len(raw) // (SEAT_WIDTH + 1)
+        return cls(raw[:seat_count].decode('ascii'), raw[seat_count:])
+
+    def to_bytes(self):
+        """Returns the seat letters followed by the seat bytes, SEAT_WIDTH + 1 bytes per seat"""
+        return self._letters.encode('ascii') + bytes(self._data)
+
+    def copy(self):
+        """Returns an independent copy of the state"""
+        return GameState(self._letters, self._data)
+
+    def __eq__(self, other):
+        return isinstance(other, GameState) and self._letters == other._letters and self._data == other._data
+
+    __hash__ = None
+
+    def get_letters(self):
+        """Returns the string of seat letters, in seat order"""
+        return self._letters
+
+    def get_seat_count(self):
+        """Returns the number of seats"""
+        return len(self._letters)
+
+    def add_seat(self, letter):
+        """Adds a seat with both tokens in the home yard, returns the new seat index"""
+        self._letters += letter
+        self._data.extend(bytes(SEAT_WIDTH))
+        return len(self._letters) - 1
+
+    def add_seats(self, letters, data=None):
+        """
+        Adds a seat for each letter, with the seat bytes in data or every token in the home yard. Returns the index of
+        the first new seat
+        """
+        first = len(self._letters)
+        self._letters += letters
+        self._data.extend(bytes(SEAT_WIDTH * len(letters)) if data is None else data)
+        return first
+
+    def get_seat_data(self, seat):
+        """Returns a copy of the seat's SEAT_WIDTH bytes"""
+        return bytes(self._data[seat * SEAT_WIDTH:(seat + 1) * SEAT_WIDTH])
+
+    def set_seat_data(self, seat, raw):
+        """Overwrites the seat's SEAT_WIDTH bytes with raw, e.g. a copy from get_seat_data"""
+        self._data[seat * SEAT_WIDTH:(seat + 1) * SEAT_WIDTH] = raw
+
+    def get_steps(self, seat, token_name):
+        """Returns the total steps of a seat's token"""
+        return self._data[seat * SEAT_WIDTH + TOKEN_OFFSET[token_name]] - 1
+
+    def set_steps(self, seat, token_name, steps):
+        """Sets the total steps of a seat's token"""
+        self._data[seat * SEAT_WIDTH + TOKEN_OFFSET[token_name]] = steps + 1
+
+    def get_mark(self, seat, token_name):
+        """Returns the raw position marker of a seat's token"""
+        return self._data[seat * SEAT_WIDTH + MARK_OFFSET + TOKEN_OFFSET[token_name]]
+
+    def get_pos(self, seat, token_name):
+        """Returns the position of a seat's token as the int or space name the priority rules see"""
+        return mark_to_pos(self._letters[seat], self.get_mark(seat, token_name))
+
+    def set_pos(self, seat, token_name, pos):
+        """Sets the position of a seat's token, returns the (old, new) position markers"""
+        idx = seat * SEAT_WIDTH + MARK_OFFSET + TOKEN_OFFSET[token_name]
+        old_mark = self._data[idx]
+        new_mark = pos_to_mark(self._letters[seat], pos)
+        self._data[idx] = new_mark
+        return old_mark, new_mark
+
+    def get_token_spaces(self):
+        """Returns a list of the space names of every seat's p and q tokens, in seat order"""
+        pos_list = []
+        for seat, letter in enumerate(self._letters):
+            topology = BOARD_TOPOLOGY[letter]
+            pos_list.append(str(topology.space_name(self.get_steps(seat, 'p'))))
+            pos_list.append(str(topology.space_name(self.get_steps(seat, 'q'))))
+        return pos_list
+
+    def is_done(self, seat):
+        """Returns True if the seat's player has finished the game"""
+        return self._data[seat * SEAT_WIDTH + DONE_OFFSET] == 1
+
+    def set_done(self, seat, done=True):
+        """Marks the seat's player as done (or playing again)"""
+        self._data[seat * SEAT_WIDTH + DONE_OFFSET] = 1 if done else 0
+
+
+class Player:
+    """
+    Contains information about the player, the position of their tokens, the state of the player (playing or done), and
+    information about the Ludo board. The LudoGame class will invoke this class when LudoGame.Play_game is called.
+    A Player is a view over one seat of a GameState
+    """
+    __slots__ = ('_letter', '_topology', '_state', '_seat')
+
+    def __init__(self, letter, info=None, p_step_count=-1, q_step_count=-1, state=None, seat=0):
+        """
+        Players are defined by their position/letter, this tells us where the player starts on the board. The Player
+        objects also keep track of how many steps each of their tokens have taken, p_step_count and q_step_count.
+        The token positions, step counts and the 'state' of a player (whether they are currently playing or if they've
+        completed the game) live in a GameState, pass state and seat to view a seat of an existing game. Otherwise the
+        Player gets a one seat GameState of its own
+        """
+        self._letter = letter
+        self._topology = BOARD_TOPOLOGY.get(letter)
+        if state is None:
+            state = GameState(letter)
+            state.set_steps(0, 'p', p_step_count)
+            state.set_steps(0, 'q', q_step_count)
+            if info is not None and letter in info:
+                state.set_pos(0, 'p', info[letter].get('p_pos', -1))
+                state.set_pos(0, 'q', info[letter].get('q_pos', -1))
+                state.set_done(0, info[letter].get('state') == 'done')
+        self._state = state
+        self._seat = seat
+
+    def get_player_letter(self):
+        """Returns a player's letter/position"""
+        return self._letter
+
+    def get_state(self):
+        """Returns the GameState this player is a view over"""
+        return self._state
+
+    def get_seat(self):
+        """Returns the player's seat index in its GameState"""
+        return self._seat
+
+    def bind(self, state, seat):
+        """Moves this player's seat into another GameState and makes the player a view over it"""
+        for token_name in TOKEN_OFFSET:
+            state.set_steps(seat, token_name, self._state.get_steps(self._seat, token_name))
+            state.set_pos(seat, token_name, self._state.get_pos(self._seat, token_name))
+        state.set_done(seat, self._state.is_done(self._seat))
+        self._state = state
+        self._seat = seat
+
+    def get_player_info(self):
+        """Returns a snapshot of the player info: start, end, token positions and state, keyed by the player letter"""
+        state = self._state
+        seat = self._seat
+        letter_info = {'start': self._topology.get_start(), 'end': self._topology.get_end(),
+                       'p_pos': state.get_pos(seat, 'p'), 'q_pos': state.get_pos(seat, 'q'),
+                       'state': 'done' if state.is_done(seat) else 'playing'}
+        return {self._letter: letter_info}
+
+    def get_start(self):
+        """Returns the start position given a players letter"""
+        return self._topology.get_start()
+
+    def get_end(self):
+        """Returns the end position given a players letter"""
+        return self._topology.get_end()
+
+    def get_completed(self):
+        """Returns True if the player has finished the game, otherwise False"""
+        return self._state.is_done(self._seat)
+
+    def get_token_p_step_count(self):
+        """Returns the total steps token p has moved"""
+        return self._state.get_steps(self._seat, 'p')
+
+    def get_token_q_step_count(self):
+        """Returns the total steps token q has moved"""
+        return self._state.get_steps(self._seat, 'q')
+
+    def update_step_count(self, token, num):
+        """
+        Updates the step count for a player's token, used in the move_token method of the LudoGame class
+        token refers to either token p or q, num is the nuber of steps taken, method is used by LudoGame.move_token
+        """
+        token = str(token)
+        if token in TOKEN_OFFSET:
+            self._state.set_steps(self._seat, token, self._state.get_steps(self._seat, token) + num)
+
+    def set_step_count(self, token, num):
+        """
+        manually sets the step count, used for the bounce back mechanism in LudoGame.move_token
+        token refers to either token p or q, num is set to step count fo the token passed
+        """
+        if token in TOKEN_OFFSET:
+            self._state.set_steps(self._seat, token, num)
+
+    def get_space_name(self, token_steps):
+        """
+        Takes the total steps taken by a token as a param, returns
+        the space that token is on 'H' refers to home yard pos, 'R'
+        refers to the ready to go pos
+        """
+        return self._topology.space_name(token_steps)
+
+    def get_topology(self):
+        """Returns the shared BoardTopology for this player's position"""
+        return self._topology
+
+
+# Classes of position marker a policy can tell apart: int -1, int 0, an int square, 'E', or any other space name
+MARK_HOME, MARK_READY, MARK_BOARD, MARK_NAME, MARK_END = range(5)
+_END_MARK = STR_MARK + 1 + BoardTopology.finish_step
+MARK_CLASS = bytes([MARK_HOME, MARK_READY] + [MARK_BOARD] * (STR_MARK - 2) + [MARK_NAME] * (_END_MARK - STR_MARK)
+                   + [MARK_END] + [MARK_NAME] * (255 - _END_MARK))
+
+# The moves a policy can choose from, the action id stored in a PolicyTable is the index in ACTIONS plus 1 (0 marks a
+# cell that hasn't been compiled yet). The kick actions are kick_<opponent's token>_with_<player's token>, _stacked
+# also moves the player's other token when both share a space
+ACTIONS = ('pass', 'p_leave_yard', 'q_leave_yard', 'p_enter_board', 'q_enter_board', 'p_finish', 'q_finish',
+           'kick_p_with_p', 'kick_p_with_q', 'kick_p_with_p_stacked', 'kick_p_with_q_stacked',
+           'kick_q_with_p', 'kick_q_with_q', 'kick_q_with_p_stacked', 'kick_q_with_q_stacked',
+           'advance_p', 'advance_q', 'mark_p', 'mark_q', 'advance_stack', 'compare_error')
+KICK_CODE = {None: 0, 'p': 1, 'q': 2}
+# Policies and their tables are compiled for the standard board's geometry, the one every LudoGame seat uses
+_FINISH = BoardTopology.finish_step
+_STEP_RANGE = _FINISH + 2
+
+
+class TurnPolicy:
+    """
+    Decides which of the ACTIONS a player takes for a roll. Subclasses set name and implement decide, then
+    register_policy compiles them into a PolicyTable that LudoGame looks moves up in
+    """
+    name = None
+
+    def decide(self, p_steps, q_steps, roll, p_kick, q_kick, p_class, q_class, same_mark):
+        """
+        Returns the name of the action to take
+        :param p_steps: total steps of the player's token p, q_steps the same for token q
+        :param roll: the roll, 1 - 6
+        :param p_kick: which of the player's tokens can kick an opponent's p token, 'p', 'q' or None
+        :param q_kick: which of the player's tokens can kick an opponent's q token, 'p', 'q' or None
+        :param p_class: MARK_CLASS of token p's position marker, q_class the same for token q
+        :param same_mark: True if both tokens have the same position marker
+        """
+        raise NotImplementedError
+
+
+class ReadmePolicy(TurnPolicy):
+    """The priority rules from the README, in the order play_game has always applied them"""
+    name = 'readme'
+
+    def decide(self, p_steps, q_steps, roll, p_kick, q_kick, p_class, q_class, same_mark):
+        """Returns the action the README priorities pick, see TurnPolicy.decide"""
+        # Priority 1: move token out of home yard
+        if roll == 6 and p_class == MARK_HOME:
+            return 'p_leave_yard'
+        if roll == 6 and q_class == MARK_HOME:
+            return 'q_leave_yard'
+        if p_class == MARK_READY and p_kick is None and q_kick is None:
+            return 'p_enter_board'
+        if q_class == MARK_READY and q_kick is None and p_kick is None:
+            return 'q_enter_board'
+
+        if 0 <= p_steps < _FINISH or 0 <= q_steps < _FINISH:
+# Priority 2: move token to end space if possible
+            if p_steps + roll == _FINISH:
+                return 'p_finish'
+            if q_steps + roll == _FINISH:
+                return 'q_finish'
+
+# Priority 3: If an opponent's token can be kicked back to their home base, do it
+            stacked = '_stacked' if same_mark and q_class != MARK_HOME else ''
+            if p_kick is not None:
+                return 'kick_p_with_' + p_kick + stacked
+            if q_kick is not None:
+                return 'kick_q_with_' + q_kick + stacked
+
+# Priority 4: Move the token furthest from the finishing square
+            if p_steps > q_steps and q_class != MARK_HOME and q_steps < _FINISH:
+                return 'mark_q' if q_class == MARK_END else 'advance_q'
+            if p_steps < q_steps and p_steps < _FINISH:
+                return 'mark_p' if p_class == MARK_END else 'advance_p'
+# Comparing a stacked pair's space name with 0 raises TypeError, the same as it always has
+            if same_mark and q_class in (MARK_NAME, MARK_END):
+                return 'compare_error'
+            if same_mark and q_class == MARK_BOARD:
+                return 'advance_stack'
+
+# This code runs if one piece is still in the home yard
+        if p_steps < _FINISH and p_class != MARK_END:
+            return 'advance_p'
+        return 'pass'
+
+
+class KickFirstPolicy(ReadmePolicy):
+    """The README priorities with kicking moved ahead of leaving the yard and finishing, a kick is never passed up"""
+    name = 'kick_first'
+
+    def decide(self, p_steps, q_steps, roll, p_kick, q_kick, p_class, q_class, same_mark):
+        """Returns a kick whenever there is one, otherwise what ReadmePolicy picks, see TurnPolicy.decide"""
+        if (0 <= p_steps < _FINISH or 0 <= q_steps < _FINISH) and (p_kick is not None or q_kick is not None):
+            stacked = '_stacked' if same_mark and q_class != MARK_HOME else ''
+            if p_kick is not None:
+                return 'kick_p_with_' + p_kick + stacked
+            return 'kick_q_with_' + q_kick + stacked
+        return ReadmePolicy.decide(self, p_steps, q_steps, roll, p_kick, q_kick, p_class, q_class, same_mark)
+
+
+class PolicyTable:
+    """
+    A policy compiled into an action table keyed by an index packed from the marker classes, kick bits, roll and both
+    tokens' steps. An entry is filled in by the policy's decide the first time a turn reaches it, from then on choosing
+    a move is a single dict lookup. The table is a dict rather than an array over every index, since games only reach
+    a small share of them, so a policy costs nothing until it is played. Turns outside the table (a roll outside 1 - 6
+    or steps past the finishing square) ask the policy directly
+    """
+    __slots__ = ('_policy', '_table')
+
+    def __init__(self, policy):
+        self._policy = policy
+        self._table = {}
+
+    def get_policy(self):
+        """Returns the TurnPolicy the table is compiled from"""
+        return self._policy
+
+    def lookup(self, p_steps, q_steps, roll, p_kick, q_kick, p_mark, q_mark):
+        """Returns the action id for a turn, p_mark and q_mark are the tokens' raw position markers"""
+        p_class = MARK_CLASS[p_mark]
+        q_class = MARK_CLASS[q_mark]
+        if not (1 <= roll <= 6 and -1 <= p_steps <= _FINISH and -1 <= q_steps <= _FINISH):
+            return self._decide(p_steps, q_steps, roll, p_kick, q_kick, p_class, q_class, p_mark == q_mark)
+
+        idx = (((((p_class * 5 + q_class) * 2 + (p_mark == q_mark)) * 9 + KICK_CODE[p_kick] * 3 + KICK_CODE[q_kick])
+                * 6 + roll - 1) * _STEP_RANGE + p_steps + 1) * _STEP_RANGE + q_steps + 1
+        action = self._table.get(idx)
+        if action is None:
+            action = self._decide(p_steps, q_steps, roll, p_kick, q_kick, p_class, q_class, p_mark == q_mark)
+            self._table[idx] = action
+        return action
+
+    def _decide(self, *features):
+        """Asks the policy for a turn's action and returns its id"""
+        name = self._policy.decide(*features)
+        if name not in ACTIONS:
+            raise ValueError("policy " + str(self._policy.name) + " chose unknown action " + repr(name))
+        return ACTIONS.index(name) + 1
+
+
+POLICY_TABLES = {}
+
+
+def register_policy(policy):
+    """Compiles a TurnPolicy into a PolicyTable and registers it under the policy's name, returns the table"""
+    table = PolicyTable(policy)
+    POLICY_TABLES[policy.name] = table
+    return table
+
+
+register_policy(ReadmePolicy())
+register_policy(KickFirstPolicy())
+
+
+# The paths through move_token: leaving the home yard, kicking, along the main track, along the home squares, bouncing
+# back off the finishing square (token p overshooting it) and staying put (token q overshooting it)
+MOVE_PATHS = ('home_yard', 'kick', 'board', 'home_row', 'bounce', 'stuck')
+
+
+class TurnHook:
+    """
+    Hears what a LudoGame does, see LudoGame.set_hook. Subclasses override the calls they need, the rest do nothing.
+    A game without a hook makes none of these calls
+    """
+    def on_turn(self, game, player_letter, roll):
+        """Called when apply_turn starts a roll for the player at player_letter"""
+
+    def on_action(self, game, player, roll, action):
+        """Called with the name of the action from ACTIONS the policy picked, before it is played"""
+
+    def on_move(self, game, player, token_name, before, after, path, kick, kick_token):
+        """
+        Called after move_token moves a token
+        :param before: the token's steps before the move, after its steps after it
+        :param path: which of MOVE_PATHS the move took
+        :param kick: opponent Player sent home and kick_token which of its tokens, None unless path is 'kick'
+        """
+
+    def on_turn_end(self, game, player_letter, roll, error):
+        """Called when apply_turn finishes a roll, error is the exception it raised or None"""
+
+
+class LudoGame:
+    """
+    Creates an instance of a Ludo game, the game can be played when the LudoGame object's play_game method is
+    called and given a list of player positions and turns
+    """
+    def __init__(self, player_list=None, policy='readme'):
+        """
+        Creates and stores a list of players, which are views over the game's GameState. The game also keeps an
+        occupancy index from each position marker to the (seat, token) pairs sitting on it, so finding the tokens on a
+        square is a single dict lookup, and a seat registry from each letter to its seat and from each seat to its
+        kick rank, built once when the seats are set up. policy is the name of a registered TurnPolicy that picks each
+        move
+        """
+        self._policy_table = None
+        self._hook = None
+        self.set_policy(policy)
+        self._state = GameState()
+        self._player_list = []
+        self._seat_of, self._kick_rank = seat_registry('')
+        self._occupancy = {}
+        if player_list is not None:
+            for player in player_list:
+                self._add_player(player)
+            self._build_registry()
+
+    @classmethod
+    def from_state(cls, state, policy='readme'):
+        """Returns a game set up with the seats of state that carries on from a copy of it"""
+        game = cls(policy=policy)
+        game._add_seats(state.get_letters(), state.to_bytes()[state.get_seat_count():])
+        return game
+
+    def get_state(self):
+        """Returns the GameState the game's players are views over"""
+        return self._state
+
+    def get_policy(self):
+        """Returns the TurnPolicy that picks the game's moves"""
+        return self._policy_table.get_policy()
+
+    def set_policy(self, policy):
+        """Switches to the registered TurnPolicy with the given name, raises ValueError for an unknown name"""
+        if policy not in POLICY_TABLES:
+            raise ValueError("no policy registered as " + repr(policy))
+        self._policy_table = POLICY_TABLES[policy]
+
+    def get_hook(self):
+        """Returns the game's TurnHook, None if it has none"""
+        return self._hook
+
+    def set_hook(self, hook):
+        """
+        Sets a TurnHook the game reports each turn, chosen action and token move to, or None to stop reporting. This
+        is the one supported way to watch a game play, e.g. LudoMetrics.instrument
+        """
+        self._hook = hook
+
+    def _add_seats(self, letters, data=None):
+        """
+        Adds a seat for each letter to the game state in one step, with the seat bytes in data or every token in the
+        home yard, then sets up the players viewing them and the seat registry
+        """
+        first = self._state.add_seats(letters, data)
+        if data is None:
+# New seats have every token on the home yard marker, so they are indexed in one go
+            self._player_list.extend(Player(letter, state=self._state, seat=first + idx)
+                                     for idx, letter in enumerate(letters))
+            self._occupancy.setdefault(0, []).extend((seat, token_name) for seat in range(first, first + len(letters))
+                                                     for token_name in TOKEN_OFFSET)
+        else:
+            for seat in range(first, first + len(letters)):
+                self._index_player(Player(letters[seat - first], state=self._state, seat=seat))
+        self._build_registry()
+
+    def _add_player(self, player):
+        """Appends an existing player to the game, moving its seat into the game state. _build_registry must follow"""
+        player.bind(self._state, self._state.add_seat(player.get_player_letter()))
+        self._index_player(player)
+
+    def _index_player(self, player):
+        """Appends a player bound to the game state to the player list and indexes both of its tokens"""
+        seat = player.get_seat()
+        self._player_list.append(player)
+        self._occupancy.setdefault(self._state.get_mark(seat, 'p'), []).append((seat, 'p'))
+        self._occupancy.setdefault(self._state.get_mark(seat, 'q'), []).append((seat, 'q'))
+
+    def _build_registry(self):
+        """Points the game at the seat registry for its seat letters, after seats are added"""
+        self._seat_of, self._kick_rank = seat_registry(self._state.get_letters())
+
+    def _set_token_pos(self, player, token_name, pos):
+        """Records a token's new position in the game state and moves its entry in the occupancy index"""
+        seat = player.get_seat()
+        old_mark, new_mark = self._state.set_pos(seat, token_name, pos)
+        entry = (seat, token_name)
+        self._occupancy[old_mark].remove(entry)
+        self._occupancy.setdefault(new_mark, []).append(entry)
+
+    def _find_kick(self, player_letter, p_targets, q_targets, opp_token):
+        """
+        Looks up the occupancy index for an opponent token named opp_token on any of the target markers. p_targets
+        and q_targets are where the player's p and q tokens would land. Returns the player's token that should move and
+        the opponent found first in seat order, or (None, None) if nothing can be kicked
+        """
+        found_rank = None
+        found_seat = None
+        letters = self._state.get_letters()
+        for targets in (p_targets, q_targets):
+            for target in targets:
+                for seat, token_name in self._occupancy.get(target, ()):
+                    rank = self._kick_rank[seat]
+                    if token_name != opp_token or rank is None or (found_rank is not None and rank >= found_rank):
+                        continue
+                    if letters[seat] == player_letter:
+                        continue
+                    found_rank = rank
+                    found_seat = seat
+
+        if found_seat is None:
+            return None, None
+        if self._state.get_mark(found_seat, opp_token) in p_targets:
+            return 'p', self._player_list[found_seat]
+        return 'q', self._player_list[found_seat]
+
+    def get_player_by_position(self, player_letter):
+        """
+        Takes the player letter string as an argument, returns
+        the player object associated with that letter
+        """
+        seat = self._seat_of.get(player_letter)
+        if seat is None:
+            return "Player not found!"
+        return self._player_list[seat]
+
+    def move_token(self, player, token_name, steps, kick=None, kick_token=None, undo=None):
+        """
+        Moves player tokens, this method handles kicking opponent player tokens as well
+        :param player: Player object
+        :param token_name: 'p' or 'q'
+        :param steps: number of steps the token should move, determined by the current turn tuple
+        :param kick: opponent Player whose token is on the landing square, None if no token can be kicked
+        :param kick_token: specifies which of the opponent's tokens is on the landing square, 'p' or 'q'
+        :param undo: list to append an undo entry to, so unmake can put the move back
+        """
+
+        topology = player.get_topology()
+        last_board = topology.get_last_board_step()
+        finish = topology.get_finish_step()
+        token_steps = self._state.get_steps(player.get_seat(), token_name)
+
+# An undo entry is a list of (seat, seat bytes) pairs, the moving seat first and then each seat about to lose a token
+        if undo is not None:
+            entry = [(player.get_seat(), self._state.get_seat_data(player.get_seat()))]
+            undo.append(entry)
+
+        if self._state.get_mark(player.get_seat(), token_name) == 0:
+            path = 'home_yard'
+            player.update_step_count(token_name, 1)
+
+#Kicks opponents
+        elif kick is not None:
+            path = 'kick'
+            kick_mark = self._state.get_mark(kick.get_seat(), kick_token)
+            opp = self.get_player_by_position(kick.get_player_letter())
+            if undo is not None:
+                self._save_seat(entry, opp.get_seat())
+            self._set_token_pos(opp, kick_token, -1)
+            opp.set_step_count(kick_token, -1)
+            player.update_step_count(token_name, steps)
+
+            for seat, extra_token in list(self._occupancy.get(kick_mark, ())):
+                extra_opp = self._player_list[seat]
+                if extra_opp is not player:
+                    if undo is not None:
+                        self._save_seat(entry, seat)
+                    self._set_token_pos(extra_opp, extra_token, -1)
+                    extra_opp.set_step_count(extra_token, -1)
+
+# Moves the token around the board, then through the home row
+        else:
+            if token_steps <= last_board or token_steps + steps <= finish:
+                path = 'board' if token_steps <= last_board else 'home_row'
+                player.update_step_count(token_name, steps)
+
+# Only token p bounces back off the finishing square, a q token that overshoots stays where it is
+            elif token_name == 'p':
+                path = 'bounce'
+                player.set_step_count(token_name, 2 * finish - token_steps - steps)
+            else:
+                path = 'stuck'
+
+        if self._hook is not None:
+            after = self._state.get_steps(player.get_seat(), token_name)
+            self._hook.on_move(self, player, token_name, token_steps, after, path, kick if path == 'kick' else None,
+                               kick_token if path == 'kick' else None)
+
+    def _save_seat(self, entry, seat):
+        """Adds a seat's bytes to an undo entry, unless the entry already holds them"""
+        for saved_seat, _ in entry:
+            if saved_seat == seat:
+                return
+        entry.append((seat, self._state.get_seat_data(seat)))
+
+    def unmake(self, undo, mark=0):
+        """
+        Puts back the moves recorded in undo, newest first, until only mark entries are left. Every token touched by
+        those moves gets its old step count and position back, along with its player's done flag
+        :param undo: list of undo entries filled in by move_token or apply_turn
+        :param mark: length of undo to roll back to, e.g. len(undo) taken before the moves to put back
+        """
+        while len(undo) > mark:
+            for seat, raw in reversed(undo.pop()):
+                self._restore_seat(seat, raw)
+
+    def _restore_seat(self, seat, raw):
+        """Writes a seat's saved bytes back into the game state and moves its tokens' occupancy index entries"""
+        for token_name in TOKEN_OFFSET:
+            old_mark = self._state.get_mark(seat, token_name)
+            new_mark = raw[MARK_OFFSET + TOKEN_OFFSET[token_name]]
+            if old_mark != new_mark:
+                entry = (seat, token_name)
+                self._occupancy[old_mark].remove(entry)
+                self._occupancy.setdefault(new_mark, []).append(entry)
+        self._state.set_seat_data(seat, raw)
+
+    @staticmethod
+    def _kick_targets(token_pos, roll, ready_square):
+        """
+        Returns the position markers a token at token_pos is checked against for kicking an opponent's p token and an
+        opponent's q token. Position plus roll is only checked against p tokens when the token is on the board
+        """
+        vs_p = []
+        vs_q = []
+        if type(token_pos) == int and -1 <= token_pos + roll <= BoardTopology.track_length:
+            if token_pos > 0:
+                vs_p.append(token_pos + roll + 1)
+            vs_q.append(token_pos + roll + 1)
+        if token_pos == 0 and ready_square is not None:
+            vs_p.append(ready_square + 1)
+            vs_q.append(ready_square + 1)
+        return vs_p, vs_q
+
+    def set_players(self, players):
+        """
+        Sets up a seat for each position in players, in order, stopping at the first entry that isn't A, B, C, or D.
+        Seats are only set up once, calling this again with the same positions keeps the game going and a different
+        list raises ValueError
+        :param players: List of players min:2 max:4  A, B, C, or D
+        """
+        letters = seat_letters(players)
+        if len(self._player_list) == 0:
+            self._add_seats(letters)
+        elif letters != self._state.get_letters():
+            raise ValueError("seats are already set up for " + self._state.get_letters() + ", not " + letters)
+
+    def apply_turn(self, player_letter, roll, undo=None):
+        """
+        Plays one roll for the player at player_letter. The game's policy table picks the move (by default the
+        priorities listed in the README) and the matching _act_ method plays it. Only the rolling player and the tokens
+        on the landing squares are touched, so a turn costs the same however long the game has run
+        :param player_letter: position of the player rolling, A, B, C, or D
+        :param roll: number of steps to take
+        :param undo: list to append the turn's undo entries to, unmake(undo, mark) takes the turn back
+        """
+        if self._hook is not None:
+            return self._apply_turn_hooked(player_letter, roll, undo)
+# The turn is played inline so a game without a hook pays no call beyond the _act_ method, _turn_action is the same
+# lookup for the hooked path
+        player = self.get_player_by_position(player_letter)
+        seat = player.get_seat()
+        state = self._state
+        ready_square = player.get_topology().square(roll)
+        p_mark = state.get_mark(seat, 'p')
+        q_mark = state.get_mark(seat, 'q')
+
+# Looks up opponent tokens that can be kicked, p_kick/q_kick is not None iff the player can kick an opponent's p/q token
+        p_vs_p, p_vs_q = self._kick_targets(mark_to_pos(player_letter, p_mark), roll, ready_square)
+        q_vs_p, q_vs_q = self._kick_targets(mark_to_pos(player_letter, q_mark), roll, ready_square)
+        p_kick_token, p_kick = self._find_kick(player_letter, p_vs_p, q_vs_p, 'p')
+        q_kick_token, q_kick = self._find_kick(player_letter, p_vs_q, q_vs_q, 'q')
+
+        action = self._policy_table.lookup(state.get_steps(seat, 'p'), state.get_steps(seat, 'q'), roll,
+                                           p_kick_token, q_kick_token, p_mark, q_mark)
+        handler, args = _ACTION_HANDLERS[action]
+        handler(self, player, roll, p_kick, q_kick, undo, *args)
+
+    def _apply_turn_hooked(self, player_letter, roll, undo):
+        """apply_turn for a game with a TurnHook, reporting the turn and the chosen action to it"""
+        hook = self._hook
+        hook.on_turn(self, player_letter, roll)
+        try:
+            player, action, p_kick, q_kick = self._turn_action(player_letter, roll)
+            hook.on_action(self, player, roll, ACTIONS[action - 1])
+            handler, args = _ACTION_HANDLERS[action]
+            handler(self, player, roll, p_kick, q_kick, undo, *args)
+        except Exception as error:
+            hook.on_turn_end(self, player_letter, roll, error)
+            raise
+        hook.on_turn_end(self, player_letter, roll, None)
+
+    def _turn_action(self, player_letter, roll):
+        """Returns (player, action id, p_kick, q_kick) for a roll, the lookup apply_turn does inline"""
+        player = self.get_player_by_position(player_letter)
+        seat = player.get_seat()
+        state = self._state
+        ready_square = player.get_topology().square(roll)
+        p_mark = state.get_mark(seat, 'p')
+        q_mark = state.get_mark(seat, 'q')
+        p_vs_p, p_vs_q = self._kick_targets(mark_to_pos(player_letter, p_mark), roll, ready_square)
+        q_vs_p, q_vs_q = self._kick_targets(mark_to_pos(player_letter, q_mark), roll, ready_square)
+        p_kick_token, p_kick = self._find_kick(player_letter, p_vs_p, q_vs_p, 'p')
+        q_kick_token, q_kick = self._find_kick(player_letter, p_vs_q, q_vs_q, 'q')
+        action = self._policy_table.lookup(state.get_steps(seat, 'p'), state.get_steps(seat, 'q'), roll,
+                                           p_kick_token, q_kick_token, p_mark, q_mark)
+        return player, action, p_kick, q_kick
+
+    def _act_pass(self, player, roll, p_kick, q_kick, undo):
+        """Leaves every token where it is"""
+
+    def _act_leave_yard(self, player, roll, p_kick, q_kick, undo, token_name):
+        """Moves a token out of the home yard to the ready to go position"""
+        self.move_token(player, token_name, roll, undo=undo)
+        self._set_token_pos(player, token_name, 0)
+
+    def _act_enter_board(self, player, roll, p_kick, q_kick, undo, token_name):
+        """Moves a token from the ready to go position onto the board"""
+        self.move_token(player, token_name, roll, undo=undo)
+        self._set_token_pos(player, token_name, player.get_topology().board_square(roll))
+
+    def _act_finish(self, player, roll, p_kick, q_kick, undo, token_name):
+        """Moves a token onto the finishing square, the player is done once both tokens are there"""
+        self.move_token(player, token_name, roll, undo=undo)
+        self._set_token_pos(player, token_name, player.get_space_name(self._state.get_steps(player.get_seat(), token_name)))
+        seat = player.get_seat()
+        if self._state.get_pos(seat, 'p') == 'E' and self._state.get_pos(seat, 'q') == 'E':
+            self._state.set_done(seat)
+
+    def _act_kick(self, player, roll, p_kick, q_kick, undo, kick_token, token_name, stacked):
+        """
+        Moves token_name onto an opponent's kick_token, sending it home. The marker updated afterwards is the one named
+        by kick_token, as play_game always has: the board square for a p kick, the space name for a q kick
+        """
+        other_token = 'q' if token_name == 'p' else 'p'
+        if kick_token == 'p':
+            self.move_token(player, token_name, roll, p_kick, 'p', undo=undo)
+            self._set_token_pos(player, 'p', player.get_topology().board_square(player.get_token_p_step_count()))
+            if stacked:
+                self.move_token(player, other_token, roll, undo=undo)
+                self._set_token_pos(player, 'q', player.get_topology().board_square(player.get_token_q_step_count()))
+        else:
+            self.move_token(player, token_name, roll, q_kick, 'q', undo=undo)
+            self._set_token_pos(player, 'q', player.get_space_name(player.get_token_q_step_count()))
+            if stacked:
+                self.move_token(player, other_token, roll, undo=undo)
+                self._set_token_pos(player, 'p', player.get_space_name(player.get_token_p_step_count()))
+
+    def _act_advance(self, player, roll, p_kick, q_kick, undo, token_name, move):
+        """Moves a token along the board (if move is True) and updates its position marker"""
+        if move:
+            self.move_token(player, token_name, roll, undo=undo)
+        steps = self._state.get_steps(player.get_seat(), token_name)
+        topology = player.get_topology()
+        if 0 < steps <= topology.get_last_board_step():
+            self._set_token_pos(player, token_name, topology.board_square(steps))
+        else:
+            self._set_token_pos(player, token_name, player.get_space_name(steps))
+
+    def _act_advance_stack(self, player, roll, p_kick, q_kick, undo):
+        """Moves two stacked tokens together"""
+        self.move_token(player, 'p', roll, undo=undo)
+        self.move_token(player, 'q', roll, undo=undo)
+        steps = player.get_token_p_step_count()
+        topology = player.get_topology()
+        if 0 < steps <= topology.get_last_board_step():
+            self._set_token_pos(player, 'p', topology.board_square(steps))
+            self._set_token_pos(player, 'q', topology.board_square(steps))
+        else:
+            self._set_token_pos(player, 'p', player.get_space_name(steps))
+            self._set_token_pos(player, 'q', player.get_space_name(steps))
+
+    def _act_compare_error(self, player, roll, p_kick, q_kick, undo):
+        """Raises the TypeError play_game has always raised for a stacked pair standing on a named space"""
+        raise TypeError("'>' not supported between instances of 'str' and 'int'")
+
+    def get_token_spaces(self):
+        """Returns a list of the space names of every player's p and q tokens, in seat order"""
+        return self._state.get_token_spaces()
+
+    def iter_turns(self, turns_list):
+        """
+        Plays turns from any iterable, e.g. a generator fed by a live table, yielding a GameState snapshot after each
+        turn. The seats must already be set up
+        """
+        for turn in turns_list:
+            self.apply_turn(turn[0], turn[1])
+            yield self._state.copy()
+
+    def play_game(self, players, turns_list, opp_pos=None, snapshots=False):
+        """
+        Method used for playing the game, sets up the seats and plays every turn with apply_turn. The seats are only
+        set up on the first call, later calls with the same players carry on the same game
+        :param players: List of players min:2 max:4  A, B, C, or D
+        :param turns_list: iterable of tuples w/ player letter/position and number of steps to take. e.g. ('A', 6)
+        :param opp_pos: unused, kept for callers that pass it
+        :param snapshots: if True, returns a generator of per-turn GameState snapshots (see iter_turns) instead
+        """
+        self.set_players(players)
+        if snapshots:
+            return self.iter_turns(turns_list)
+
+        for turn in turns_list:
+            self.apply_turn(turn[0], turn[1])
+
+# Returns the state of the board after all turns have passed
+        return self.get_token_spaces()
+
+
+# Action id -> (LudoGame method, extra arguments), in the same order as ACTIONS with the unused id 0 first
+_ACTION_HANDLERS = (
+    None,
+    (LudoGame._act_pass, ()),
+    (LudoGame._act_leave_yard, ('p',)),
+    (LudoGame._act_leave_yard, ('q',)),
+    (LudoGame._act_enter_board, ('p',)),
+    (LudoGame._act_enter_board, ('q',)),
+    (LudoGame._act_finish, ('p',)),
+    (LudoGame._act_finish, ('q',)),
+    (LudoGame._act_kick, ('p', 'p', False)),
+    (LudoGame._act_kick, ('p', 'q', False)),
+    (LudoGame._act_kick, ('p', 'p', True)),
+    (LudoGame._act_kick, ('p', 'q', True)),
+    (LudoGame._act_kick, ('q', 'p', False)),
+    (LudoGame._act_kick, ('q', 'q', False)),
+    (LudoGame._act_kick, ('q', 'p', True)),
+    (LudoGame._act_kick, ('q', 'q', True)),
+    (LudoGame._act_advance, ('p', True)),
+    (LudoGame._act_advance, ('q', True)),
+    (LudoGame._act_advance, ('p', False)),
+    (LudoGame._act_advance, ('q', False)),
+    (LudoGame._act_advance_stack, ()),
+    (LudoGame._act_compare_error, ()),
+)
+
+
+                                 ############################## TEST CASES ####################################
+
+
+# # Case 0
+# players = ['A', 'B']
+# turns = [('A', 6), ('A', 4), ('A', 5), ('A', 4), ('B', 6), ('B', 4), ('B', 1), ('B', 2), ('A', 6), ('A', 4), ('A', 6), ('A', 3), ('A', 5), ('A', 1), ('A', 5), ('A', 4)]
+# game = LudoGame()
+# current_tokens_space = game.play_game(players, turns)
+# player_A = game.get_player_by_position('A')
+# C0_T1 = player_A.get_completed()
+# C0_T2 = player_A.get_token_p_step_count()
+# C0_T3 =current_tokens_space
+# player_B = game.get_player_by_position('B')
+# C0_T4 = player_B.get_space_name(55)
+# C0_T3_list = ['28','28', '21', 'H']
+#
+# if C0_T1 is False and C0_T2 == 28 and C0_T3 == C0_T3_list and C0_T4 == 'B5':
+#     print("Case 0: PASS")
+# else: print("FAILED Case 0")
+#
+#
+#
+# # Case 1
+# players = ['A','B','C','D']
+# turns = [('A', 6),('A', 1),('B', 6),('B', 2),('C', 6),('C', 3),('D', 6),('D', 4)]
+# game = LudoGame()
+# current_tokens_space = game.play_game(players, turns)
+# C1 = current_tokens_space
+# C1_list = ['1', 'H', '16', 'H', '31', 'H', '46', 'H']
+#
+# if C1 == C1_list:
+#     print("Case 1: PASS")
+# else: print("FAILED Case 1")
+#
+# # Case 2:
+# players = ['A','B']
+# turns = [('B', 6),('B', 4),('B', 5),('B', 4),('B', 4),('B', 3),('B', 4),('B', 5),('B', 4),('B', 4),('B', 5),('B', 4),('B', 1),('B', 4),('B', 5),('B', 5),('B', 5)]
+# game = LudoGame()
+# current_tokens_space = game.play_game(players, turns)
+# C2 = current_tokens_space
+# C2_list = ['H', 'H', 'B6', 'H']
+#
+# if C2 == C2_list:
+#     print("Case 2: PASS")
+# else: print("FAILED Case 2")
+#
+# # Case 3:
+# players = ['A','B']
+# turns = [('A', 6),('A', 3),('A', 6),('A', 3),('A', 6),('A', 5),('A', 4),('A', 6),('A', 4)]
+# game = LudoGame()
+# current_tokens_space = game.play_game(players, turns)
+# C3 = current_tokens_space
+# C3_list = ['28', '28', 'H', 'H']
+#
+# if C3 == C3_list:
+#     print("Case 3: PASS")
+# else: print("FAILED Case 3")
+#
+# # Case 4:
+# players = ['A','C']
+# turns = [('A', 6),('A', 4),('A', 4),('A', 4),('A', 5),('A', 6),('A', 4),('A', 6),('A', 4),('A', 6),('A', 6),('A', 6),('A', 4),('A', 6),('A', 6),('C', 6),('C', 4)]
+# game = LudoGame()
+# current_tokens_space = game.play_game(players, turns)
+# C4 = current_tokens_space
+# C4_list = ['33', 'H', '32', 'H']
+#
+# if C4 == C4_list:
+#     print("Case 4: PASS")
+# else: print("FAILED Case 4")
+#
+# #Case 5:
+# players = ['A','B']
+# turns = [('A', 6),('A', 4),('A', 4),('A', 4),('A', 5),('A', 6),('A', 4),('A', 6),('A', 4),('A', 6),('A', 6),('A', 4),('A', 6),('A', 4),('A', 6),('A', 6),('A', 4),('A', 6),('A', 6),('A', 4),('A', 6),('A', 6),('A', 4),('A', 6),('A', 3),('A', 6),('B', 6),('A', 6)]
+# game = LudoGame()
+# current_tokens_space = game.play_game(players, turns)
+# player_A = game.get_player_by_position('A')
+# C5 = current_tokens_space
+# C5_T2 = player_A.get_completed()
+# C5_list = ['E', 'E', 'R', 'H']
+#
+# if C5 == C5_list and C5_T2 is True:
+#     print("Case 5: PASS")
+# else: print("FAILED Case 5")
+#
+# # Case 6:
+# players = ['A','B']
+# turns = [('A', 6),('A', 2),('A', 2),('A', 6),('A', 4),('A', 5),('A', 4),('A', 4),('B', 6),('B', 3),('A', 6),('A', 3)]
+# game = LudoGame()
+# current_tokens_space = game.play_game(players, turns)
+# C6 = current_tokens_space
+# C6_list = ['3', 'H', '17', 'H']
+#
+# if C6 == C6_list:
+#     print("Case 6: PASS")
+# else: print("FAILED Case 6")
+#
+# # Case 7:
+# players = ['A','B']
+# turns = [('A', 6),('A', 4),('A', 5),('A', 4),('A', 4),('A', 4),('A', 5),('A', 4),('A', 5),('A', 5),('A', 3),('A', 5),('A', 3),('A', 6)]
+# game = LudoGame()
+# current_tokens_space = game.play_game(players, turns)
+# C7 = current_tokens_space
+# C7_list = ['A1', 'R', 'H', 'H']
+#
+# if C7 == C7_list:
+#     print("Case 7: PASS")
+# else: print("FAILED Case 7")
+#
+# # Case 8:
+# players = ['A','B']
+# turns = [('A', 6),('A', 4),('A', 5),('A', 4),('A', 4),('A', 4),('A', 5),('A', 4),('A', 5),('A', 5),('A', 3),('A', 5),('A', 5),('A', 6),('A', 5),('A', 5),('A', 3),('B', 6),('B', 3),('A', 4)]
+# game = LudoGame()
+# current_tokens_space = game.play_game(players, turns)
+# C8 = current_tokens_space
+# C8_list = ['E', '13', '17', 'H']
+#
+# if C8 == C8_list:
+#     print("Case 8: PASS")
+# else: print("FAILED Case 8")
+#
+# # Case 9:
+# players = ['A','B']
+# turns = [('A', 6),('A', 4),('A', 4),('A', 4),('A', 6),('A', 5),('A', 3),('B', 6),('B', 2),('A', 2),('A', 4)]
+# game = LudoGame()
+# current_tokens_space = game.play_game(players, turns)
+# C9 = current_tokens_space
+# C9_list = ['16', '10', 'H', 'H']
+#
+# if C9 == C9_list:
+#     print("Case 9: PASS")
+# else: print("FAILED Case 9")
+
+
+
+
@@ -0,0 +1,178 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Move hints for a position and roll. HintService lists every legal move with LudoSolver.generate_moves
+# (the token or stacked pair moved, the space it lands on, the opponent tokens it kicks, and whether it finishes or
+# bounces back) and marks the move play_game would make, with the README priority that picks it. Hints are cached by
+# the compact GameState bytes and the roll, the least recently used dropped first, and hint_many answers a batch of
+# requests from many tables in one call, working out each distinct position only once.
+
+from collections import OrderedDict
+
+from LudoGame import BOARD_TOPOLOGY, LudoGame, TurnHook
+from LudoMetrics import ACTION_PRIORITY
+from LudoSolver import Move, TOKEN_NAMES, generate_moves
+
+REASONS = {
+    1: 'a 6 moves a token out of the home yard',
+    2: 'a token can land exactly on the finishing square',
+    3: 'a token can kick an opponent back to their home yard',
+    4: 'the token furthest from the finishing square moves',
+    None: 'no token can move',
+}
+
+
+class _TurnRecorder(TurnHook):
+    """Keeps the action a turn's policy picked and the token moves move_token reported for it"""
+    def __init__(self):
+        self.action = None
+        self.moves = []
+
+    def on_action(self, game, player, roll, action):
+        """Records the action, see TurnHook"""
+        self.action = action
+
+    def on_move(self, game, player, token_name, before, after, path, kick, kick_token):
+        """Records a move as (token index, steps before, steps after, path), see TurnHook"""
+        self.moves.append((TOKEN_NAMES.index(token_name), before, after, path))
+
+
+class Hint:
+    """The legal moves for a seat and roll, and the move play_game makes with the reason it picks it"""
+    __slots__ = ('_letters', '_seat', '_roll', '_moves', '_played', '_reason', '_error')
+
+    def __init__(self, letters, seat, roll, moves, played, reason, error):
+        self._letters = letters
+        self._seat = seat
+        self._roll = roll
+        self._moves = moves
+        self._played = played
+        self._reason = reason
+        self._error = error
+
+    def get_moves(self):
+        """Returns the list of legal Moves, see LudoSolver.Move"""
+        return self._moves
+
+    def get_played_move(self):
+        """Returns the Move play_game makes for the roll, None if it moves nothing or raises"""
+        return self._played
+
+    def get_reason(self):
+        """Returns why play_game makes its move, as the README priority that picks it"""
+        return self._reason
+
+    def get_error(self):
+        """Returns the name of the exception play_game raises for this roll, or None"""
+        return self._error
+
+    def is_played_legal(self):
+        """Returns True if the move play_game makes is one of the legal moves, the old rules sometimes differ"""
+        return self._played is not None and any(_move_key(move) == _move_key(self._played) for move in self._moves)
+
+    def describe(self, move):
+        """Returns a Move as a dict of names: token, from and to spaces, kicked opponent tokens, finish and bounce"""
+        topology = BOARD_TOPOLOGY[self._letters[move.seat]]
+        return {
+            'token': move.get_token_name(),
+            'from': topology.space_name(move.from_steps),
+            'to': topology.space_name(move.to_steps),
+            'kicks': [self._letters[opp] + TOKEN_NAMES[opp_token] for opp, opp_token, _ in move.kicked],
+            'finish': move.is_finish(),
+            'bounce': move.bounced,
+        }
+
+    def to_dict(self):
+        """Returns the hint as a JSON-ready dict for clients"""
+        return {
+            'seat': self._letters[self._seat],
+            'roll': self._roll,
+            'moves': [self.describe(move) for move in self._moves],
+            'played': None if self._played is None else self.describe(self._played),
+            'reason': self._reason,
+            'error': self._error,
+        }
+
+
+def _move_key(move):
+    """Returns the parts of a Move that say what it does, for comparing two Moves"""
+    return move.tokens, move.from_steps, move.to_steps, tuple(sorted(move.kicked)), move.bounced
+
+
+class HintService:
+    """Answers hint requests, caching at most max_entries hints by position and roll"""
+    def __init__(self, max_entries=100000, policy='readme'):
+        """policy is the registered TurnPolicy whose move is marked as the one play_game makes"""
+        self._max_entries = max_entries
+        self._policy = policy
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get_stats(self):
+        """Returns a dict of cache hits, misses and the number of cached hints"""
+        return {'hits': self._hits, 'misses': self._misses, 'cached': len(self._cache)}
+
+    def clear(self):
+        """Drops every cached hint"""
+        self._cache.clear()
+
+    def hint(self, state, letter, roll):
+        """Returns the Hint for the player at letter rolling roll in a GameState"""
+        key = (state.to_bytes(), letter, roll)
+        hint = self._cache.get(key)
+        if hint is not None:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return hint
+        self._misses += 1
+        hint = self._build(state, letter, roll)
+        self._cache[key] = hint
+        if len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+        return hint
+
+    def hint_many(self, requests):
+        """
+        Answers a batch of (state, letter, roll) requests, e.g. one per table, and returns their Hints in order. Tables
+        in the same position share one lookup
+        """
+        answered = {}
+        out = []
+        for state, letter, roll in requests:
+            key = (state.to_bytes(), letter, roll)
+            hint = answered.get(key)
+            if hint is None:
+                hint = answered[key] = self.hint(state, letter, roll)
+            out.append(hint)
+        return out
+
+    def _build(self, state, letter, roll):
+        """
+        Works out a Hint: the legal moves, then the move play_game makes, found by playing the roll on a copy and
+        reading the action and token moves the game reports. The played move is the matching legal Move, or one built
+        from the report when the old rules move differently
+        """
+        letters = state.get_letters()
+        seat = letters.index(letter)
+        steps = [state.get_steps(idx, token) for idx in range(len(letters)) for token in TOKEN_NAMES]
+        moves = generate_moves(letters, steps, seat, roll)
+
+        game = LudoGame.from_state(state, self._policy)
+        recorder = _TurnRecorder()
+        game.set_hook(recorder)
+        try:
+            game.apply_turn(letter, roll)
+        except Exception as error:
+            return Hint(letters, seat, roll, moves, None, 'play_game raises ' + type(error).__name__, type(error).__name__)
+        if not recorder.moves:
+            return Hint(letters, seat, roll, moves, None, REASONS[None], None)
+
+        after = [game.get_state().get_steps(idx, token) for idx in range(len(letters)) for token in TOKEN_NAMES]
+        token, from_steps, to_steps, _ = recorder.moves[0]
+        tokens = tuple(sorted({moved[0] for moved in recorder.moves}))
+        kicked = tuple((idx // 2, idx % 2, old) for idx, (old, new) in enumerate(zip(steps, after))
+                       if idx // 2 != seat and new == -1 < old)
+        played = Move(seat, tokens, from_steps, to_steps, kicked, any(moved[3] == 'bounce' for moved in recorder.moves))
+        played = next((move for move in moves if _move_key(move) == _move_key(played)), played)
+        return Hint(letters, seat, roll, moves, played, REASONS[ACTION_PRIORITY[recorder.action]], None)
@@ -0,0 +1,129 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Game history for LudoGame with random access to the board after any turn. Each turn is stored as a
+# delta: the GameState bytes it changed, two bytes per change (which byte, its new value), so a typical move costs
+# about five bytes. A full copy of the state is kept every checkpoint turns, so state_at(k) applies at most checkpoint
+# deltas.
+
+from array import array
+
+from LudoGame import LudoGame, GameState, DONE_OFFSET, MARK_OFFSET, SEAT_WIDTH, TOKEN_OFFSET, mark_to_pos
+
+# Name of each byte of a seat, by offset
+FIELDS = {TOKEN_OFFSET['p']: 'p_steps', TOKEN_OFFSET['q']: 'q_steps', MARK_OFFSET + TOKEN_OFFSET['p']: 'p_pos',
+          MARK_OFFSET + TOKEN_OFFSET['q']: 'q_pos', DONE_OFFSET: 'done'}
+
+
+class GameHistory:
+    """
+    Per-turn delta log of a game's GameState with a checkpoint every checkpoint turns. Turn k is the k-th turn played,
+    state_at(0) is the board before any turn
+    """
+    def __init__(self, state, checkpoint=64):
+        """
+        :param state: GameState the history starts from
+        :param checkpoint: number of turns between full copies of the state
+        """
+        if SEAT_WIDTH * state.get_seat_count() > 256:
+            raise ValueError("a history can record at most " + str(256 // SEAT_WIDTH) + " seats")
+        self._letters = state.get_letters()
+        self._checkpoint = checkpoint
+        self._checkpoints = [state.to_bytes()[len(self._letters):]]
+        self._current = bytearray(self._checkpoints[0])
+        self._log = bytearray()
+        self._offsets = array('I', [0])
+        self._error = None
+
+    def get_letters(self):
+        """Returns the seat letters of the recorded game"""
+        return self._letters
+
+    def get_turn_count(self):
+        """Returns the number of turns recorded"""
+        return len(self._offsets) - 1
+
+    def get_error(self):
+        """Returns (turn index, exception) for the turn that stopped record_game, or None"""
+        return self._error
+
+    def get_size_bytes(self):
+        """Returns the bytes used by the delta log, its offsets and the checkpoints"""
+        return (len(self._log) + self._offsets.itemsize * len(self._offsets)
+                + sum(len(saved) for saved in self._checkpoints))
+
+    def record(self, state):
+        """Appends the turn that took the game from the last recorded state to state"""
+        self.record_changes(state, range(len(self._letters)))
+
+    def record_changes(self, state, seats):
+        """
+        Same as record, but only compares the given seats, e.g. the seats in the undo entries of the turn. Every other
+        seat must be unchanged since the last recorded state
+        """
+        data = state.to_bytes()[len(self._letters):]
+        current = self._current
+        for seat in sorted(set(seats)):
+            for idx in range(seat * SEAT_WIDTH, (seat + 1) * SEAT_WIDTH):
+                if data[idx] != current[idx]:
+                    self._log.append(idx)
+                    self._log.append(data[idx])
+                    current[idx] = data[idx]
+        self._offsets.append(len(self._log))
+        if self.get_turn_count() % self._checkpoint == 0:
+            self._checkpoints.append(bytes(current))
+
+    def state_at(self, turn):
+        """Returns the GameState after the given number of turns"""
+        if not 0 <= turn <= self.get_turn_count():
+            raise IndexError("turn " + str(turn) + " is outside the history of " + str(self.get_turn_count()) + " turns")
+        base = turn // self._checkpoint
+        data = bytearray(self._checkpoints[base])
+        log = self._log
+        for idx in range(self._offsets[base * self._checkpoint], self._offsets[turn], 2):
+            data[log[idx]] = log[idx + 1]
+        return GameState(self._letters, data)
+
+    def get_changes(self, turn):
+        """
+        Returns what the given turn (1 for the first turn) changed as a list of (seat, field, new value), where field
+        is 'p_steps', 'q_steps', 'p_pos', 'q_pos' or 'done' and positions are decoded the way get_pos returns them
+        """
+        if not 1 <= turn <= self.get_turn_count():
+            raise IndexError("turn " + str(turn) + " is outside the history of " + str(self.get_turn_count()) + " turns")
+        changes = []
+        log = self._log
+        for idx in range(self._offsets[turn - 1], self._offsets[turn], 2):
+            seat, offset = divmod(log[idx], SEAT_WIDTH)
+            value = log[idx + 1]
+            field = FIELDS[offset]
+            if field == 'done':
+                value = value == 1
+            elif field.endswith('pos'):
+                value = mark_to_pos(self._letters[seat], value)
+            else:
+                value -= 1
+            changes.append((seat, field, value))
+        return changes
+
+
+def record_game(players, turns_list, checkpoint=64, policy='readme'):
+    """
+    Plays a game like LudoGame.play_game and returns its GameHistory. A turn that raises is rolled back and ends the
+    recording, the history's get_error returns the turn index and the exception
+    """
+    game = LudoGame(policy=policy)
+    game.set_players(players)
+    history = GameHistory(game.get_state(), checkpoint)
+    state = game.get_state()
+    undo = []
+    for idx, turn in enumerate(turns_list):
+        try:
+            game.apply_turn(turn[0], turn[1], undo)
+        except Exception as error:
+            game.unmake(undo)
+            history._error = (idx, error)
+            break
+        history.record_changes(state, [seat for entry in undo for seat, _ in entry])
+        undo.clear()
+    return history
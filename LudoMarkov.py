@@ -0,0 +1,146 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Exact Markov chain analytics for a single token's progress. A token's steps (-1 in the home yard up to
+# the finishing step) are the chain's states, and each roll's transition matrix is read off LudoEngine playing that
+# roll on a one token board with the same geometry, so the chain follows the same rules as the games: a 6 to leave the
+# home yard, an exact roll onto the finishing square and bouncing back off it. A turn is one roll plus, on a 6, one
+# bonus roll. Finish time distributions, expected remaining turns and race win probabilities are computed with NumPy
+# matrix operations and cached per board configuration. Kicks are left out, a token is assumed to race undisturbed.
+
+import numpy as np
+
+from LudoEngine import BoardConfig, LudoEngine, CLASSIC
+
+# A finish time distribution is cut off once less than this much probability is left unfinished
+TAIL_TOLERANCE = 1e-12
+MAX_TURNS = 100000
+
+
+class TokenChain:
+    """
+    The Markov chain of one token's steps on a board. State i is steps i - 1, so state 0 is the home yard and the
+    last state the finishing square, which is absorbing
+    """
+    def __init__(self, config):
+        self._finish = config.get_finish_step()
+        size = self._finish + 2
+        solo = BoardConfig(1, len(config.get_positions()), config.get_track_length(), config.get_last_board_step(),
+                           self._finish - config.get_last_board_step() - 1)
+        letter = solo.get_positions()[0]
+
+        self._rolls = np.zeros((6, size, size))
+        for steps in range(-1, self._finish + 1):
+            for roll in range(1, 7):
+                engine = LudoEngine(solo)
+                engine.set_players([letter])
+                engine.set_steps(letter, 0, steps)
+                engine.apply_turn(letter, roll)
+                self._rolls[roll - 1, steps + 1, engine.get_steps(letter, 0) + 1] = 1.0
+
+        one_roll = self._rolls.mean(axis=0)
+        self._turn = self._rolls[:5].sum(axis=0) / 6 + self._rolls[5] @ one_roll / 6
+        self._expected = None
+        self._cdf = None
+
+    def get_finish_step(self):
+        """Returns the finishing step, the chain's absorbing state"""
+        return self._finish
+
+    def get_roll_matrix(self, roll):
+        """Returns the 0/1 transition matrix for a single roll"""
+        return self._rolls[roll - 1]
+
+    def get_turn_matrix(self):
+        """Returns the transition matrix for a whole turn, a roll plus the bonus roll after a 6"""
+        return self._turn
+
+    def expected_turns(self, steps=None):
+        """
+        Returns the expected number of turns for a token at steps to finish, or an array of it for every steps from
+        -1 up to the finishing step when steps is None. Solved exactly from the chain's fundamental matrix
+        """
+        if self._expected is None:
+            transient = self._turn[:-1, :-1]
+            size = len(transient)
+            self._expected = np.append(np.linalg.solve(np.eye(size) - transient, np.ones(size)), 0.0)
+        if steps is None:
+            return self._expected
+        return float(self._expected[steps + 1])
+
+    def _finish_cdf(self):
+        """Returns the (turns + 1, states) array of the chance each state has finished within that many turns"""
+        if self._cdf is None:
+            turn = self._turn
+            reach = np.eye(len(turn))
+            columns = [reach[:, -1].copy()]
+            while columns[-1].min() < 1.0 - TAIL_TOLERANCE and len(columns) <= MAX_TURNS:
+                reach = reach @ turn
+                columns.append(reach[:, -1].copy())
+            self._cdf = np.array(columns)
+        return self._cdf
+
+    def finish_distribution(self, steps):
+        """
+        Returns an array whose entry t is the chance a token at steps finishes on exactly its t-th turn from now, cut
+        off once less than TAIL_TOLERANCE is left
+        """
+        cdf = self._finish_cdf()[:, steps + 1]
+        return np.diff(cdf, prepend=0.0)
+
+    def finish_within(self, steps, turns):
+        """Returns the chance a token at steps has finished within the given number of turns"""
+        cdf = self._finish_cdf()
+        return float(cdf[min(turns, len(cdf) - 1), steps + 1])
+
+    def race_win_probabilities(self, steps_list):
+        """
+        Returns each racer's chance of finishing first when single tokens at steps_list race, one turn each in list
+        order, so a racer finishing on its t-th turn wins if the racers before it are still going after t turns and the
+        racers after it are still going after t - 1 turns. The racers' finish times are independent since kicks are
+        left out
+        """
+        cdf = self._finish_cdf()
+        cols = [steps + 1 for steps in steps_list]
+        # survive[t, k]: chance racer k has not finished within t turns
+        survive = 1.0 - cdf[:, cols]
+        pmf = np.diff(cdf[:, cols], axis=0, prepend=0.0)
+        wins = np.zeros(len(cols))
+        for idx in range(len(cols)):
+            ahead = np.prod(survive[:, :idx], axis=1)
+            behind = np.prod(np.vstack((np.ones(len(cols) - idx - 1), survive[:-1, idx + 1:])), axis=1)
+            wins[idx] = float(np.sum(pmf[:, idx] * ahead * behind))
+        return wins
+
+
+# Built chains by board geometry, so every caller shares one chain and its cached results
+_CHAINS = {}
+
+
+def _config_key(config):
+    """Returns the part of a BoardConfig a single token's chain depends on"""
+    return len(config.get_positions()), config.get_track_length(), config.get_last_board_step(), config.get_finish_step()
+
+
+def get_chain(config=CLASSIC):
+    """Returns the TokenChain for a board configuration, building it on first use"""
+    key = _config_key(config)
+    chain = _CHAINS.get(key)
+    if chain is None:
+        chain = _CHAINS[key] = TokenChain(config)
+    return chain
+
+
+def expected_turns(steps, config=CLASSIC):
+    """Returns the expected number of turns for a token at steps to finish"""
+    return get_chain(config).expected_turns(steps)
+
+
+def finish_distribution(steps, config=CLASSIC):
+    """Returns the chance a token at steps finishes on exactly its t-th turn from now, for each t"""
+    return get_chain(config).finish_distribution(steps)
+
+
+def race_win_probabilities(steps_list, config=CLASSIC):
+    """Returns each token's chance of finishing first when tokens at steps_list race, one turn each in list order"""
+    return get_chain(config).race_win_probabilities(steps_list)
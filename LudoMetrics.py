@@ -0,0 +1,156 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Instrumentation for LudoGame. instrument(game) sets a GameMetrics as the game's TurnHook, so the game
+# reports each turn, the action its policy picks and the path each token move takes. A game without a hook skips
+# every report, so turns cost nothing extra when metrics are off. GameMetrics counts the decision branches and
+# move_token paths, times each turn and calls subscribers on moves, kicks, bounces and finishes.
+
+import time
+
+from LudoGame import ACTIONS, MOVE_PATHS, TurnHook
+
+EVENTS = ('move', 'kick', 'bounce', 'finish')
+
+# README priority of each action: 1 leave the home yard, 2 finish, 3 kick, 4 move the token furthest behind
+ACTION_PRIORITY = {name: (1 if 'yard' in name or 'enter_board' in name else
+                          2 if 'finish' in name else
+                          3 if name.startswith('kick') else
+                          None if name == 'pass' else 4) for name in ACTIONS}
+
+
+class GameMetrics(TurnHook):
+    """
+    Counters, turn timings and event subscribers for instrumented games. One GameMetrics can be shared by many games to
+    gather a whole workload
+    """
+    def __init__(self):
+        self._subscribers = {event: [] for event in EVENTS}
+        self._turn_start = 0
+        self.reset()
+
+    def reset(self):
+        """Zeroes every counter and timing, subscribers are kept"""
+        self._action_counts = dict.fromkeys(ACTIONS, 0)
+        self._path_counts = dict.fromkeys(MOVE_PATHS, 0)
+        self._turns = 0
+        self._turn_ns = 0
+        self._max_turn_ns = 0
+        self._errors = 0
+
+    def subscribe(self, event, callback):
+        """
+        Calls callback on every event of the given kind:
+            'move' and 'bounce' with (game, player, token name, steps before, steps after)
+            'kick' with (game, player, token name, opponent player, opponent token name)
+            'finish' with (game, player, token name)
+        """
+        if event not in self._subscribers:
+            raise ValueError("unknown event " + repr(event) + ", expected one of " + ', '.join(EVENTS))
+        self._subscribers[event].append(callback)
+
+    def unsubscribe(self, event, callback):
+        """Stops calling a callback added with subscribe"""
+        self._subscribers[event].remove(callback)
+
+    def get_action_counts(self):
+        """Returns {action name: number of turns that took it}"""
+        return dict(self._action_counts)
+
+    def get_priority_counts(self):
+        """Returns {README priority 1 - 4, or None for no move: number of turns decided by it}"""
+        counts = {1: 0, 2: 0, 3: 0, 4: 0, None: 0}
+        for name, count in self.get_action_counts().items():
+            counts[ACTION_PRIORITY[name]] += count
+        return counts
+
+    def get_path_counts(self):
+        """Returns {move_token path: number of token moves that took it}"""
+        return dict(self._path_counts)
+
+    def get_turn_count(self):
+        """Returns the number of turns played"""
+        return self._turns
+
+    def get_error_count(self):
+        """Returns the number of turns that raised"""
+        return self._errors
+
+    def get_total_turn_ns(self):
+        """Returns the total time spent in apply_turn in nanoseconds"""
+        return self._turn_ns
+
+    def get_mean_turn_ns(self):
+        """Returns the mean apply_turn time in nanoseconds"""
+        return self._turn_ns / max(self._turns, 1)
+
+    def get_max_turn_ns(self):
+        """Returns the slowest apply_turn time in nanoseconds"""
+        return self._max_turn_ns
+
+    def on_turn(self, game, player_letter, roll):
+        """Starts timing a turn, see TurnHook"""
+        self._turn_start = time.perf_counter_ns()
+
+    def on_action(self, game, player, roll, action):
+        """Counts the action a turn takes, see TurnHook"""
+        self._action_counts[action] += 1
+
+    def on_move(self, game, player, token_name, before, after, path, kick, kick_token):
+        """Counts a token move's path and calls the subscribers, see TurnHook"""
+        self._path_counts[path] += 1
+        subscribers = self._subscribers
+        for callback in subscribers['move']:
+            callback(game, player, token_name, before, after)
+        if path == 'kick':
+            for callback in subscribers['kick']:
+                callback(game, player, token_name, kick, kick_token)
+        elif path == 'bounce':
+            for callback in subscribers['bounce']:
+                callback(game, player, token_name, before, after)
+        if after == player.get_topology().get_finish_step() != before:
+            for callback in subscribers['finish']:
+                callback(game, player, token_name)
+
+    def on_turn_end(self, game, player_letter, roll, error):
+        """Times the turn and counts it, and counts it as an error if it raised, see TurnHook"""
+        elapsed = time.perf_counter_ns() - self._turn_start
+        self._turns += 1
+        self._turn_ns += elapsed
+        if elapsed > self._max_turn_ns:
+            self._max_turn_ns = elapsed
+        if error is not None:
+            self._errors += 1
+
+    def as_dict(self):
+        """Returns every counter and timing in one dict"""
+        return {
+            'turns': self._turns,
+            'errors': self._errors,
+            'total_turn_ns': self._turn_ns,
+            'mean_turn_ns': self.get_mean_turn_ns(),
+            'max_turn_ns': self._max_turn_ns,
+            'actions': self.get_action_counts(),
+            'priorities': self.get_priority_counts(),
+            'move_paths': self.get_path_counts(),
+        }
+
+
+def instrument(game, metrics=None):
+    """
+    Sets a GameMetrics as game's TurnHook and returns it (a new one if metrics is None). Any hook the game already had
+    is replaced
+    """
+    if metrics is None:
+        metrics = GameMetrics()
+    game.set_hook(metrics)
+    return metrics
+
+
+def uninstrument(game):
+    """Takes an instrumented game's GameMetrics off it and returns it, None if the game wasn't instrumented"""
+    metrics = game.get_hook()
+    if not isinstance(metrics, GameMetrics):
+        return None
+    game.set_hook(None)
+    return metrics
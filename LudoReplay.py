@@ -0,0 +1,167 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Binary replay files for large sets of recorded Ludo games. A replay file is a short header, every game
+# in the LudoBatch.pack_game format (a seat count and turn count header, the seat letters, then one byte per turn with
+# the rolling letter's index in POSITIONS in bits 3-4, not its seat number, and the roll in bits 0-2), an index of the
+# games' offsets and a footer pointing at the index.
+# ReplayReader memory-maps the file and hands out the games' turns as zero-copy memoryviews that play_packed reads
+# straight from the mapping. Converters to and from the list-of-tuples form (and JSON) are included.
+
+import json
+import mmap
+import struct
+from array import array
+
+from LudoBatch import pack_game, play_packed, unpack_turns, _GAME_HEADER
+
+MAGIC = b'LUDR'
+VERSION = 1
+_FILE_HEADER = struct.Struct('<4sH')
+# Footer: offset of the index, number of games, then the magic again so a truncated file is caught
+_FOOTER = struct.Struct('<QQ4s')
+
+
+class ReplayWriter:
+    """Writes games to a replay file one at a time, use as a context manager or call close when done"""
+    def __init__(self, path):
+        self._file = open(path, 'wb')
+        self._file.write(_FILE_HEADER.pack(MAGIC, VERSION))
+        self._offsets = array('Q')
+
+    def add_game(self, players, turns_list):
+        """Appends a game given in list-of-tuples form, e.g. (['A', 'B'], [('A', 6), ('A', 4)])"""
+        self._offsets.append(self._file.tell())
+        self._file.write(pack_game(players, turns_list))
+
+    def add_packed(self, letters, turns):
+        """Appends a game that's already packed: a string of seat letters and bytes of packed turns"""
+        self._offsets.append(self._file.tell())
+        self._file.write(_GAME_HEADER.pack(len(letters), len(turns)))
+        self._file.write(letters.encode('ascii'))
+        self._file.write(turns)
+
+    def get_game_count(self):
+        """Returns the number of games written so far"""
+        return len(self._offsets)
+
+    def close(self):
+        """Writes the index and footer and closes the file"""
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._file.write(self._offsets.tobytes())
+        self._file.write(_FOOTER.pack(index_offset, len(self._offsets), MAGIC))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ReplayReader:
+    """
+    Memory-mapped reader over a replay file. Games are read by index or in order as (letters, turns) where turns is a
+    memoryview into the mapping, so nothing is copied until a turn is read. The views stay readable after close, the
+    file is unmapped once the last of them is dropped
+    """
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        magic, version = _FILE_HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or len(self._view) < _FILE_HEADER.size + _FOOTER.size:
+            self.close()
+            raise ValueError(str(path) + " is not a replay file")
+        if version != VERSION:
+            self.close()
+            raise ValueError("replay file version " + str(version) + " isn't supported, expected " + str(VERSION))
+        index_offset, count, end_magic = _FOOTER.unpack_from(self._view, len(self._view) - _FOOTER.size)
+        if end_magic != MAGIC:
+            self.close()
+            raise ValueError(str(path) + " is truncated, its index is missing")
+        self._offsets = self._view[index_offset:index_offset + 8 * count].cast('Q')
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, idx):
+        """Returns (letters, turns memoryview) for the game at idx"""
+        offset = self._offsets[idx]
+        seat_count, turn_count = _GAME_HEADER.unpack_from(self._view, offset)
+        offset += _GAME_HEADER.size
+        letters = bytes(self._view[offset:offset + seat_count]).decode('ascii')
+        offset += seat_count
+        return letters, self._view[offset:offset + turn_count]
+
+    def __iter__(self):
+        for idx in range(len(self._offsets)):
+            yield self[idx]
+
+    def get_turns(self, idx):
+        """Returns the game at idx in list-of-tuples form: (list of seat letters, list of turn tuples)"""
+        letters, turns = self[idx]
+        return list(letters), list(unpack_turns(turns))
+
+    def play(self, idx):
+        """Plays the game at idx straight from the mapping and returns its final GameState"""
+        letters, turns = self[idx]
+        return play_packed(letters, turns)
+
+    def close(self):
+        """
+        Releases the index view and unmaps the file. Turns views still held, such as the loop variable of a for loop
+        over the reader, keep the mapping alive until the last of them is dropped
+        """
+        if self._file.closed:
+            return
+        if hasattr(self, '_offsets'):
+            self._offsets.release()
+        self._view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_replay(path, games):
+    """Writes an iterable of (players, turns_list) games to a replay file, returns the number of games written"""
+    with ReplayWriter(path) as writer:
+        for players, turns_list in games:
+            writer.add_game(players, turns_list)
+        return writer.get_game_count()
+
+
+def read_replay(path):
+    """Yields every game in a replay file in list-of-tuples form, (list of seat letters, list of turn tuples)"""
+    with ReplayReader(path) as reader:
+        for idx in range(len(reader)):
+            yield reader.get_turns(idx)
+
+
+def json_to_replay(json_path, replay_path):
+    """
+    Converts a JSON file holding a list of [players, turns] games, with each turn a [letter, roll] pair, into a replay
+    file. Returns the number of games converted
+    """
+    with open(json_path) as raw:
+        games = json.load(raw)
+    return write_replay(replay_path, ((players, turns) for players, turns in games))
+
+
+def replay_to_json(replay_path, json_path):
+    """Converts a replay file back into the JSON form read by json_to_replay, returns the number of games converted"""
+    games = [[players, [list(turn) for turn in turns]] for players, turns in read_replay(replay_path)]
+    with open(json_path, 'w') as out:
+        json.dump(games, out)
+    return len(games)
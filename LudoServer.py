@@ -0,0 +1,364 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: asyncio server hosting many live LudoGame tables in one process, plus a load generator. Each table has
+# its own command queue and worker task, so commands on one table run in order without any lock shared between tables.
+# Clients speak a newline-delimited text protocol over TCP or a Unix socket:
+#     JOIN <table> <seat letters>    creates the table (or checks its seats)  -> OK JOIN <table> <letters>
+#     ROLL <table> <letter> <roll>   plays one turn                           -> OK ROLL <table> <token spaces>
+#     STATE <table>                  reads the board                          -> OK STATE <table> <letters> <spaces>
+#     QUIT                           closes the connection
+# token spaces are comma separated in seat order, errors come back as ERR <reason>, and lines must be ASCII. A
+# connection's commands are answered in order and the next line isn't read until the last answer is written out, so a
+# slow client is throttled by its own socket, and a full table queue holds up the connections feeding it.
+# Run python LudoServer.py serve --port 8765, then python LudoServer.py load --port 8765 --tables 1000
+# python LudoServer.py check runs the PROTOCOL_CASES against a server of its own
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+
+from LudoGame import LudoGame, POSITIONS, seat_letters
+
+
+class Table:
+    """One live game and the queue its commands are played from"""
+    def __init__(self, name, letters, queue_size):
+        self._name = name
+        self._game = LudoGame()
+        self._game.set_players(letters)
+        self._queue = asyncio.Queue(queue_size)
+        self._task = asyncio.ensure_future(self._run())
+        self._turns = 0
+
+    def get_name(self):
+        """Returns the table's name"""
+        return self._name
+
+    def get_letters(self):
+        """Returns the table's seat letters"""
+        return self._game.get_state().get_letters()
+
+    def get_turn_count(self):
+        """Returns the number of turns played at the table"""
+        return self._turns
+
+    async def submit(self, command, *args):
+        """Queues a command ('roll' or 'state') and returns its response line once the table has played it"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((command, args, future))
+        return await future
+
+    async def _run(self):
+        """Plays the table's commands one at a time, in the order they were queued"""
+        while True:
+            command, args, future = await self._queue.get()
+            try:
+                response = self._roll(*args) if command == 'roll' else self._state()
+            except Exception as error:
+                response = 'ERR ' + type(error).__name__ + ' ' + str(error)
+            if not future.cancelled():
+                future.set_result(response)
+
+    def _roll(self, letter, roll):
+        """Plays one turn, a turn that raises is rolled back so the table stays playable"""
+        undo = []
+        try:
+            self._game.apply_turn(letter, roll, undo)
+        except Exception:
+            self._game.unmake(undo)
+            raise
+        self._turns += 1
+        return 'OK ROLL ' + self._name + ' ' + ','.join(self._game.get_token_spaces())
+
+    def _state(self):
+        """Returns the STATE response line"""
+        return 'OK STATE ' + self._name + ' ' + self.get_letters() + ' ' + ','.join(self._game.get_token_spaces())
+
+    def close(self):
+        """Stops the table's worker task"""
+        self._task.cancel()
+
+
+class LudoServer:
+    """Hosts tables by name and serves the line protocol to any number of connections"""
+    def __init__(self, queue_size=64, max_tables=100000, max_line=256):
+        """
+        :param queue_size: commands a table holds before connections feeding it have to wait
+        :param max_tables: most tables the server hosts at once
+        :param max_line: longest command line accepted, in bytes
+        """
+        self._tables = {}
+        self._queue_size = queue_size
+        self._max_tables = max_tables
+        self._max_line = max_line
+        self._server = None
+
+    def get_table(self, name):
+        """Returns the Table with the given name, or None"""
+        return self._tables.get(name)
+
+    def get_table_count(self):
+        """Returns the number of tables hosted"""
+        return len(self._tables)
+
+    async def start(self, host='127.0.0.1', port=8765, path=None):
+        """Starts listening on a Unix socket at path if given, otherwise on host and port"""
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._serve, path, limit=self._max_line)
+        else:
+            self._server = await asyncio.start_server(self._serve, host, port, limit=self._max_line)
+        return self._server
+
+    async def serve_forever(self):
+        """Serves until cancelled"""
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stops listening and stops every table"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for table in self._tables.values():
+            table.close()
+        self._tables.clear()
+
+    async def handle_line(self, line):
+        """Returns the response line for one command line"""
+        parts = line.split()
+        if len(parts) == 0:
+            return 'ERR empty command'
+        command = parts[0].upper()
+        if command == 'JOIN' and len(parts) == 3:
+            return self._join(parts[1], parts[2])
+        if command == 'ROLL' and len(parts) == 4:
+            table = self._tables.get(parts[1])
+            if table is None:
+                return 'ERR no table ' + parts[1]
+            if parts[2] not in POSITIONS or parts[2] not in table.get_letters():
+                return 'ERR no seat ' + parts[2] + ' at table ' + parts[1]
+            if parts[3] not in ('1', '2', '3', '4', '5', '6'):
+                return 'ERR roll must be 1 - 6'
+            return await table.submit('roll', parts[2], int(parts[3]))
+        if command == 'STATE' and len(parts) == 2:
+            table = self._tables.get(parts[1])
+            if table is None:
+                return 'ERR no table ' + parts[1]
+            return await table.submit('state')
+        return 'ERR bad command ' + line.strip()[:40]
+
+    def _join(self, name, letters):
+        """Creates a table, or checks an existing one has the same seats"""
+        if seat_letters(letters) != letters or len(letters) < 2:
+            return 'ERR seats must be 2 or more of ' + ''.join(POSITIONS)
+        table = self._tables.get(name)
+        if table is None:
+            if len(self._tables) >= self._max_tables:
+                return 'ERR table limit reached'
+            table = self._tables[name] = Table(name, letters, self._queue_size)
+        elif table.get_letters() != letters:
+            return 'ERR table ' + name + ' has seats ' + table.get_letters()
+        return 'OK JOIN ' + name + ' ' + letters
+
+    async def _serve(self, reader, writer):
+        """Answers one connection's commands in order until QUIT or the connection closes"""
+        try:
+            while True:
+                try:
+                    raw = await reader.readline()
+                except ValueError:
+                    writer.write(b'ERR line too long\n')
+                    break
+                if not raw:
+                    break
+                try:
+                    line = raw.decode('ascii')
+                except UnicodeDecodeError:
+                    writer.write(b'ERR commands must be ASCII\n')
+                    await writer.drain()
+                    continue
+                if line.strip().upper() == 'QUIT':
+                    break
+                writer.write((await self.handle_line(line) + '\n').encode('ascii', 'replace'))
+                await writer.drain()
+# A handler cancelled by the server shutting down just closes its connection
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _open(host, port, path):
+    """Opens a client connection to the server"""
+    if path is not None:
+        return await asyncio.open_unix_connection(path)
+    return await asyncio.open_connection(host, port)
+
+
+class _Client:
+    """A load generator connection: lines are pipelined and answers matched to requests in order"""
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._pending = asyncio.Queue()
+        self._task = asyncio.ensure_future(self._read())
+
+    async def request(self, line):
+        """Sends a command line and returns its response line"""
+        future = asyncio.get_running_loop().create_future()
+        await self._pending.put(future)
+        self._writer.write((line + '\n').encode('ascii'))
+        await self._writer.drain()
+        return await future
+
+    async def _read(self):
+        """Hands each response line to the oldest request waiting for one"""
+        while True:
+            raw = await self._reader.readline()
+            future = await self._pending.get()
+            if not raw:
+                future.set_exception(ConnectionError('server closed the connection'))
+                return
+            future.set_result(raw.decode('ascii').rstrip('\n'))
+
+    async def close(self):
+        """Sends QUIT and closes the connection"""
+        self._writer.write(b'QUIT\n')
+        self._task.cancel()
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def run_load(host='127.0.0.1', port=8765, path=None, tables=1000, rolls=20, connections=50, interval=0.0,
+                   seats='ABCD', seed=0):
+    """
+    Plays rolls turns on each of tables tables spread over connections connections and returns a dict with the
+    number of rolls, errors, rolls/sec and the p50/p99 roll-to-response latency in milliseconds
+    :param interval: mean seconds between a table's rolls, 0 to roll as fast as the server answers
+    """
+    rng = random.Random(seed)
+    clients = [_Client(*await _open(host, port, path)) for _ in range(connections)]
+    latencies = []
+    errors = 0
+
+    async def play_table(idx):
+        nonlocal errors
+        client = clients[idx % connections]
+        name = 'load%d' % idx
+        await client.request('JOIN %s %s' % (name, seats))
+        seat = 0
+        bonus = False
+        for _ in range(rolls):
+            if interval > 0:
+                await asyncio.sleep(rng.uniform(0, 2 * interval))
+            roll = rng.randint(1, 6)
+            start = time.perf_counter()
+            response = await client.request('ROLL %s %s %d' % (name, seats[seat], roll))
+            latencies.append(time.perf_counter() - start)
+            if not response.startswith('OK'):
+                errors += 1
+            if roll == 6 and not bonus:
+                bonus = True
+            else:
+                bonus = False
+                seat = (seat + 1) % len(seats)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(play_table(idx) for idx in range(tables)))
+    elapsed = time.perf_counter() - start
+    for client in clients:
+        await client.close()
+
+    latencies.sort()
+    return {
+        'tables': tables,
+        'rolls': len(latencies),
+        'errors': errors,
+        'seconds': elapsed,
+        'rolls_per_sec': len(latencies) / elapsed,
+        'p50_ms': 1000 * latencies[len(latencies) // 2] if latencies else 0.0,
+        'p99_ms': 1000 * latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))] if latencies else 0.0,
+    }
+
+
+# Protocol checks: (raw command line, expected response line), sent in order over one connection to a fresh server
+PROTOCOL_CASES = (
+    (b'JOIN t1 AB', 'OK JOIN t1 AB'),
+    (b'ROLL t1 A 6', 'OK ROLL t1 R,H,H,H'),
+    (b'ROLL t1 A 9', 'ERR roll must be 1 - 6'),
+    (b'ROLL t1 C 6', 'ERR no seat C at table t1'),
+    (b'ROLL t\xc3\xa9 A 6', 'ERR commands must be ASCII'),
+    (b'STATE t1', 'OK STATE t1 AB R,H,H,H'),
+    (b'', 'ERR empty command'),
+)
+
+
+async def check_protocol(cases=PROTOCOL_CASES):
+    """
+    Starts a server on a free local port, sends each case's line over one connection and returns a list of
+    (line, expected, response) for the cases answered differently
+    """
+    server = LudoServer()
+    await server.start(port=0)
+    port = server._server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    failures = []
+    try:
+        for line, expected in cases:
+            writer.write(line + b'\n')
+            await writer.drain()
+            response = (await reader.readline()).decode('ascii').rstrip('\n')
+            if response != expected:
+                failures.append((line, expected, response))
+    finally:
+        writer.close()
+        await server.close()
+    return failures
+
+
+def main(argv=None):
+    """
+    Command line entry point: serve, load to run the load generator against a running server, or check to run the
+    PROTOCOL_CASES against a server of its own
+    """
+    parser = argparse.ArgumentParser(description='Ludo table server and load generator')
+    parser.add_argument('mode', choices=('serve', 'load', 'check'))
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='Unix socket path to use instead of TCP')
+    parser.add_argument('--tables', type=int, default=1000, help='load: number of tables')
+    parser.add_argument('--rolls', type=int, default=20, help='load: rolls per table')
+    parser.add_argument('--connections', type=int, default=50, help='load: client connections')
+    parser.add_argument('--interval', type=float, default=0.0, help='load: mean seconds between rolls per table')
+    args = parser.parse_args(argv)
+
+    if args.mode == 'check':
+        failures = asyncio.run(check_protocol())
+        for line, expected, response in failures:
+            print('%r: expected %r, got %r' % (line, expected, response))
+        print('%d protocol cases, %d failures' % (len(PROTOCOL_CASES), len(failures)))
+        return 1 if failures else 0
+
+    if args.mode == 'serve':
+        async def serve():
+            server = LudoServer()
+            await server.start(args.host, args.port, args.unix)
+            await server.serve_forever()
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    result = asyncio.run(run_load(args.host, args.port, args.unix, args.tables, args.rolls, args.connections,
+                                  args.interval))
+    print('%(tables)d tables, %(rolls)d rolls, %(errors)d errors in %(seconds).2f s: %(rolls_per_sec).0f rolls/s, '
+          'p50 %(p50_ms).2f ms, p99 %(p99_ms).2f ms' % result)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,197 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Session manager for hosting more games than fit in memory. SessionManager keeps at most max_hot games
+# as live LudoGame objects, in least recently used order. When a new game pushes it over the cap, the coldest game is
+# written to a store as its GameState bytes (6 bytes per seat plus its policy name) and dropped from memory, and it is
+# rebuilt with LudoGame.from_state the next time it's used. SqliteStore keeps games in a SQLite database, DirectoryStore
+# as one small file per game.
+
+import os
+import sqlite3
+from collections import OrderedDict
+
+from LudoGame import LudoGame, GameState
+
+
+class SqliteStore:
+    """Spilled games in a SQLite table, path ':memory:' keeps them in a private in-memory database"""
+    def __init__(self, path, commit_every=256):
+        """commit_every is the number of writes between commits, close commits the rest"""
+        self._db = sqlite3.connect(path)
+        self._db.execute('CREATE TABLE IF NOT EXISTS sessions (name TEXT PRIMARY KEY, policy TEXT, state BLOB)')
+        self._commit_every = commit_every
+        self._writes = 0
+
+    def put(self, name, policy, raw):
+        """Saves a game's policy name and GameState bytes"""
+        self._db.execute('INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)', (name, policy, raw))
+        self._writes += 1
+        if self._writes % self._commit_every == 0:
+            self._db.commit()
+
+    def get(self, name):
+        """Returns (policy name, GameState bytes) for a saved game, or None"""
+        return self._db.execute('SELECT policy, state FROM sessions WHERE name = ?', (name,)).fetchone()
+
+    def delete(self, name):
+        """Forgets a saved game"""
+        self._db.execute('DELETE FROM sessions WHERE name = ?', (name,))
+
+    def count(self):
+        """Returns the number of saved games"""
+        return self._db.execute('SELECT COUNT(*) FROM sessions').fetchone()[0]
+
+    def close(self):
+        """Commits and closes the database"""
+        self._db.commit()
+        self._db.close()
+
+
+class DirectoryStore:
+    """Spilled games as one file per game in a directory, the file holds the policy name line and the state bytes"""
+    def __init__(self, path):
+        os.makedirs(path, exist_ok=True)
+        self._path = path
+
+    def _file(self, name):
+        """Returns the file path for a game name, names are hex encoded so any string is a safe file name"""
+        return os.path.join(self._path, name.encode('utf-8').hex() + '.ludo')
+
+    def put(self, name, policy, raw):
+        """Saves a game's policy name and GameState bytes"""
+        with open(self._file(name), 'wb') as out:
+            out.write(policy.encode('utf-8') + b'\n' + raw)
+
+    def get(self, name):
+        """Returns (policy name, GameState bytes) for a saved game, or None"""
+        try:
+            with open(self._file(name), 'rb') as saved:
+                policy, raw = saved.read().split(b'\n', 1)
+        except FileNotFoundError:
+            return None
+        return policy.decode('utf-8'), raw
+
+    def delete(self, name):
+        """Forgets a saved game"""
+        try:
+            os.remove(self._file(name))
+        except FileNotFoundError:
+            pass
+
+    def count(self):
+        """Returns the number of saved games"""
+        return sum(1 for entry in os.listdir(self._path) if entry.endswith('.ludo'))
+
+    def close(self):
+        """Nothing to release, every write goes straight to its file"""
+
+
+class SessionManager:
+    """
+    Named LudoGame sessions with at most max_hot of them in memory, the rest spilled to a store. Any method that uses a
+    session makes it the most recently used one
+    """
+    def __init__(self, store=None, max_hot=10000):
+        """
+        :param store: SqliteStore, DirectoryStore or anything with the same put/get/delete/count/close methods, None
+        for an in-memory SqliteStore
+        :param max_hot: most games kept in memory as LudoGame objects
+        """
+        self._store = SqliteStore(':memory:') if store is None else store
+        self._max_hot = max_hot
+        self._hot = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def create(self, name, players, policy='readme'):
+        """Starts a new session with the given seats and returns its game, raises ValueError if the name is taken"""
+        if name in self._hot or self._store.get(name) is not None:
+            raise ValueError("session " + repr(name) + " already exists")
+        game = LudoGame(policy=policy)
+        game.set_players(players)
+        self._add_hot(name, game)
+        return game
+
+    def get(self, name):
+        """Returns the session's game, loading it from the store if it was spilled. Raises KeyError for an unknown name"""
+        game = self._hot.get(name)
+        if game is not None:
+            self._hits += 1
+            self._hot.move_to_end(name)
+            return game
+
+        saved = self._store.get(name)
+        if saved is None:
+            raise KeyError(name)
+        self._misses += 1
+        policy, raw = saved
+        game = LudoGame.from_state(GameState.from_bytes(bytes(raw)), policy)
+# The game lives in memory from now on, a copy left in the store would go stale and be counted twice
+        self._store.delete(name)
+        self._add_hot(name, game)
+        return game
+
+    def apply_turn(self, name, player_letter, roll):
+        """
+        Plays one turn in a session and returns the token spaces, see LudoGame.apply_turn. A turn that raises is rolled
+        back before the error is passed on, so a half played turn is never spilled to the store
+        """
+        game = self.get(name)
+        undo = []
+        try:
+            game.apply_turn(player_letter, roll, undo)
+        except Exception:
+            game.unmake(undo)
+            raise
+        return game.get_token_spaces()
+
+    def get_token_spaces(self, name):
+        """Returns the session's token spaces"""
+        return self.get(name).get_token_spaces()
+
+    def close_session(self, name):
+        """Ends a session, removing it from memory and the store"""
+        self._hot.pop(name, None)
+        self._store.delete(name)
+
+    def __contains__(self, name):
+        return name in self._hot or self._store.get(name) is not None
+
+    def _add_hot(self, name, game):
+        """Adds a game to memory, spilling the least recently used games over the cap"""
+        self._hot[name] = game
+        while len(self._hot) > self._max_hot:
+            old_name, old_game = self._hot.popitem(last=False)
+            self._spill(old_name, old_game)
+            self._evictions += 1
+
+    def _spill(self, name, game):
+        """Writes a game to the store"""
+        self._store.put(name, game.get_policy().name, game.get_state().to_bytes())
+
+    def flush(self):
+        """Writes every game in memory to the store, they stay in memory too"""
+        for name, game in self._hot.items():
+            self._spill(name, game)
+
+    def close(self):
+        """Writes every game in memory to the store and closes it"""
+        self.flush()
+        self._hot.clear()
+        self._store.close()
+
+    def get_stats(self):
+        """
+        Returns a dict of hits, misses (loads from the store), evictions, the number of games in memory and the number
+        in the store. A game is in one or the other, except after flush, which leaves copies of the games in memory in
+        the store too
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'hot': len(self._hot),
+            'stored': self._store.count(),
+        }
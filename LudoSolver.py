@@ -0,0 +1,306 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Expectimax move solver for Ludo. From any GameState it searches chance nodes (the die roll) and
+# decision nodes (which token to move) to find the move that maximizes the mover's chance of finishing first, instead
+# of the fixed README priority rules used by play_game. Positions are memoized in a bounded transposition table keyed
+# by Zobrist hashes that are updated incrementally as moves are made and unmade.
+
+import random
+import time
+from collections import OrderedDict
+
+from LudoGame import BOARD_TOPOLOGY, BoardTopology
+
+_FINISH = BoardTopology.finish_step
+_LAST_BOARD = BoardTopology.last_board_step
+TOKEN_NAMES = ('p', 'q')
+
+
+class Move:
+    """
+    One legal move for a roll: the token(s) moved, their steps before and after, the opponent tokens sent home as
+    (seat, token index, steps) and whether the token bounced back off the finishing square
+    """
+    __slots__ = ('seat', 'tokens', 'from_steps', 'to_steps', 'kicked', 'bounced')
+
+    def __init__(self, seat, tokens, from_steps, to_steps, kicked, bounced):
+        self.seat = seat
+        self.tokens = tokens
+        self.from_steps = from_steps
+        self.to_steps = to_steps
+        self.kicked = kicked
+        self.bounced = bounced
+
+    def get_token_name(self):
+        """Returns 'p', 'q', or 'pq' for a stacked pair moving together"""
+        return ''.join(TOKEN_NAMES[token] for token in self.tokens)
+
+    def is_finish(self):
+        """Returns True if the move lands on the finishing square"""
+        return self.to_steps == _FINISH
+
+
+def advance(steps, roll):
+    """
+    Returns (new steps, bounced) for a token moved by roll under the README rules, or None if the token can't move: a
+    token in the home yard needs a 6 to reach the ready to go position, a finished token stays put, and a roll past the
+    finishing square bounces back the remaining steps
+    """
+    if steps == -1:
+        return (0, False) if roll == 6 else None
+    if steps == _FINISH:
+        return None
+    new = steps + roll
+    if new > _FINISH:
+        return 2 * _FINISH - new, True
+    return new, False
+
+
+def generate_moves(letters, steps, seat, roll):
+    """
+    Returns the legal Moves for the seat's player and roll. steps is a flat list of token steps, 2 per seat (p then q).
+    Two tokens on the same space past the ready to go position are stacked and move as one piece. A token ending its
+    move on a main track square sends every opponent token on that square home
+    """
+    base = 2 * seat
+    p_steps = steps[base]
+    q_steps = steps[base + 1]
+    stacked = p_steps == q_steps and 0 < p_steps < _FINISH
+    moves = []
+    for token in ((0,) if stacked else (0, 1)):
+        cur = steps[base + token]
+        step = advance(cur, roll)
+        if step is None:
+            continue
+        new, bounced = step
+        kicked = ()
+        if 0 < new <= _LAST_BOARD:
+            square = BOARD_TOPOLOGY[letters[seat]].square(new)
+            kicked = tuple((opp, opp_token, steps[2 * opp + opp_token])
+                           for opp in range(len(letters)) if opp != seat
+                           for opp_token in (0, 1)
+                           if BOARD_TOPOLOGY[letters[opp]].square(steps[2 * opp + opp_token]) == square)
+        moves.append(Move(seat, (0, 1) if stacked else (token,), cur, new, kicked, bounced))
+    return moves
+
+
+class SolverResult:
+    """Outcome of ExpectimaxSolver.solve"""
+    def __init__(self, letters, best_move, values, depth, nodes, table_hits):
+        self._letters = letters
+        self._best_move = best_move
+        self._values = values
+        self._depth = depth
+        self._nodes = nodes
+        self._table_hits = table_hits
+
+    def get_best_move(self):
+        """Returns the best Move for the given roll, None if no roll was given or no token can move"""
+        return self._best_move
+
+    def get_values(self):
+        """Returns {letter: value}, each seat's estimated chance of finishing first at the deepest completed search"""
+        return dict(zip(self._letters, self._values))
+
+    def get_depth(self):
+        """Returns the deepest search (in rolls) that finished within the time budget"""
+        return self._depth
+
+    def get_nodes(self):
+        """Returns the number of nodes searched"""
+        return self._nodes
+
+    def get_table_hits(self):
+        """Returns the number of transposition table hits"""
+        return self._table_hits
+
+
+class _Timeout(Exception):
+    """Raised inside the search when the time budget runs out"""
+
+
+class ExpectimaxSolver:
+    """
+    Expectimax search over Ludo positions. Each node's value is a list with every seat's chance of finishing first;
+    a decision node takes the move best for the player moving. The transposition table keeps at most max_entries
+    positions, when full it evicts the shallowest of the least recently used few
+    """
+    def __init__(self, max_entries=500000, seed=0, evict_window=4):
+        """
+        :param max_entries: transposition table size limit
+        :param seed: seed for the Zobrist keys
+        :param evict_window: number of least recently used entries compared by depth when evicting
+        """
+        rng = random.Random(seed)
+# _token_keys[seat][token][steps + 1] and _turn_keys[seat][bonus] are XORed together to hash a position
+        self._token_keys = [[[rng.getrandbits(64) for _ in range(_FINISH + 2)] for _ in range(2)] for _ in range(4)]
+        self._turn_keys = [[rng.getrandbits(64) for _ in range(2)] for _ in range(4)]
+        self._table = OrderedDict()
+        self._letters = None
+        self._max_entries = max_entries
+        self._evict_window = evict_window
+        self._nodes = 0
+        self._table_hits = 0
+        self._deadline = None
+
+    def get_table_size(self):
+        """Returns the number of positions in the transposition table"""
+        return len(self._table)
+
+    def clear(self):
+        """Empties the transposition table"""
+        self._table.clear()
+
+    def hash_position(self, steps, seat, bonus):
+        """Returns the Zobrist hash of a position with seat due to roll"""
+        return self._hash_tokens(steps) ^ self._turn_keys[seat][bonus]
+
+    def _hash_tokens(self, steps):
+        """Returns the Zobrist hash of the token steps alone, kept up to date by _make and _unmake"""
+        key = 0
+        for idx, token_steps in enumerate(steps):
+            key ^= self._token_keys[idx // 2][idx % 2][token_steps + 1]
+        return key
+
+    def solve(self, state, letter, roll=None, bonus=False, max_depth=6, time_budget=1.0):
+        """
+        Searches a position with iterative deepening until max_depth rolls or time_budget seconds
+        :param state: GameState to search from, only token steps are used
+        :param letter: position of the player due to roll
+        :param roll: the roll already made, to get the best move for it, or None to value the position before rolling
+        :param bonus: True if this roll is a bonus roll after a 6, so a 6 earns no further roll
+        """
+        letters = state.get_letters()
+        steps = [state.get_steps(seat, token) for seat in range(len(letters)) for token in TOKEN_NAMES]
+        if any(token_steps < -1 or token_steps > _FINISH for token_steps in steps):
+            raise ValueError("a token is past the finishing square, the position can't be searched")
+# Table entries are only valid for the seat letters they were searched with
+        if letters != self._letters:
+            self._table.clear()
+        self._letters = letters
+        self._steps = steps
+        self._done = [self._is_done(seat) for seat in range(len(letters))]
+        self._hash = self._hash_tokens(self._steps)
+        seat = letters.index(letter)
+        self._deadline = time.perf_counter() + time_budget
+        self._nodes = 0
+        self._table_hits = 0
+
+        best_move = None
+        values = self._heuristic()
+        depth_done = 0
+        for depth in range(1, max_depth + 1):
+            try:
+                if roll is None:
+                    values = self._chance(depth, seat, bonus)
+                else:
+                    values, best_move = self._decide(depth, seat, bonus, roll)
+            except _Timeout:
+                break
+            depth_done = depth
+        return SolverResult(letters, best_move, values, depth_done, self._nodes, self._table_hits)
+
+    def _is_done(self, seat):
+        """Returns True if both of the seat's tokens have finished"""
+        return self._steps[2 * seat] == _FINISH and self._steps[2 * seat + 1] == _FINISH
+
+    def _next_turn(self, seat, bonus, roll):
+        """Returns (seat, bonus) for the roll after this one, skipping players that are done"""
+        if roll == 6 and not bonus:
+            return seat, True
+        count = len(self._letters)
+        for offset in range(1, count + 1):
+            nxt = (seat + offset) % count
+            if not self._done[nxt]:
+                return nxt, False
+        return seat, False
+
+    def _chance(self, depth, seat, bonus):
+        """Value of the position before seat rolls: the average over the six rolls"""
+        self._nodes += 1
+        if self._nodes & 1023 == 0 and time.perf_counter() > self._deadline:
+            raise _Timeout()
+        key = self._hash ^ self._turn_keys[seat][bonus]
+        entry = self._table.get(key)
+        if entry is not None and entry[0] >= depth:
+            self._table_hits += 1
+            self._table.move_to_end(key)
+            return entry[1]
+        if depth == 0:
+            return self._heuristic()
+
+        values = [0.0] * len(self._letters)
+        for roll in range(1, 7):
+            rolled = self._decide(depth, seat, bonus, roll)[0]
+            for idx, value in enumerate(rolled):
+                values[idx] += value / 6
+        self._store(key, depth, values)
+        return values
+
+    def _decide(self, depth, seat, bonus, roll):
+        """Value of the best move for seat with roll, returns (values, best Move or None if no token can move)"""
+        moves = generate_moves(self._letters, self._steps, seat, roll)
+        nxt_seat, nxt_bonus = self._next_turn(seat, bonus, roll)
+        if len(moves) == 0:
+            return self._chance(depth - 1, nxt_seat, nxt_bonus), None
+
+        best_values = None
+        best_move = None
+        for move in moves:
+            self._make(move)
+            if self._is_done(seat):
+                values = [0.0] * len(self._letters)
+                values[seat] = 1.0
+            else:
+                values = self._chance(depth - 1, nxt_seat, nxt_bonus)
+            self._unmake(move)
+            if best_values is None or values[seat] > best_values[seat]:
+                best_values = values
+                best_move = move
+        return best_values, best_move
+
+    def _make(self, move):
+        """Applies a move to the search position, updating the hash incrementally"""
+        keys = self._token_keys
+        for token in move.tokens:
+            idx = 2 * move.seat + token
+            self._hash ^= keys[move.seat][token][move.from_steps + 1] ^ keys[move.seat][token][move.to_steps + 1]
+            self._steps[idx] = move.to_steps
+        for opp, opp_token, opp_steps in move.kicked:
+            self._hash ^= keys[opp][opp_token][opp_steps + 1] ^ keys[opp][opp_token][0]
+            self._steps[2 * opp + opp_token] = -1
+
+    def _unmake(self, move):
+        """Reverses _make"""
+        keys = self._token_keys
+        for opp, opp_token, opp_steps in move.kicked:
+            self._hash ^= keys[opp][opp_token][opp_steps + 1] ^ keys[opp][opp_token][0]
+            self._steps[2 * opp + opp_token] = opp_steps
+        for token in move.tokens:
+            idx = 2 * move.seat + token
+            self._hash ^= keys[move.seat][token][move.from_steps + 1] ^ keys[move.seat][token][move.to_steps + 1]
+            self._steps[idx] = move.from_steps
+
+    def _store(self, key, depth, values):
+        """Adds a position to the transposition table, evicting the shallowest of the oldest entries when full"""
+        table = self._table
+        if key not in table and len(table) >= self._max_entries:
+            victim = None
+            victim_depth = None
+            for idx, old_key in enumerate(table):
+                if idx == self._evict_window:
+                    break
+                if victim is None or table[old_key][0] < victim_depth:
+                    victim = old_key
+                    victim_depth = table[old_key][0]
+            del table[victim]
+        table[key] = (depth, values)
+        table.move_to_end(key)
+
+    def _heuristic(self):
+        """Leaf value: each seat's share of the total progress of all tokens"""
+        progress = [0.1 + (self._steps[2 * seat] + 1) + (self._steps[2 * seat + 1] + 1)
+                    for seat in range(len(self._letters))]
+        total = sum(progress)
+        return [value / total for value in progress]
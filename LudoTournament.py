@@ -0,0 +1,333 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: Round-robin tournaments between registered TurnPolicy rules. Game number i of a tournament has its seat
+# letters, the policy at each seat and its dice all worked out from the tournament seed and i alone, so any game can be
+# replayed on its own with play_one. Games are played in shards (ranges of game numbers) across worker processes, and
+# each shard keeps constant-size TournamentStats: wins and games per policy, a game length histogram and kick, bounce
+# and error counts. Stats merge by adding them up, so shards written to a shared directory by several machines can be
+# combined in any order with merge_directory, which checks from the file names that they share a seed and that no
+# two of them cover the same games.
+# Run python LudoTournament.py run --policies readme kick_first --games 100000 --dir shards, then
+#     python LudoTournament.py merge --dir shards
+# LudoGame registers readme and kick_first. To add another, subclass TurnPolicy and call register_policy on it at the
+# top level of a module, then import that module here (the CLI only knows the policies registered on import).
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+from LudoGame import BoardTopology, LudoGame, POSITIONS, TurnHook
+
+# Every seat combination play_game accepts, 2 to 4 of the positions in board order
+SEAT_SETUPS = tuple(''.join(combo) for count in range(2, len(POSITIONS) + 1) for combo in combinations(POSITIONS, count))
+# Game lengths are counted in buckets of LENGTH_BUCKET turns, games at max_turns or longer share the last bucket
+LENGTH_BUCKET = 10
+FINISH_STEP = BoardTopology.finish_step
+# Shard files are named shard-<seed>-<first game>-<stop>.json, see shard_path
+SHARD_NAME = re.compile(r'shard-(\d+)-(\d+)-(\d+)\.json')
+
+
+class TournamentStats:
+    """Streaming aggregates for a set of tournament games, their size doesn't grow with the number of games"""
+    def __init__(self, policies, max_turns):
+        self._policies = list(policies)
+        self._max_turns = max_turns
+        self._games = 0
+        self._turns = 0
+        self._kicks = 0
+        self._bounces = 0
+        self._errors = 0
+        self._unfinished = 0
+        self._seats = {name: 0 for name in self._policies}
+        self._wins = {name: 0 for name in self._policies}
+        self._lengths = [0] * (max_turns // LENGTH_BUCKET + 1)
+
+    def add_game(self, seat_policies, winner, turns, kicks, bounces, errors):
+        """
+        Counts one game
+        :param seat_policies: the policy name at each seat
+        :param winner: policy name of the first player to finish, None if nobody finished
+        :param errors: number of turns that raised and were rolled back
+        """
+        self._games += 1
+        self._turns += turns
+        self._kicks += kicks
+        self._bounces += bounces
+        self._errors += errors
+        for name in seat_policies:
+            self._seats[name] += 1
+        if winner is None:
+            self._unfinished += 1
+        else:
+            self._wins[winner] += 1
+        self._lengths[min(turns, self._max_turns) // LENGTH_BUCKET] += 1
+
+    def merge(self, other):
+        """Adds another set of stats for the same policies and max_turns into this one, returns self"""
+        if other._policies != self._policies or other._max_turns != self._max_turns:
+            raise ValueError("only stats for the same policies and max_turns can be merged")
+        self._games += other._games
+        self._turns += other._turns
+        self._kicks += other._kicks
+        self._bounces += other._bounces
+        self._errors += other._errors
+        self._unfinished += other._unfinished
+        for name in self._policies:
+            self._seats[name] += other._seats[name]
+            self._wins[name] += other._wins[name]
+        self._lengths = [mine + theirs for mine, theirs in zip(self._lengths, other._lengths)]
+        return self
+
+    def get_game_count(self):
+        """Returns the number of games counted"""
+        return self._games
+
+    def get_win_rates(self):
+        """Returns {policy: wins / seats played}, a policy's chance of winning any game it sat in"""
+        return {name: self._wins[name] / self._seats[name] if self._seats[name] else 0.0 for name in self._policies}
+
+    def get_length_histogram(self):
+        """Returns {first turn of bucket: games} for the non-empty game length buckets"""
+        return {idx * LENGTH_BUCKET: count for idx, count in enumerate(self._lengths) if count}
+
+    def get_rates(self):
+        """Returns the mean turns per game and the kicks, bounces and errors per game"""
+        games = max(self._games, 1)
+        return {
+            'turns_per_game': self._turns / games,
+            'kicks_per_game': self._kicks / games,
+            'bounces_per_game': self._bounces / games,
+            'errors_per_game': self._errors / games,
+        }
+
+    def to_dict(self):
+        """Returns the stats as a JSON-ready dict"""
+        return {
+            'policies': self._policies,
+            'max_turns': self._max_turns,
+            'games': self._games,
+            'turns': self._turns,
+            'kicks': self._kicks,
+            'bounces': self._bounces,
+            'errors': self._errors,
+            'unfinished': self._unfinished,
+            'seats': self._seats,
+            'wins': self._wins,
+            'lengths': self._lengths,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuilds stats from the output of to_dict"""
+        stats = cls(data['policies'], data['max_turns'])
+        for key in ('games', 'turns', 'kicks', 'bounces', 'errors', 'unfinished', 'seats', 'wins', 'lengths'):
+            setattr(stats, '_' + key, data[key])
+        return stats
+
+
+def game_setup(policies, seed, index):
+    """
+    Returns (seat letters, policy name per seat, random.Random) for game number index. Games cycle through every seat
+    setup, and each pass through them rotates the policies one seat along
+    """
+    letters = SEAT_SETUPS[index % len(SEAT_SETUPS)]
+    shift = index // len(SEAT_SETUPS)
+    seat_policies = [policies[(shift + seat) % len(policies)] for seat in range(len(letters))]
+    return letters, seat_policies, random.Random('%d:%d' % (seed, index))
+
+
+class _BounceCounter(TurnHook):
+    """Counts the token moves of a turn that bounce back off the finishing square"""
+    def __init__(self):
+        self.bounces = 0
+
+    def on_move(self, game, player, token_name, before, after, path, kick, kick_token):
+        """Counts a bounce, see TurnHook"""
+        if path == 'bounce':
+            self.bounces += 1
+
+
+def play_one(policies, seed, index, max_turns=1000):
+    """
+    Plays game number index and returns (letters, seat policies, turns list, winning seat or None, kicks, bounces,
+    errors). Seats roll in order, a 6 earns one bonus roll, and players that are done are skipped. A turn that raises,
+    or pushes a token past the finishing square, is rolled back and counted as an error, the same as a table in
+    LudoServer. The game stops when one player is left or after max_turns turns
+    """
+    letters, seat_policies, rng = game_setup(policies, seed, index)
+    game = LudoGame(policy=seat_policies[0])
+    game.set_players(list(letters))
+    counter = _BounceCounter()
+    game.set_hook(counter)
+    state = game.get_state()
+    undo = []
+    turns = []
+    winner = None
+    kicks = 0
+    bounces = 0
+    errors = 0
+    seat = 0
+    bonus = False
+    while len(turns) < max_turns:
+        roll = rng.randint(1, 6)
+        turns.append((letters[seat], roll))
+        before = [state.get_steps(idx, token) for idx in range(len(letters)) for token in 'pq']
+        game.set_policy(seat_policies[seat])
+        counter.bounces = 0
+        try:
+            game.apply_turn(letters[seat], roll, undo)
+            after = [state.get_steps(idx, token) for idx in range(len(letters)) for token in 'pq']
+# A token past the finishing square would make play_game raise when it names the final spaces
+            if max(after) > FINISH_STEP:
+                raise IndexError("a token moved past the finishing square")
+            bounces += counter.bounces
+        except Exception:
+            game.unmake(undo)
+            errors += 1
+            after = before
+        undo.clear()
+        kicks += sum(1 for idx, (old, new) in enumerate(zip(before, after)) if idx // 2 != seat and new == -1 < old)
+        if winner is None and state.is_done(seat):
+            winner = seat
+
+        done = [state.is_done(idx) for idx in range(len(letters))]
+        if done.count(False) <= 1:
+            break
+        if roll == 6 and not bonus and not done[seat]:
+            bonus = True
+            continue
+        bonus = False
+        seat = (seat + 1) % len(letters)
+        while done[seat]:
+            seat = (seat + 1) % len(letters)
+    return letters, seat_policies, turns, winner, kicks, bounces, errors
+
+
+def run_shard(policies, seed, start, stop, max_turns=1000):
+    """Plays games start up to stop and returns their TournamentStats"""
+    stats = TournamentStats(policies, max_turns)
+    for index in range(start, stop):
+        letters, seat_policies, turns, winner, kicks, bounces, errors = play_one(policies, seed, index, max_turns)
+        stats.add_game(seat_policies, None if winner is None else seat_policies[winner], len(turns), kicks, bounces,
+                       errors)
+    return stats
+
+
+def shard_path(directory, seed, start, stop):
+    """Returns the file a shard's stats are saved to"""
+    return os.path.join(directory, 'shard-%d-%012d-%012d.json' % (seed, start, stop))
+
+
+def _run_and_save(policies, seed, start, stop, max_turns, directory):
+    """Worker process entry point: plays a shard, saves it if a directory is given and returns its stats as a dict"""
+    data = run_shard(policies, seed, start, stop, max_turns).to_dict()
+    if directory is not None:
+        path = shard_path(directory, seed, start, stop)
+        with open(path + '.tmp', 'w') as out:
+            json.dump(data, out)
+# The rename makes the shard appear whole, so a reader on another machine never sees half a file
+        os.replace(path + '.tmp', path)
+    return data
+
+
+def run_tournament(policies, games, seed=0, shard_size=10000, workers=None, directory=None, first=0, max_turns=1000):
+    """
+    Plays games first up to first + games in shards of shard_size across worker processes and returns the merged
+    TournamentStats. With a directory, each shard is saved there as it finishes and shards already saved are loaded
+    instead of played, so an interrupted run picks up where it stopped and machines can split the game range
+    :param policies: names of registered TurnPolicy rules, at least one. Register them when a module is imported so
+    worker processes have them too
+    :param workers: number of processes, None for one per CPU
+    """
+    policies = list(policies)
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+    total = TournamentStats(policies, max_turns)
+    pending = []
+    for start in range(first, first + games, shard_size):
+        stop = min(start + shard_size, first + games)
+        if directory is not None and os.path.exists(shard_path(directory, seed, start, stop)):
+            total.merge(load_shard(shard_path(directory, seed, start, stop)))
+        else:
+            pending.append((start, stop))
+    if pending:
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [pool.submit(_run_and_save, policies, seed, start, stop, max_turns, directory)
+                       for start, stop in pending]
+            for future in futures:
+                total.merge(TournamentStats.from_dict(future.result()))
+    return total
+
+
+def load_shard(path):
+    """Loads the TournamentStats saved for one shard"""
+    with open(path) as raw:
+        return TournamentStats.from_dict(json.load(raw))
+
+
+def merge_directory(directory):
+    """
+    Merges every shard saved in a directory and returns the TournamentStats, None if there are no shards. The seed
+    and game range of each shard are read from its file name, and shards of different seeds or with overlapping game
+    ranges raise ValueError rather than being counted together
+    """
+    shards = []
+    for entry in os.listdir(directory):
+        match = SHARD_NAME.fullmatch(entry)
+        if match is not None:
+            shards.append((int(match.group(2)), int(match.group(3)), int(match.group(1)), entry))
+    shards.sort()
+
+    total = None
+    for idx, (start, stop, seed, entry) in enumerate(shards):
+        if seed != shards[0][2]:
+            raise ValueError("shards of seeds %d and %d can't be merged: %s" % (shards[0][2], seed, entry))
+        if idx > 0 and start < shards[idx - 1][1]:
+            raise ValueError("shard %s overlaps shard %s" % (entry, shards[idx - 1][3]))
+        stats = load_shard(os.path.join(directory, entry))
+        total = stats if total is None else total.merge(stats)
+    return total
+
+
+def print_stats(stats):
+    """Prints a tournament summary"""
+    print('%d games' % stats.get_game_count())
+    for name, rate in sorted(stats.get_win_rates().items(), key=lambda item: -item[1]):
+        print('  %-16s win rate %.4f' % (name, rate))
+    print('  ' + ', '.join('%s %.3f' % item for item in stats.get_rates().items()))
+
+
+def main(argv=None):
+    """Command line entry point: run plays (part of) a tournament, merge combines the shards saved in a directory"""
+    parser = argparse.ArgumentParser(description='Round-robin Ludo policy tournaments')
+    parser.add_argument('mode', choices=('run', 'merge'))
+    parser.add_argument('--policies', nargs='*', default=['readme'], help='run: registered policy names')
+    parser.add_argument('--games', type=int, default=10000, help='run: number of games')
+    parser.add_argument('--first', type=int, default=0, help='run: number of the first game, to split a tournament')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--shard-size', type=int, default=10000)
+    parser.add_argument('--workers', type=int, help='run: worker processes, default one per CPU')
+    parser.add_argument('--max-turns', type=int, default=1000)
+    parser.add_argument('--dir', help='directory the shards are saved to and merged from')
+    args = parser.parse_args(argv)
+
+    if args.mode == 'merge':
+        stats = merge_directory(args.dir)
+        if stats is None:
+            print('no shards in ' + args.dir)
+            return 1
+    else:
+        stats = run_tournament(args.policies, args.games, args.seed, args.shard_size, args.workers, args.dir,
+                               args.first, args.max_turns)
+    print_stats(stats)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
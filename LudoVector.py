@@ -0,0 +1,365 @@
+# Author: John Brown
+# GitHub username: brown_science
+# Date 10/17/2026
+# Description: NumPy lockstep simulator for Ludo. VectorLudo keeps N games with the same seats as arrays of token
+# steps, position markers and done flags, and applies one roll per game per step with array operations. It follows
+# LudoGame.apply_turn rule for rule, including the games where apply_turn raises, so its results match play_game.
+
+import numpy as np
+
+from LudoGame import BOARD_TOPOLOGY, BoardTopology, DONE_OFFSET, MARK_OFFSET, SEAT_WIDTH, STR_MARK, seat_letters
+
+# Error codes for games that stopped because apply_turn (or play_game's final naming) raises for them
+NO_ERROR = 0
+ERROR_TYPES = {1: TypeError, 2: ValueError, 3: IndexError, 4: AttributeError}
+_TYPE_ERROR, _VALUE_ERROR, _INDEX_ERROR, _ATTRIBUTE_ERROR = 1, 2, 3, 4
+
+# Marks are 0 - 122, so this never matches one
+_NO_TARGET = -1000
+_FINISH = BoardTopology.finish_step
+_LAST_BOARD = BoardTopology.last_board_step
+_HOME_MARK = 0
+_READY_MARK = 1
+_END_MARK = STR_MARK + 1 + _FINISH
+
+
+class VectorLudo:
+    """
+    N games with the same seats advanced in lockstep. Token steps are kept in an (N, seats, 2) int8 array, position
+    markers (see LudoGame.pos_to_mark) in an (N, seats, 2) uint8 array and done flags in an (N, seats) bool array. A
+    game that hits one of the cases where apply_turn raises is frozen and its error recorded, unless step is asked to
+    roll the turn back
+    """
+    def __init__(self, players, n_games):
+        """
+        :param players: List of players min:2 max:4  A, B, C, or D, each position at most once
+        :param n_games: number of games to advance together
+        """
+        letters = seat_letters(players)
+        if len(set(letters)) != len(letters):
+            raise ValueError("VectorLudo needs distinct positions, got " + letters)
+        self._letters = letters
+        self._seat_count = len(letters)
+        self._steps = np.full((n_games, self._seat_count, 2), -1, dtype=np.int8)
+        self._marks = np.zeros((n_games, self._seat_count, 2), dtype=np.uint8)
+        self._done = np.zeros((n_games, self._seat_count), dtype=bool)
+        self._error = np.zeros(n_games, dtype=np.int8)
+        self._error_turn = np.full(n_games, -1, dtype=np.int64)
+        self._turn = 0
+
+# _squares[seat, steps + 1] is the board square for those steps, -1 off the main track
+        self._squares = np.full((self._seat_count, _FINISH + 2), -1, dtype=np.int16)
+        for seat, letter in enumerate(letters):
+            topology = BOARD_TOPOLOGY[letter]
+            for steps in range(-1, _FINISH + 1):
+                square = topology.square(steps)
+                if square is not None:
+                    self._squares[seat, steps + 1] = square
+
+    @classmethod
+    def from_state(cls, state, n_games):
+        """Returns a VectorLudo with n_games copies of a GameState, e.g. to play random continuations of a game"""
+        vector = cls(state.get_letters(), n_games)
+        seat_bytes = np.frombuffer(state.to_bytes()[state.get_seat_count():], dtype=np.uint8)
+        seat_bytes = seat_bytes.reshape(state.get_seat_count(), SEAT_WIDTH)
+        vector._steps[:] = seat_bytes[:, 0:2].astype(np.int16) - 1
+        vector._marks[:] = seat_bytes[:, MARK_OFFSET:MARK_OFFSET + 2]
+        vector._done[:] = seat_bytes[:, DONE_OFFSET] == 1
+        return vector
+
+    def get_letters(self):
+        """Returns the string of seat letters"""
+        return self._letters
+
+    def get_game_count(self):
+        """Returns the number of games"""
+        return len(self._error)
+
+    def get_steps(self):
+        """Returns the (N, seats, 2) array of token steps, p then q"""
+        return self._steps
+
+    def get_done(self):
+        """Returns the (N, seats) array of done flags"""
+        return self._done
+
+    def get_errors(self):
+        """Returns the per game error codes (see ERROR_TYPES) and the turn each error happened on"""
+        return self._error, self._error_turn
+
+    def seat_indexes(self, turn_letters):
+        """Maps an array of position letters to seat indexes, -2 for a letter with no seat (apply_turn raises)"""
+        turn_letters = np.asarray(turn_letters)
+        seats = np.full(turn_letters.shape, -2, dtype=np.int8)
+        for seat, letter in enumerate(self._letters):
+            seats[turn_letters == letter] = seat
+        return seats
+
+    def step(self, seats, rolls, rollback=False):
+        """
+        Applies one roll to every game
+        :param seats: seat index rolling in each game, -1 for a game with no turn this step, -2 for a letter with no seat
+        :param rolls: roll for each game, 1 - 6
+        :param rollback: if True a game whose turn raises is put back as it was before the turn and keeps playing, the
+        same as a table in LudoServer, instead of being frozen. Returns the bool array of games rolled back, else None
+        """
+        seats = np.asarray(seats)
+        rolls = np.asarray(rolls)
+        if np.any((seats >= 0) & ((rolls < 1) | (rolls > 6))):
+            raise ValueError("VectorLudo only plays rolls of 1 - 6")
+
+        playing = self._error == NO_ERROR
+        if rollback:
+# A kick changes the opponent's row too, so whole games are saved
+            saved = self._steps.copy(), self._marks.copy(), self._done.copy()
+
+        missing = (seats == -2) & playing
+        self._fail(np.nonzero(missing)[0], _ATTRIBUTE_ERROR)
+
+        games = np.nonzero((seats >= 0) & playing)[0]
+        if len(games) != 0:
+            self._step_games(games, seats[games].astype(np.intp), rolls[games].astype(np.int16))
+        self._turn += 1
+        if not rollback:
+            return None
+        raised = playing & (self._error != NO_ERROR)
+        self._steps[raised], self._marks[raised], self._done[raised] = (array[raised] for array in saved)
+        self._error[raised] = NO_ERROR
+        self._error_turn[raised] = -1
+        return raised
+
+    def play(self, seats, rolls):
+        """Applies a whole (N, turns) array of seats and rolls, one column per step, -1 seats padding short games"""
+        for col in range(seats.shape[1]):
+            self.step(seats[:, col], rolls[:, col])
+
+    def play_turns(self, turns_lists):
+        """Plays a list of turns lists, one per game, each a list of ('A', 6) style tuples"""
+        length = max([len(turns) for turns in turns_lists] + [0])
+        seats = np.full((len(turns_lists), length), -1, dtype=np.int8)
+        rolls = np.ones((len(turns_lists), length), dtype=np.int16)
+        for idx, turns in enumerate(turns_lists):
+            if len(turns) != 0:
+                letters, game_rolls = zip(*turns)
+                seats[idx, :len(turns)] = self.seat_indexes(np.array(letters))
+                rolls[idx, :len(turns)] = game_rolls
+        self.play(seats, rolls)
+
+    def results(self, return_exceptions=False):
+        """
+        Returns a play_game style list of space names for each game. A game that raised gets its exception raised, or
+        put in its place with return_exceptions=True
+        """
+# Naming a token pushed past the finishing square raises IndexError in play_game too
+        over = (self._error == NO_ERROR) & np.any(self._steps > _FINISH, axis=(1, 2))
+        self._fail(np.nonzero(over)[0], _INDEX_ERROR)
+
+        topologies = [BOARD_TOPOLOGY[letter] for letter in self._letters]
+        out = []
+        for game in range(len(self._error)):
+            code = self._error[game]
+            if code != NO_ERROR:
+                error = ERROR_TYPES[code]("game " + str(game) + " raised on turn " + str(self._error_turn[game]))
+                if not return_exceptions:
+                    raise error
+                out.append(error)
+                continue
+            pos_list = []
+            for seat, topology in enumerate(topologies):
+                pos_list.append(topology.space_name(int(self._steps[game, seat, 0])))
+                pos_list.append(topology.space_name(int(self._steps[game, seat, 1])))
+            out.append(pos_list)
+        return out
+
+    def _fail(self, games, code):
+        """Freezes the given games with an error code, keeping the first error of each"""
+        games = games[self._error[games] == NO_ERROR]
+        self._error[games] = code
+        self._error_turn[games] = self._turn
+
+    def _step_games(self, games, seats, rolls):
+        """Runs apply_turn for one roll in each of the given games, all of which have a turn"""
+        count = len(games)
+        rows = np.arange(count)
+        st = self._steps[games, seats].astype(np.int16)
+        mk = self._marks[games, seats].astype(np.int16)
+        failed = np.zeros(count, dtype=np.int8)
+        ready = self._squares[seats, rolls + 1]
+        ps, qs, pm, qm = st[:, 0].copy(), st[:, 1].copy(), mk[:, 0].copy(), mk[:, 1].copy()
+
+# Kick targets, as position markers, mirroring LudoGame._kick_targets
+        p_vs_p, p_vs_q1, p_vs_q2 = self._kick_targets(pm, rolls, ready)
+        q_vs_p, q_vs_q1, q_vs_q2 = self._kick_targets(qm, rolls, ready)
+
+# First opponent in seat order with a p (q) token on a target, which of our tokens lands there and its marker
+        p_seat = np.full(count, -1, dtype=np.intp)
+        p_token = np.zeros(count, dtype=np.intp)
+        p_mark = np.zeros(count, dtype=np.int16)
+        q_seat = np.full(count, -1, dtype=np.intp)
+        q_token = np.zeros(count, dtype=np.intp)
+        q_mark = np.zeros(count, dtype=np.int16)
+        for opp in range(self._seat_count):
+            opp_p = self._marks[games, opp, 0].astype(np.int16)
+            opp_q = self._marks[games, opp, 1].astype(np.int16)
+            by_p = opp_p == p_vs_p
+            hit = (seats != opp) & (p_seat < 0) & (by_p | (opp_p == q_vs_p))
+            p_seat[hit] = opp
+            p_token[hit] = np.where(by_p[hit], 0, 1)
+            p_mark[hit] = opp_p[hit]
+            by_p = (opp_q == p_vs_q1) | (opp_q == p_vs_q2)
+            hit = (seats != opp) & (q_seat < 0) & (by_p | (opp_q == q_vs_q1) | (opp_q == q_vs_q2))
+            q_seat[hit] = opp
+            q_token[hit] = np.where(by_p[hit], 0, 1)
+            q_mark[hit] = opp_q[hit]
+
+# Picks the branch of the priority cascade each game takes
+        no_kick = (p_seat < 0) & (q_seat < 0)
+        on_track = ((ps >= 0) & (ps < _FINISH)) | ((qs >= 0) & (qs < _FINISH))
+        conditions = [
+            (rolls == 6) & (pm == _HOME_MARK),
+            (rolls == 6) & (pm != _HOME_MARK) & (qm == _HOME_MARK),
+            (pm == _READY_MARK) & no_kick,
+            (qm == _READY_MARK) & no_kick,
+            on_track & (ps + rolls == _FINISH),
+            on_track & (qs + rolls == _FINISH),
+            on_track & (p_seat >= 0),
+            on_track & (q_seat >= 0),
+            on_track & (ps > qs) & (qm != _HOME_MARK) & (qs < _FINISH),
+            on_track & (ps < qs) & (ps < _FINISH),
+            on_track & (pm == qm),
+        ]
+        branch = np.select(conditions, list(range(1, len(conditions) + 1)), default=12)
+# Stacked tokens are compared with > 0, which raises for space name markers
+        stacked = branch == 11
+        failed[stacked & (qm >= STR_MARK)] = _TYPE_ERROR
+        branch[stacked & (qm < STR_MARK) & (qm < 2)] = 12
+        branch[failed != 0] = 0
+        same_spot = (pm == qm) & (qm != _HOME_MARK)
+
+        token = np.zeros(count, dtype=np.intp)
+        ctx = (games, seats, rolls, st, mk)
+
+        sel = rows[branch == 1]
+        self._move(ctx, sel, token[sel])
+        mk[sel, 0] = _READY_MARK
+        sel = rows[branch == 2]
+        self._move(ctx, sel, token[sel] + 1)
+        mk[sel, 1] = _READY_MARK
+        sel = rows[branch == 3]
+        self._move(ctx, sel, token[sel])
+        mk[sel, 0] = ready[sel] + 1
+        sel = rows[branch == 4]
+        self._move(ctx, sel, token[sel] + 1)
+        mk[sel, 1] = ready[sel] + 1
+
+# Priority 2: move a token to the end space
+        for which, branch_id in ((0, 5), (1, 6)):
+            sel = rows[branch == branch_id]
+            self._move(ctx, sel, token[sel] + which)
+            self._set_name_mark(ctx, sel, which, which, failed)
+            finished = sel[(mk[sel, 0] == _END_MARK) & (mk[sel, 1] == _END_MARK) & (failed[sel] == 0)]
+            self._done[games[finished], seats[finished]] = True
+
+# Priority 3: kick an opponent's p token, then an opponent's q token
+        sel = rows[branch == 7]
+        self._move(ctx, sel, p_token[sel], p_seat[sel], p_mark[sel])
+        self._set_board_mark(ctx, sel, 0, 0, failed)
+        sel = sel[same_spot[sel] & (failed[sel] == 0)]
+        self._move(ctx, sel, 1 - p_token[sel])
+        self._set_board_mark(ctx, sel, 1, 1, failed)
+
+        sel = rows[branch == 8]
+        self._move(ctx, sel, q_token[sel], q_seat[sel], q_mark[sel])
+        self._set_name_mark(ctx, sel, 1, 1, failed)
+        sel = sel[same_spot[sel] & (failed[sel] == 0)]
+        self._move(ctx, sel, 1 - q_token[sel])
+        self._set_name_mark(ctx, sel, 0, 0, failed)
+
+# Priority 4: move the token furthest from the finishing square
+        sel = rows[branch == 9]
+        moving = sel[mk[sel, 1] != _END_MARK]
+        self._move(ctx, moving, token[moving] + 1)
+        self._set_space_mark(ctx, sel, 1, 1, failed)
+        sel = rows[branch == 10]
+        moving = sel[mk[sel, 0] != _END_MARK]
+        self._move(ctx, moving, token[moving])
+        self._set_space_mark(ctx, sel, 0, 0, failed)
+
+        sel = rows[branch == 11]
+        self._move(ctx, sel, token[sel])
+        self._move(ctx, sel, token[sel] + 1)
+        self._set_space_mark(ctx, sel, 0, 0, failed)
+        self._set_space_mark(ctx, sel, 1, 0, failed)
+
+        sel = rows[branch == 12]
+        sel = sel[(st[sel, 0] < _FINISH) & (mk[sel, 0] != _END_MARK)]
+        self._move(ctx, sel, token[sel])
+        self._set_space_mark(ctx, sel, 0, 0, failed)
+
+        ok = failed == 0
+        self._steps[games[ok], seats[ok]] = st[ok]
+        self._marks[games[ok], seats[ok]] = mk[ok]
+        for code in ERROR_TYPES:
+            self._fail(games[failed == code], code)
+
+    @staticmethod
+    def _kick_targets(mark, rolls, ready):
+        """Returns the target marker checked against p tokens and the two checked against q tokens for one token"""
+        is_int = mark < STR_MARK
+        landing = mark + rolls
+        in_range = is_int & (landing - 1 <= BoardTopology.track_length)
+        at_ready = mark == _READY_MARK
+        vs_p = np.where(in_range & (mark >= 2), landing, np.where(at_ready, ready + 1, _NO_TARGET))
+        vs_q1 = np.where(in_range, landing, _NO_TARGET)
+        vs_q2 = np.where(at_ready, ready + 1, _NO_TARGET)
+        return vs_p, vs_q1, vs_q2
+
+    def _move(self, ctx, sel, token, kick_seat=None, kick_mark=None):
+        """LudoGame.move_token for token (0 for p, 1 for q) of the rolling seat in the selected rows"""
+        if len(sel) == 0:
+            return
+        games, seats, rolls, st, mk = ctx
+        roll = rolls[sel]
+        cur = st[sel, token]
+        from_yard = mk[sel, token] == _HOME_MARK
+        new = np.where(cur <= _LAST_BOARD, cur + roll, np.where(cur + roll <= _FINISH, cur + roll,
+                       np.where(token == 0, 2 * _FINISH - cur - roll, cur)))
+
+        if kick_seat is not None:
+            new = np.where(from_yard, new, cur + roll)
+            kicking = ~from_yard
+            kick_games = games[sel[kicking]]
+            kick_marks = kick_mark[kicking]
+            movers = seats[sel[kicking]]
+            for opp in range(self._seat_count):
+                for opp_token in (0, 1):
+                    hit = (movers != opp) & (self._marks[kick_games, opp, opp_token] == kick_marks)
+                    self._marks[kick_games[hit], opp, opp_token] = _HOME_MARK
+                    self._steps[kick_games[hit], opp, opp_token] = -1
+
+        st[sel, token] = np.where(from_yard, cur + 1, new)
+
+    def _set_board_mark(self, ctx, sel, which, from_token, failed):
+        """Sets token which's marker to the board square of from_token's steps, failing where that isn't a square"""
+        games, seats, rolls, st, mk = ctx
+        steps = st[sel, from_token]
+        failed[sel[steps > _FINISH]] = _INDEX_ERROR
+        bad = (steps <= _FINISH) & ((steps < 1) | (steps > _LAST_BOARD))
+        failed[sel[bad]] = _VALUE_ERROR
+        good = (steps >= 1) & (steps <= _LAST_BOARD)
+        mk[sel[good], which] = self._squares[seats[sel[good]], steps[good] + 1] + 1
+
+    def _set_name_mark(self, ctx, sel, which, from_token, failed):
+        """Sets token which's marker to the space name of from_token's steps, failing past the finishing square"""
+        games, seats, rolls, st, mk = ctx
+        steps = st[sel, from_token]
+        failed[sel[steps > _FINISH]] = _INDEX_ERROR
+        good = steps <= _FINISH
+        mk[sel[good], which] = STR_MARK + 1 + steps[good]
+
+    def _set_space_mark(self, ctx, sel, which, from_token, failed):
+        """Board square marker on the main track, space name marker anywhere else, as the priority 4 moves do"""
+        steps = ctx[3][sel, from_token]
+        on_board = (steps > 0) & (steps <= _LAST_BOARD)
+        self._set_board_mark(ctx, sel[on_board], which, from_token, failed)
+        self._set_name_mark(ctx, sel[~on_board], which, from_token, failed)